@@ -78,27 +78,19 @@ class EzQt_App(QMainWindow):
 
         # ////// KERNEL LOADER
         # ///////////////////////////////////////////////////////////////
+        # Usually started with the EzApplication; fonts load meanwhile
+        Kernel.startPreload()
         Kernel.loadFontsResources()
+        Kernel.awaitPreload()
         Kernel.loadAppSettings()
 
         # ////// LOAD TRANSLATIONS
         # ///////////////////////////////////////////////////////////////
         from .kernel.translation import get_translation_manager
 
-        # Load language from settings
-        try:
-            # Try to load settings_panel from app.yaml
-            app_config = Kernel.loadKernelConfig("app")
-            if "settings_panel" in app_config:
-                settings_panel = app_config["settings_panel"]
-                language = settings_panel.get("language", {}).get("default", "English")
-            else:
-                language = "English"
-            translation_manager = get_translation_manager()
-            translation_manager.load_language(language)
-        except Exception:
-            translation_manager = get_translation_manager()
-            translation_manager.load_language("English")
+        # Load language from settings (validated by loadAppSettings)
+        translation_manager = get_translation_manager()
+        translation_manager.load_language(Kernel.getAppSettings().language)
 
         # ////// INITIALIZE COMPONENTS
         # ///////////////////////////////////////////////////////////////
@@ -145,24 +137,10 @@ class EzQt_App(QMainWindow):
         # ///////////////////////////////////////////////////////////////
         self._themeFileName = themeFileName
         UIFunctions.theme(self, self._themeFileName)
+        UIFunctions.watchTheme(self, self._themeFileName)
         # //////
-        # Load theme from settings_panel if it exists, otherwise from app
-        try:
-            # Try to load settings_panel from app.yaml
-            app_config = Kernel.loadKernelConfig("app")
-            if "settings_panel" in app_config:
-                settings_panel = app_config["settings_panel"]
-                _theme = settings_panel.get("theme", {}).get("default", "dark")
-            else:
-                # Fallback to default value
-                _theme = "dark"
-            # Force conversion to lowercase
-            _theme = _theme.lower()
-        except Exception:
-            # Fallback to default value
-            _theme = "dark"
-
-        # Update Settings.Gui.THEME with lowercase value
+        # Theme resolved from settings_panel, then app, by loadAppSettings
+        _theme = Kernel.getAppSettings().theme
         Settings.Gui.THEME = _theme
 
         theme_toggle = self.ui.settingsPanel.get_theme_toggle_button()
@@ -223,14 +201,24 @@ class EzQt_App(QMainWindow):
             # Force immediate update
             self.updateUI()
 
+    # SET COMPONENT THEME
+    # ///////////////////////////////////////////////////////////////
+    def setComponentTheme(self, component: str, stylesheet: str = None) -> bool:
+        # Restyles the component only ("header", "menu", "pages", ...)
+        return UIFunctions.componentTheme(self, component, stylesheet)
+
     # UPDATE UI
     # ///////////////////////////////////////////////////////////////
     def updateUI(self) -> None:
         theme_toggle = self.ui.settingsPanel.get_theme_toggle_button()
-        if theme_toggle and hasattr(theme_toggle, "get_value_option"):
-            # New OptionSelector version handles positioning automatically
-            # No need for manual move_selector
-            pass
+        if theme_toggle and hasattr(theme_toggle, "value_id"):
+            # Follow Settings.Gui.THEME (e.g. edited on disk) without
+            # reporting it as a user choice
+            theme_id = 0 if Settings.Gui.THEME == "light" else 1
+            if theme_toggle.value_id != theme_id:
+                blocked = theme_toggle.blockSignals(True)
+                theme_toggle.value_id = theme_id
+                theme_toggle.blockSignals(blocked)
 
         # //////
         UIFunctions.theme(self, self._themeFileName)
@@ -240,14 +228,6 @@ class EzQt_App(QMainWindow):
         self.ui.menuContainer.update_all_theme_icons()
         self.ui.settingsPanel.update_all_theme_icons()
 
-        # //////
-        QApplication.processEvents()
-
-        # Force refresh of all widgets
-        for widget in QApplication.instance().allWidgets():
-            widget.style().unpolish(widget)
-            widget.style().polish(widget)
-
     # SET APP ICON
     # ///////////////////////////////////////////////////////////////
     def setAppIcon(
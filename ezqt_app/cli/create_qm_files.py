@@ -7,7 +7,6 @@
 import xml.etree.ElementTree as ET
 import struct
 import hashlib
-import pkg_resources
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
@@ -16,6 +15,7 @@ import pkg_resources
 # ///////////////////////////////////////////////////////////////
 from ..kernel.common import Path
 from ..kernel.app_functions.printer import get_printer
+from ..kernel.app_functions.package_resources import get_package_locator
 from ezqt_app.kernel.translation.helpers import extract_translations_from_ts
 
 # TYPE HINTS IMPROVEMENTS FOR PYSIDE6 6.9.1
@@ -99,14 +99,7 @@ def main():
     # Priority 1: Look in user project (bin/translations)
     current_project_translations = Path.cwd() / "bin" / "translations"
     # Priority 2: Look in installed package
-    try:
-        package_translations = Path(
-            pkg_resources.resource_filename("ezqt_app", "resources/translations")
-        )
-    except:
-        package_translations = (
-            Path(__file__).parent.parent / "resources" / "translations"
-        )
+    package_translations = get_package_locator().path("resources/translations")
 
     # Choose translations directory
     if current_project_translations.exists():
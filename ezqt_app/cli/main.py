@@ -9,10 +9,9 @@ Command-line interface for EzQt_App framework utilities.
 import sys
 import click
 from pathlib import Path
-import pkg_resources
 from colorama import Fore, Style
 
-from ezqt_app.kernel.app_functions import FileMaker
+from ezqt_app.kernel.app_functions import FileMaker, get_package_resource
 from .runner import ProjectRunner
 
 
@@ -34,7 +33,17 @@ def cli():
     "--verbose", "-v", is_flag=True, help="Verbose output with detailed information"
 )
 @click.option("--no-main", is_flag=True, help="Skip main.py generation")
-def init(force, verbose, no_main):
+@click.option(
+    "--optimize-qss",
+    is_flag=True,
+    help="Minify themes and prune selectors of unused object names",
+)
+@click.option(
+    "--keep",
+    multiple=True,
+    help="Object name never pruned by --optimize-qss (repeatable)",
+)
+def init(force, verbose, no_main, optimize_qss, keep):
     """
     🚀 Initialize a new EzQt_App project
 
@@ -54,17 +63,26 @@ def init(force, verbose, no_main):
             click.echo("📦 Generating assets...")
 
         maker.make_assets_binaries()
+
+        # Themes rendered once per palette, loaded as is at runtime
+        if any((Path.cwd() / "bin" / "themes").glob("*.qss")):
+            maker.render_themes()
+        else:
+            maker.make_qss_from_package()
+
+        if optimize_qss:
+            # Rule counts and parse times are reported by the FileMaker
+            if maker.optimize_qss(keep=keep):
+                click.echo("✅ QSS themes optimized")
+
+        # Resources last, to include the generated themes
         maker.make_qrc()
         maker.make_rc_py()
         maker.make_app_resources_module()
 
         # Generate main.py example
         if not no_main:
-            template_path = Path(
-                pkg_resources.resource_filename(
-                    "ezqt_app", "resources/templates/main.py.template"
-                )
-            )
+            template_path = get_package_resource("resources/templates/main.py.template")
 
             if template_path.exists():
                 main_py = Path.cwd() / "main.py"
@@ -273,9 +291,9 @@ def info():
 
         # Check dependencies
         try:
-            import yaml
+            from ezqt_app.kernel.app_functions.yaml_backend import get_yaml_backend
 
-            click.echo("PyYaml: Available")
+            click.echo(f"PyYaml: Available (backend: {get_yaml_backend()})")
         except ImportError:
             click.echo("PyYaml: Not installed")
 
@@ -27,8 +27,21 @@ from .config_manager import (
     get_package_resource,
     get_package_resource_content,
 )
+from .yaml_backend import get_yaml_backend, set_yaml_backend
+from .atomic_write import DurabilityMode
+from .resource_resolver import ResourceResolver, get_resource_resolver
+from .package_resources import PackageResourceLocator, get_package_locator
+from .qss_template import QssTemplate, get_qss_template, render_qss
+from .qss_optimizer import minify_qss, optimize_qss, prune_qss
+from .stylesheet_cache import StylesheetCache, get_stylesheet_cache
+from .pixmap_cache import PixmapCache, get_pixmap_cache
 from .resource_manager import ResourceManager
 from .settings_manager import SettingsManager
+from .settings_model import (
+    AppSettingsModel,
+    SettingsValidationError,
+    get_app_settings_model,
+)
 
 # Classe principale qui combine tous les managers
 from .kernel import Kernel
@@ -57,6 +70,14 @@ __all__ = [
     "AssetsManager",
     "ResourceManager",
     "SettingsManager",
+    "AppSettingsModel",
+    "SettingsValidationError",
+    "ResourceResolver",
+    "PackageResourceLocator",
+    "QssTemplate",
+    "StylesheetCache",
+    "PixmapCache",
+    "DurabilityMode",
     "FileMaker",
     "APP_PATH",
     "Kernel",
@@ -67,6 +88,18 @@ __all__ = [
     "save_config",
     "get_package_resource",
     "get_package_resource_content",
+    "get_yaml_backend",
+    "set_yaml_backend",
+    "get_resource_resolver",
+    "get_package_locator",
+    "get_qss_template",
+    "minify_qss",
+    "optimize_qss",
+    "prune_qss",
+    "render_qss",
+    "get_stylesheet_cache",
+    "get_pixmap_cache",
+    "get_app_settings_model",
     # Helpers
     "load_config_section",
     "save_config_section",
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Atomic File Writes for EzQt_App
+===============================
+
+Crash-safe replacement of configuration files. Content is written to a
+temporary file in the target directory, optionally flushed to stable
+storage, then moved over the target with ``os.replace``. A crash at any
+point leaves either the old or the new file, never a truncated one.
+
+Durability modes:
+
+- ``fast``: no fsync. Survives application crashes, not power loss.
+- ``durable``: fsync of the file before the rename and of the directory
+  after it. Survives power loss at the cost of disk latency.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import os
+import threading
+import time
+from collections import deque
+from enum import Enum
+from pathlib import Path
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, Union
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Number of recent write latencies kept for percentiles
+LATENCY_HISTORY = 256
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class DurabilityMode(Enum):
+    """Durability guarantees of configuration writes."""
+
+    FAST = "fast"
+    DURABLE = "durable"
+
+
+class WriteLatencyStats:
+    """Latency record of atomic writes."""
+
+    def __init__(self, history: int = LATENCY_HISTORY) -> None:
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=history)
+        self._count = 0
+        self._errors = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._last_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Record the latency of a successful write."""
+        with self._lock:
+            self._latencies.append(latency_ms)
+            self._count += 1
+            self._total_ms += latency_ms
+            self._max_ms = max(self._max_ms, latency_ms)
+            self._last_ms = latency_ms
+
+    def record_error(self) -> None:
+        """Record a failed write."""
+        with self._lock:
+            self._errors += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return write latency statistics.
+
+        Returns
+        -------
+        Dict[str, Any]
+            count, errors, last_ms, mean_ms, max_ms and p95_ms (over the
+            most recent writes).
+        """
+        with self._lock:
+            recent = sorted(self._latencies)
+            p95 = (
+                recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+            )
+            return {
+                "count": self._count,
+                "errors": self._errors,
+                "last_ms": self._last_ms,
+                "mean_ms": self._total_ms / self._count if self._count else 0.0,
+                "max_ms": self._max_ms,
+                "p95_ms": p95,
+            }
+
+    def reset(self) -> None:
+        """Reset every statistic."""
+        with self._lock:
+            self._latencies.clear()
+            self._count = 0
+            self._errors = 0
+            self._total_ms = 0.0
+            self._max_ms = 0.0
+            self._last_ms = 0.0
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def atomic_write(
+    path: Path,
+    content: Union[str, bytes],
+    mode: DurabilityMode = DurabilityMode.FAST,
+    encoding: str = "utf-8",
+) -> float:
+    """
+    Atomically replace a file with new content.
+
+    Parameters
+    ----------
+    path : Path
+        Target file. Its directory must exist.
+    content : str or bytes
+        New file content.
+    mode : DurabilityMode, optional
+        Durability of the write (default: FAST).
+    encoding : str, optional
+        Encoding used when ``content`` is a string.
+
+    Returns
+    -------
+    float
+        Write latency in milliseconds.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be written. The target is left untouched and
+        the temporary file is removed.
+    """
+    path = Path(path)
+    data = content.encode(encoding) if isinstance(content, str) else content
+    suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+    tmp_path = path.with_name(f".{path.name}.{suffix}")
+    durable = DurabilityMode(mode) is DurabilityMode.DURABLE
+
+    start = time.perf_counter()
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    if durable:
+        _fsync_directory(path.parent)
+    return (time.perf_counter() - start) * 1000
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory (POSIX only)."""
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
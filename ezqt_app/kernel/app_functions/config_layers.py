@@ -0,0 +1,573 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Configuration Layers for EzQt_App
+=================================
+
+Layered resolution of configuration files. Each layer overrides the
+keys of the layers below it; mappings are merged recursively, any other
+value (lists included) is replaced as a whole.
+
+Layers, lowest priority first:
+
+1. ``package``: ``ezqt_app/resources/config/<name>.yaml``
+2. ``project``: ``<project>/bin/config/<name>.yaml``
+3. ``user``: ``~/.ezqt_app/config/<project>-<hash>/<name>.yaml``, one
+   directory per application (see ``get_user_config_dir``)
+4. ``env``: ``EZQT_APP__<NAME>__<KEY>__<SUBKEY>=<yaml value>``; keys are
+   matched to the keys of the lower layers regardless of case
+
+Every layer is parsed once and the merged result of a configuration is
+memoized as an immutable snapshot. Invalidating a layer only drops that
+layer and the snapshots built from it.
+
+Files are parsed outside of the stack lock, so several configurations
+can be loaded concurrently (see preloader).
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+from .resource_resolver import (
+    CONFIG,
+    PACKAGE_SCOPE,
+    PROJECT_SCOPE,
+    ResourceResolver,
+)
+from .yaml_backend import safe_load
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+LAYER_PACKAGE = "package"
+LAYER_PROJECT = "project"
+LAYER_USER = "user"
+LAYER_ENV = "env"
+
+# Lowest priority first
+LAYERS = (LAYER_PACKAGE, LAYER_PROJECT, LAYER_USER, LAYER_ENV)
+
+ENV_PREFIX = "EZQT_APP__"
+# Parent of the per-application user directories
+USER_CONFIG_ROOT = Path.home() / ".ezqt_app" / "config"
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class FrozenConfig(dict):
+    """Read-only mapping used for memoized configuration snapshots."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("configuration snapshots are read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (FrozenConfig, (dict(self),))
+
+    def __copy__(self) -> "FrozenConfig":
+        return self
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        # Deep copies are meant to be edited
+        return thaw(self)
+
+
+class ConfigLayerStack:
+    """
+    Per-layer cache and memoized merge of configuration files.
+
+    Parameters
+    ----------
+    resolver : ResourceResolver
+        Locates the package and project files.
+    loader : Callable[[Path], Any]
+        Parses a configuration file (e.g., through the snapshot cache).
+    """
+
+    def __init__(
+        self, resolver: ResourceResolver, loader: Callable[[Path], Any]
+    ) -> None:
+        self._resolver = resolver
+        self._loader = loader
+        self._user_dir: Optional[Path] = None
+        self._environ: Optional[Mapping[str, str]] = None
+        self._lock = threading.RLock()
+        # (config name, layer) -> (file or None, parsed data or None)
+        self._layers: Dict[Tuple[str, str], Tuple[Optional[Path], Any]] = {}
+        self._env_layers: Optional[Dict[str, Dict[str, Any]]] = None
+        self._effective: Dict[str, Optional[FrozenConfig]] = {}
+        # Bumped by every invalidation: results computed before are dropped
+        self._generation = 0
+        self._stats: Dict[str, int] = {"hits": 0, "merges": 0, "layer_loads": 0}
+
+    # SOURCES
+    # ///////////////////////////////////////////////////////////////
+
+    def set_user_dir(self, user_dir: Optional[Path]) -> None:
+        """
+        Set the directory of per-user overrides.
+
+        Parameters
+        ----------
+        user_dir : Path, optional
+            Directory holding ``<name>.yaml`` files (None disables the
+            user layer).
+        """
+        with self._lock:
+            self._user_dir = Path(user_dir) if user_dir else None
+            self.invalidate(layer=LAYER_USER)
+
+    def set_environment(self, environ: Optional[Mapping[str, str]]) -> None:
+        """
+        Set the variables of the environment layer.
+
+        Parameters
+        ----------
+        environ : Mapping[str, str], optional
+            Variables to read (default: ``os.environ``, read again now).
+        """
+        with self._lock:
+            self._environ = environ
+            self.invalidate(layer=LAYER_ENV)
+
+    def get_sources(self, config_name: str) -> List[Tuple[str, Path]]:
+        """
+        Return the existing files of a configuration, lowest layer first.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+
+        Returns
+        -------
+        List[Tuple[str, Path]]
+            (layer, file) pairs.
+        """
+        sources = []
+        for layer in LAYERS[:-1]:
+            path = self._get_layer(config_name, layer)[0]
+            if path is not None:
+                sources.append((layer, path))
+        return sources
+
+    # EFFECTIVE VIEW
+    # ///////////////////////////////////////////////////////////////
+
+    def effective(self, config_name: str) -> Optional[FrozenConfig]:
+        """
+        Return the merged configuration, memoized until a layer changes.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+
+        Returns
+        -------
+        FrozenConfig, optional
+            Read-only merged configuration, or None if no layer defines it.
+        """
+        with self._lock:
+            if config_name in self._effective:
+                self._stats["hits"] += 1
+                return self._effective[config_name]
+            generation = self._generation
+
+        merged = self.merge(config_name)
+        snapshot = freeze(merged) if merged is not None else None
+        with self._lock:
+            if generation == self._generation:
+                snapshot = self._effective.setdefault(config_name, snapshot)
+        return snapshot
+
+    def merge(
+        self, config_name: str, exclude: Tuple[str, ...] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Merge the layers of a configuration into a new mutable tree.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+        exclude : Tuple[str, ...], optional
+            Layers left out of the merge.
+
+        Returns
+        -------
+        Dict[str, Any], optional
+            Merged configuration, or None if no layer defines it.
+        """
+        with self._lock:
+            self._stats["merges"] += 1
+
+        merged = None
+        for layer in LAYERS:
+            if layer in exclude:
+                continue
+            data = self._get_layer(config_name, layer)[1]
+            if data is None:
+                continue
+            if not isinstance(data, dict):
+                get_printer().warning(
+                    f"Ignoring {layer} layer of '{config_name}': not a mapping"
+                )
+                continue
+            if layer == LAYER_ENV and merged is not None:
+                # Variable names don't carry the case of the keys
+                data = match_key_case(data, merged)
+            merged = deep_merge(merged or {}, data)
+        return merged
+
+    def invalidate(
+        self, config_name: Optional[str] = None, layer: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached layers and the snapshots built from them.
+
+        Parameters
+        ----------
+        config_name : str, optional
+            Only drop layers of this configuration (default: all).
+        layer : str, optional
+            Only drop this layer (default: all layers).
+        """
+        with self._lock:
+            self._generation += 1
+            for key in list(self._layers):
+                if (config_name is None or key[0] == config_name) and (
+                    layer is None or key[1] == layer
+                ):
+                    del self._layers[key]
+            if layer in (None, LAYER_ENV) and config_name is None:
+                self._env_layers = None
+            if config_name is None:
+                self._effective.clear()
+            else:
+                self._effective.pop(config_name, None)
+
+    def invalidate_file(self, config_name: str, path: Path) -> bool:
+        """
+        Drop the layer of a configuration read from ``path``.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+        path : Path
+            File that changed.
+
+        Returns
+        -------
+        bool
+            True if a cached layer was read from this file.
+        """
+        path = Path(path)
+        with self._lock:
+            for layer in LAYERS[:-1]:
+                entry = self._layers.get((config_name, layer))
+                if entry is not None and entry[0] == path:
+                    self.invalidate(config_name, layer)
+                    return True
+        return False
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return merge and memoization statistics."""
+        stats = dict(self._stats)
+        stats["layers"] = len(self._layers)
+        stats["snapshots"] = len(self._effective)
+        return stats
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_layer(self, config_name: str, layer: str) -> Tuple[Optional[Path], Any]:
+        key = (config_name, layer)
+        with self._lock:
+            entry = self._layers.get(key)
+            if entry is not None:
+                return entry
+            if layer == LAYER_ENV:
+                entry = (None, self._get_env_layers().get(config_name))
+                self._layers[key] = entry
+                return entry
+            generation = self._generation
+
+        # Parse without holding the lock; drop the result if invalidated
+        entry = self._load_file_layer(config_name, layer)
+        with self._lock:
+            if generation == self._generation:
+                entry = self._layers.setdefault(key, entry)
+        return entry
+
+    def _find_file(self, config_name: str, layer: str) -> Optional[Path]:
+        file_name = f"{config_name}.yaml"
+        if layer == LAYER_USER:
+            if self._user_dir is None:
+                return None
+            path = self._user_dir / file_name
+            return path if path.is_file() else None
+        scope = PACKAGE_SCOPE if layer == LAYER_PACKAGE else PROJECT_SCOPE
+        return self._resolver.resolve(CONFIG, file_name, scope)
+
+    def _load_file_layer(
+        self, config_name: str, layer: str
+    ) -> Tuple[Optional[Path], Any]:
+        path = self._find_file(config_name, layer)
+        if path is None:
+            return (None, None)
+
+        with self._lock:
+            self._stats["layer_loads"] += 1
+        try:
+            try:
+                return (path, self._loader(path))
+            except FileNotFoundError:
+                # Memoized location disappeared, probe the search roots again
+                self._resolver.invalidate(CONFIG)
+                path = self._find_file(config_name, layer)
+                if path is None:
+                    return (None, None)
+                return (path, self._loader(path))
+        except Exception as e:
+            get_printer().error(f"Error loading '{config_name}' from {path}: {e}")
+            return (path, None)
+
+    def _get_env_layers(self) -> Dict[str, Dict[str, Any]]:
+        if self._env_layers is None:
+            environ = self._environ if self._environ is not None else os.environ
+            self._env_layers = parse_environment(environ)
+        return self._env_layers
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def deep_merge(base: Dict[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Merge ``override`` into a copy of ``base``.
+
+    Mappings present on both sides are merged recursively; any other
+    value of ``override`` replaces the one of ``base``. Neither argument
+    is modified and the result shares no container with ``override``.
+
+    Parameters
+    ----------
+    base : Dict[str, Any]
+        Lower priority configuration.
+    override : Mapping[str, Any]
+        Higher priority configuration.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Merged configuration.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = deep_merge(current, value)
+        else:
+            merged[key] = thaw(value)
+    return merged
+
+
+def diff_against(data: Any, base: Any) -> Dict[str, Any]:
+    """
+    Return the part of ``data`` that differs from ``base``.
+
+    Merging the result over ``base`` gives back every key of ``data``.
+    Keys of ``base`` missing from ``data`` cannot be expressed and are
+    ignored.
+
+    Parameters
+    ----------
+    data : Any
+        Desired configuration.
+    base : Any
+        Configuration provided by the other layers.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Overrides needed on top of ``base``.
+    """
+    if not isinstance(data, dict):
+        return {}
+    if not isinstance(base, dict):
+        return thaw(data)
+
+    delta: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key not in base:
+            delta[key] = thaw(value)
+        elif isinstance(value, dict) and isinstance(base[key], dict):
+            nested = diff_against(value, base[key])
+            if nested:
+                delta[key] = nested
+        elif thaw(value) != thaw(base[key]):
+            # Thawed: a frozen list (tuple) equals its mutable form
+            delta[key] = thaw(value)
+    return delta
+
+
+def match_key_case(data: Mapping[str, Any], base: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Rename the keys of ``data`` after the keys of ``base`` they match.
+
+    A key missing from ``base`` takes the case of a ``base`` key equal to
+    it when both are lowercased, so ``app_Width`` targets ``app_width``
+    and ``themeColor`` targets ``themeColor``.
+
+    Parameters
+    ----------
+    data : Mapping[str, Any]
+        Overrides with lowercase keys (e.g., the environment layer).
+    base : Mapping[str, Any]
+        Configuration provided by the lower layers.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Overrides with the keys of ``base``.
+    """
+    keys = {str(key).lower(): key for key in base}
+    matched: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key not in base:
+            key = keys.get(str(key).lower(), key)
+        current = base.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            value = match_key_case(value, current)
+        matched[key] = value
+    return matched
+
+
+def get_user_config_dir(project_root: Optional[Path]) -> Optional[Path]:
+    """
+    Return the directory of per-user overrides of an application.
+
+    Applications are told apart by their project root: the directory is
+    named after it and a hash of its absolute path, so two applications
+    never share overrides. Moving the project starts a new directory.
+
+    Parameters
+    ----------
+    project_root : Path, optional
+        Project root of the application.
+
+    Returns
+    -------
+    Path, optional
+        ``USER_CONFIG_ROOT/<project>-<hash>``, None without a project.
+    """
+    if project_root is None:
+        return None
+    root = Path(project_root).resolve()
+    digest = hashlib.blake2b(str(root).encode("utf-8"), digest_size=4).hexdigest()
+    name = re.sub(r"[^\w.-]+", "_", root.name) or "project"
+    return USER_CONFIG_ROOT / f"{name}-{digest}"
+
+
+def parse_environment(environ: Mapping[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the environment layer of every configuration.
+
+    ``EZQT_APP__APP__APP__THEME=light`` sets ``app.theme`` of the "app"
+    configuration. Names are lowercased here and matched to mixed-case
+    keys when merged (see ``match_key_case``); values are parsed as YAML
+    scalars, so ``1280`` is an integer and ``true`` a boolean.
+
+    Parameters
+    ----------
+    environ : Mapping[str, str]
+        Environment variables.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        {config name: overrides}
+    """
+    layers: Dict[str, Dict[str, Any]] = {}
+    for variable, raw_value in environ.items():
+        if not variable.upper().startswith(ENV_PREFIX):
+            continue
+        parts = [part.lower() for part in variable[len(ENV_PREFIX) :].split("__")]
+        if len(parts) < 2 or not all(parts):
+            continue
+        try:
+            value = safe_load(raw_value) if raw_value.strip() else raw_value
+        except Exception:
+            value = raw_value
+        if isinstance(value, (dict, list)):
+            value = raw_value
+
+        current = layers.setdefault(parts[0], {})
+        for key in parts[1:-1]:
+            if not isinstance(current.get(key), dict):
+                current[key] = {}
+            current = current[key]
+        current[parts[-1]] = value
+    return layers
+
+
+def freeze(data: Any) -> Any:
+    """Return a read-only copy of a configuration tree."""
+    if isinstance(data, FrozenConfig):
+        return data
+    if isinstance(data, dict):
+        return FrozenConfig((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def thaw(data: Any) -> Any:
+    """Return a mutable copy of a configuration tree."""
+    if isinstance(data, dict):
+        return {key: thaw(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [thaw(value) for value in data]
+    return data
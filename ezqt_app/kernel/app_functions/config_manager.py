@@ -24,15 +24,34 @@
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
-import os
-import yaml
+import copy
+import functools
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Sequence, Tuple
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from ..common import APP_PATH
 from .printer import get_printer
+from .package_resources import get_package_locator
+from .config_snapshot import ConfigSnapshotCache
+from .yaml_backend import safe_load, safe_dump
+from .resource_resolver import CONFIG, ResourceResolver, get_resource_resolver
+from .config_writer import ConfigWriteQueue
+from .yaml_patcher import HAS_RUAMEL, ROUND_TRIP_MAX_SIZE, YamlPatcher
+from .atomic_write import DurabilityMode, WriteLatencyStats, atomic_write
+from .config_layers import (
+    LAYER_ENV,
+    LAYER_PACKAGE,
+    LAYER_PROJECT,
+    LAYER_USER,
+    ConfigLayerStack,
+    FrozenConfig,
+    deep_merge,
+    diff_against,
+    freeze,
+    get_user_config_dir,
+)
 
 ## ==> GLOBALS
 # ///////////////////////////////////////////////////////////////
@@ -40,21 +59,132 @@ from .printer import get_printer
 ## ==> VARIABLES
 # ///////////////////////////////////////////////////////////////
 
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def flatten_config(data: Any, prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten a nested configuration into dotted key paths.
+
+    Intermediate mappings are indexed too, so that "app" and "app.name"
+    are both single lookups.
+
+    Parameters
+    ----------
+    data : Any
+        Configuration tree.
+    prefix : str, optional
+        Key path of ``data`` itself.
+
+    Returns
+    -------
+    Dict[str, Any]
+        {"app.settings_panel.theme.default": value, ...}
+    """
+    index: Dict[str, Any] = {}
+    if not isinstance(data, dict):
+        return index
+
+    stack = [(prefix, data)]
+    while stack:
+        base, node = stack.pop()
+        for key, value in node.items():
+            path = f"{base}.{key}" if base else str(key)
+            index[path] = value
+            if isinstance(value, dict):
+                stack.append((path, value))
+    return index
+
+
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class ConfigAccessor:
+    """
+    Precompiled accessor to a single configuration value.
+
+    Hot code can keep an accessor instead of calling get_config_value
+    with a dotted string every time; each read is a single dict lookup
+    in the flattened index of the configuration.
+    """
+
+    __slots__ = ("_manager", "_config_name", "_key_path", "_default")
+
+    def __init__(
+        self, manager: "ConfigManager", config_name: str, key_path: str, default=None
+    ):
+        self._manager = manager
+        self._config_name = config_name
+        self._key_path = key_path
+        self._default = default
+
+    @property
+    def key_path(self) -> str:
+        """Return the dotted key path of the accessor"""
+        return self._key_path
+
+    def get(self) -> Any:
+        """Return the current value, or the accessor default"""
+        index = self._manager._flat_index.get(self._config_name)
+        if index is None:
+            index = self._manager.get_flat_index(self._config_name)
+        return index.get(self._key_path, self._default)
+
+    __call__ = get
+
+    def __repr__(self) -> str:
+        return f"ConfigAccessor({self._config_name!r}, {self._key_path!r})"
+
+
 class ConfigManager:
-    """Modular configuration manager for EzQt_App"""
+    """
+    Modular configuration manager for EzQt_App.
 
-    def __init__(self):
+    Safe for concurrent readers and a single writer at a time. Cached
+    configurations and their flat indexes are copy-on-write: writers
+    (serialized by a lock) build new dictionaries and publish them with a
+    single assignment, so readers never lock and never observe a
+    half-applied update. A published dictionary must not be mutated.
+    """
+
+    def __init__(self, resolver: Optional[ResourceResolver] = None):
+        self._resolver = resolver or ResourceResolver()
+        self._lock = threading.RLock()
         self._config_cache: Dict[str, Any] = {}
         self._config_files: Dict[str, Path] = {}
+        self._flat_index: Dict[str, Dict[str, Any]] = {}
         self._project_root: Optional[Path] = None
+        self._snapshots = ConfigSnapshotCache(self._get_snapshot_dir())
+        self._write_queue: Optional[ConfigWriteQueue] = None
+        self._watcher = None
+        self._hot_reload = True
+        self._durability = DurabilityMode.FAST
+        self._write_stats = WriteLatencyStats()
+        self._patcher: Optional[YamlPatcher] = None
+        # True once set_user_config_dir chose the user directory
+        self._user_dir_set = False
+        # The loader must not reference the manager (no reference cycle)
+        self._layers = ConfigLayerStack(
+            self._resolver, functools.partial(self._snapshots.load, parser=safe_load)
+        )
 
     def set_project_root(self, project_root: Path):
         """Set the project root directory"""
-        self._project_root = project_root
+        with self._lock:
+            self._project_root = project_root
+            self._resolver.set_project_root(project_root)
+            if not self._user_dir_set:
+                # Per-user overrides are kept per application
+                self._layers.set_user_dir(get_user_config_dir(project_root))
+            self._layers.invalidate()
+            self._snapshots.set_cache_dir(self._get_snapshot_dir())
+
+    def _get_snapshot_dir(self) -> Path:
+        """Return the directory holding parsed-config snapshots"""
+        base = Path(self._project_root) if self._project_root else Path.cwd()
+        return base / "bin" / "config" / ".cache"
 
     def get_config_paths(self, config_name: str) -> List[Path]:
         """
@@ -70,34 +200,19 @@ class ConfigManager:
         List[Path]
             List of possible paths in priority order
         """
-        config_file = f"{config_name}.yaml"
-
-        paths = []
-
-        # 1. Child project (bin/config/)
-        if self._project_root:
-            project_config = self._project_root / "bin" / "config" / config_file
-            paths.append(project_config)
-
-        # 2. Current directory (bin/config/)
-        current_config = Path.cwd() / "bin" / "config" / config_file
-        paths.append(current_config)
-
-        # 3. Package (resources/config/) - from current directory
-        package_config = Path.cwd() / "ezqt_app" / "resources" / "config" / config_file
-        paths.append(package_config)
-
-        # 4. Package (resources/config/) - from APP_PATH
-        package_config_app = APP_PATH / "resources" / "config" / config_file
-        paths.append(package_config_app)
-
-        return paths
+        return self._resolver.candidates(CONFIG, f"{config_name}.yaml")
 
     def load_config(
         self, config_name: str, force_reload: bool = False
     ) -> Dict[str, Any]:
         """
-        Load a configuration from the appropriate file.
+        Load a configuration, merging all of its layers.
+
+        Package defaults are overridden by the project file, then by the
+        per-user file, then by environment variables (see config_layers).
+        The returned configuration is a read-only snapshot (FrozenConfig,
+        lists as tuples) shared with every reader: ``set_value_in_memory``
+        publishes a new one and ``copy.deepcopy`` returns an editable copy.
 
         Parameters
         ----------
@@ -109,38 +224,78 @@ class ConfigManager:
         Returns
         -------
         Dict[str, Any]
-            Loaded configuration
+            Loaded configuration (read-only)
         """
         # Check cache
-        if not force_reload and config_name in self._config_cache:
-            return self._config_cache[config_name]
-
-        # Get possible paths
-        config_paths = self.get_config_paths(config_name)
-
-        # Find the first existing file
-        config_file = None
-        for path in config_paths:
-            if path.exists():
-                config_file = path
-                break
-
-        if not config_file:
-            get_printer().warning(f"No configuration file found for '{config_name}'")
-            get_printer().verbose_msg(f"Searched paths: {config_paths}")
-            return {}
+        if not force_reload:
+            config = self._config_cache.get(config_name)
+            if config is not None:
+                return config
+
+        with self._lock:
+            if force_reload:
+                self._layers.invalidate(config_name)
+            else:
+                # Another thread may have loaded it meanwhile
+                config = self._config_cache.get(config_name)
+                if config is not None:
+                    return config
+            return self._build_config(config_name)
+
+    def reload_config(
+        self, config_name: str, changed_file: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        Rebuild a configuration after one of its files changed.
 
-        # Load configuration
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+        changed_file : Path, optional
+            File that changed: only its layer is parsed again (default:
+            every layer)
+
+        Returns
+        -------
+        Dict[str, Any]
+            Reloaded configuration
+        """
+        with self._lock:
+            if changed_file is None or not self._layers.invalidate_file(
+                config_name, changed_file
+            ):
+                self._layers.invalidate(config_name)
+            return self._build_config(config_name)
+
+    def _build_config(self, config_name: str) -> Dict[str, Any]:
+        """Cache the effective configuration (lock held)"""
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+            effective = self._layers.effective(config_name)
+            if effective is None:
+                get_printer().warning(
+                    f"No configuration file found for '{config_name}'"
+                )
+                get_printer().verbose_msg(
+                    f"Searched paths: {self.get_config_paths(config_name)}"
+                )
+                return {}
+
+            # Already read-only: every reader can share it
+            config_data = effective
+            sources = self._layers.get_sources(config_name)
 
-            # Cache
+            # Cache (index first: a published config always has its index)
+            self._flat_index[config_name] = flatten_config(config_data)
             self._config_cache[config_name] = config_data
-            self._config_files[config_name] = config_file
+            if sources:
+                self._config_files[config_name] = sources[-1][1]
+            for _, config_file in sources:
+                self._watch(config_name, config_file)
 
             get_printer().verbose_msg(
-                f"Configuration '{config_name}' loaded from: {config_file}"
+                f"Configuration '{config_name}' loaded from: "
+                + ", ".join(f"{path} ({layer})" for layer, path in sources)
             )
 
             return config_data
@@ -149,6 +304,66 @@ class ConfigManager:
             get_printer().error(f"Error loading '{config_name}': {e}")
             return {}
 
+    def get_effective_config(self, config_name: str) -> Optional[FrozenConfig]:
+        """
+        Return the read-only merge of the layers of a configuration.
+
+        The snapshot is computed once and shared until one of its layers
+        changes. In-memory updates not yet written are not part of it.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+
+        Returns
+        -------
+        FrozenConfig, optional
+            Merged configuration, or None if no layer defines it
+        """
+        return self._layers.effective(config_name)
+
+    def get_config_layers(self, config_name: str) -> List[Tuple[str, Path]]:
+        """
+        Return the files a configuration is merged from.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+
+        Returns
+        -------
+        List[Tuple[str, Path]]
+            (layer, file) pairs, lowest priority first
+        """
+        return self._layers.get_sources(config_name)
+
+    def set_user_config_dir(self, user_dir: Optional[Path]) -> None:
+        """
+        Set the directory of per-user overrides (None disables them).
+
+        By default it is derived from the project root (see
+        ``get_user_config_dir``).
+        """
+        self._user_dir_set = True
+        self._layers.set_user_dir(user_dir)
+
+    def refresh_environment(self, environ=None) -> None:
+        """
+        Read the environment layer again.
+
+        Parameters
+        ----------
+        environ : Mapping[str, str], optional
+            Variables to use instead of ``os.environ``
+        """
+        self._layers.set_environment(environ)
+
+    def get_layer_stats(self) -> Dict[str, int]:
+        """Return merge and memoization statistics of the config layers"""
+        return self._layers.get_stats()
+
     def get_config_value(
         self, config_name: str, key_path: str, default: Any = None
     ) -> Any:
@@ -169,19 +384,56 @@ class ConfigManager:
         Any
             Found value or default value
         """
-        config = self.load_config(config_name)
+        index = self._flat_index.get(config_name)
+        if index is None:
+            index = self.get_flat_index(config_name)
+        return index.get(key_path, default)
 
-        # Navigate structure
-        keys = key_path.split(".")
-        current = config
+    def get_flat_index(self, config_name: str) -> Dict[str, Any]:
+        """
+        Return the flattened key-path index of a configuration.
 
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
 
-        return current
+        Returns
+        -------
+        Dict[str, Any]
+            {"dotted.key.path": value} for every node of the configuration
+            (read-only snapshot, replaced on every update)
+        """
+        index = self._flat_index.get(config_name)
+        if index is None:
+            config = self.load_config(config_name)
+            index = self._flat_index.get(config_name)
+            if index is None:
+                # Configuration not found: index it without caching it
+                index = flatten_config(config)
+        return index
+
+    def accessor(
+        self, config_name: str, key_path: str, default: Any = None
+    ) -> ConfigAccessor:
+        """
+        Return a precompiled accessor to a configuration value.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+        key_path : str
+            Key path (e.g., "app.name")
+        default : Any
+            Value returned when the key doesn't exist
+
+        Returns
+        -------
+        ConfigAccessor
+            Callable returning the current value
+        """
+        return ConfigAccessor(self, config_name, key_path, default)
 
     def save_config(self, config_name: str, config_data: Dict[str, Any]) -> bool:
         """
@@ -192,40 +444,362 @@ class ConfigManager:
         config_name : str
             Configuration file name
         config_data : Dict[str, Any]
-            Data to save
+            Data to save (copied, later edits are not cached)
 
         Returns
         -------
         bool
             True if save successful
         """
+        if not self.write_config_file(config_name, config_data):
+            return False
+
+        # Cache a read-only copy: the caller keeps editing its own data
+        config = freeze(config_data)
+        with self._lock:
+            self._flat_index[config_name] = flatten_config(config)
+            self._config_cache[config_name] = config
+        return True
+
+    def write_config_file(self, config_name: str, config_data: Dict[str, Any]) -> bool:
+        """
+        Atomically write a configuration to the project file.
+
+        The project file keeps the keys it already set, plus the keys of
+        ``config_data`` that differ from the merged configuration, which
+        keeps project files small. Values coming from the user and
+        environment layers are never copied into the project file.
+        The data is dumped to a temporary file in the same directory which
+        then replaces the target, so a crash never leaves a truncated file.
+        In durable mode the file and its directory are fsynced as well.
+        The in-memory cache is not modified.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+        config_data : Dict[str, Any]
+            Data to write
+
+        Returns
+        -------
+        bool
+            True if write successful
+        """
         if not self._project_root:
             get_printer().error("No project root defined")
             return False
 
         # Create config directory if it doesn't exist
-        config_dir = self._project_root / "bin" / "config"
+        config_dir = Path(self._project_root) / "bin" / "config"
         config_dir.mkdir(parents=True, exist_ok=True)
 
         config_file = config_dir / f"{config_name}.yaml"
 
         try:
-            with open(config_file, "w", encoding="utf-8") as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+            project = self._layers.merge(
+                config_name, exclude=(LAYER_PACKAGE, LAYER_USER, LAYER_ENV)
+            )
+            changes = diff_against(config_data, self._layers.merge(config_name))
+            overrides = deep_merge(project or {}, changes)
+            latency_ms = atomic_write(
+                config_file, safe_dump(overrides), self._durability
+            )
+        except Exception as e:
+            self._write_stats.record_error()
+            get_printer().error(f"Error saving '{config_name}': {e}")
+            return False
 
-            # Update cache
-            self._config_cache[config_name] = config_data
-            self._config_files[config_name] = config_file
+        # The whole document was replaced: drop its round-trip document
+        if self._patcher is not None:
+            self._patcher.discard(config_file)
+        self._after_write(config_name, config_file, latency_ms)
+        return True
 
-            get_printer().verbose_msg(
-                f"Configuration '{config_name}' saved: {config_file}"
-            )
-            return True
+    def patch_config_file(
+        self, config_name: str, updates: Dict[Sequence[str], Any]
+    ) -> bool:
+        """
+        Write key updates to the project file, preserving its formatting.
+
+        Only the updated nodes of the round-trip document change: comments,
+        key order and quoting of the rest of the file are kept, and updates
+        of existing keys only rewrite their own lines. Files larger than
+        ``ROUND_TRIP_MAX_SIZE`` are dumped again instead, like without
+        ruamel.yaml: parsing them round-trip takes seconds. When the
+        project file doesn't exist yet, it is created with the updated
+        keys only; the other layers still provide every other value.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+        updates : Dict[Sequence[str], Any]
+            New values, keyed by key path (e.g., ("app", "theme"))
+
+        Returns
+        -------
+        bool
+            True if write successful
+        """
+        if not self._project_root:
+            get_printer().error("No project root defined")
+            return False
 
+        config_dir = Path(self._project_root) / "bin" / "config"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        config_file = config_dir / f"{config_name}.yaml"
+
+        patcher = self.get_patcher()
+        if patcher is None or self._is_too_large(config_file):
+            # Without ruamel.yaml, or when parsing the file round-trip
+            # would take longer than dumping it, the file is dumped again
+            # Only the branches holding updates are copied
+            config = dict(self.load_config(config_name))
+            for key_path, value in updates.items():
+                current = config
+                for key in key_path[:-1]:
+                    child = current.get(key)
+                    current[key] = dict(child) if isinstance(child, dict) else {}
+                    current = current[key]
+                current[key_path[-1]] = copy.deepcopy(value)
+            return self.write_config_file(config_name, config)
+
+        try:
+            text = patcher.render(config_file, updates)
+            latency_ms = atomic_write(config_file, text, self._durability)
+            patcher.commit(config_file)
         except Exception as e:
+            patcher.discard(config_file)
+            self._write_stats.record_error()
             get_printer().error(f"Error saving '{config_name}': {e}")
             return False
 
+        self._after_write(config_name, config_file, latency_ms)
+        return True
+
+    @staticmethod
+    def _is_too_large(config_file: Path) -> bool:
+        """Return True if a file is too large to be patched round-trip"""
+        try:
+            return config_file.stat().st_size > ROUND_TRIP_MAX_SIZE
+        except OSError:
+            return False
+
+    def get_patcher(self) -> Optional[YamlPatcher]:
+        """Return the round-trip patch engine (None without ruamel.yaml)"""
+        if self._patcher is None and HAS_RUAMEL:
+            self._patcher = YamlPatcher()
+        return self._patcher
+
+    def _after_write(
+        self, config_name: str, config_file: Path, latency_ms: float
+    ) -> None:
+        """Update bookkeeping after a configuration file was written"""
+        self._write_stats.record(latency_ms)
+        with self._lock:
+            self._config_files[config_name] = config_file
+
+            # The project file now takes priority over any resolved
+            # fallback; the working copy already holds the written values
+            self._resolver.invalidate(CONFIG)
+            self._layers.invalidate(config_name, LAYER_PROJECT)
+
+        # Our own write must not be reported as an external edit
+        if self._watcher is not None:
+            self._watcher.note_write(config_file)
+        self._watch(config_name, config_file)
+
+        get_printer().verbose_msg(
+            f"Configuration '{config_name}' saved: {config_file} "
+            f"({self._durability.value}, {latency_ms:.2f} ms)"
+        )
+
+    def set_durability(self, mode) -> None:
+        """
+        Select the durability of configuration writes.
+
+        Parameters
+        ----------
+        mode : DurabilityMode or str
+            "fast" (no fsync) or "durable" (fsync file and directory)
+        """
+        try:
+            self._durability = DurabilityMode(mode)
+        except ValueError:
+            get_printer().warning(f"Unknown durability mode '{mode}', using 'fast'")
+            self._durability = DurabilityMode.FAST
+
+    def get_durability(self) -> DurabilityMode:
+        """Return the durability of configuration writes"""
+        return self._durability
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Return latency statistics of configuration writes"""
+        stats = self._write_stats.get_stats()
+        stats["durability"] = self._durability.value
+        return stats
+
+    def set_value_in_memory(
+        self, config_name: str, key_path: Sequence[str], value: Any
+    ) -> None:
+        """
+        Set a value in the cached configuration without writing it.
+
+        The dictionaries along the key path and the flat index are copied
+        and read-only copies published, so concurrent readers see either
+        the old or the new configuration.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+        key_path : Sequence[str]
+            Keys leading to the value (missing levels are created)
+        value : Any
+            Value to set
+        """
+        with self._lock:
+            config = self._config_cache.get(config_name)
+            if config is None:
+                config = self.load_config(config_name)
+                if not isinstance(config, dict):
+                    config = {}
+
+            index = self._flat_index.get(config_name)
+            index = dict(index) if index is not None else flatten_config(config)
+
+            # Copy the path from the root to the updated value
+            root = dict(config)
+            current = root
+            path = ""
+            for key in key_path[:-1]:
+                path = f"{path}.{key}" if path else str(key)
+                child = current.get(key)
+                if isinstance(child, dict):
+                    child = dict(child)
+                else:
+                    self._drop_index_subtree(index, path)
+                    child = {}
+                current[key] = child
+                current = child
+
+            path = ".".join(str(key) for key in key_path)
+            if isinstance(current.get(key_path[-1]), dict):
+                self._drop_index_subtree(index, path)
+            value = freeze(value)
+            current[key_path[-1]] = value
+            if isinstance(value, dict):
+                index.update(flatten_config(value, path))
+
+            # Only the copies are frozen, the rest is shared
+            root = freeze(root)
+            node, path = root, ""
+            for key in key_path:
+                path = f"{path}.{key}" if path else str(key)
+                node = node[key]
+                index[path] = node
+
+            # Publish
+            self._flat_index[config_name] = index
+            self._config_cache[config_name] = root
+
+    @staticmethod
+    def _drop_index_subtree(index: Dict[str, Any], path: str) -> None:
+        """Remove the index entries below a key path"""
+        prefix = f"{path}."
+        for key in [k for k in index if k.startswith(prefix)]:
+            del index[key]
+
+    def get_write_queue(self) -> ConfigWriteQueue:
+        """Return the write-behind queue used by Kernel.writeYamlConfig"""
+        if self._write_queue is None:
+            self._write_queue = ConfigWriteQueue(self)
+        return self._write_queue
+
+    # ////// HOT RELOAD
+    # ///////////////////////////////////////////////////////////////
+
+    def get_watcher(self):
+        """
+        Return the watcher reloading edited configuration files.
+
+        Returns
+        -------
+        ConfigWatcher, optional
+            None when hot reload is disabled or no Qt application runs.
+        """
+        # The watcher must live in the GUI thread. Worker threads are not
+        # checked through Qt, which would adopt them as QThreads.
+        if (
+            self._watcher is None
+            and self._hot_reload
+            and threading.current_thread() is threading.main_thread()
+        ):
+            try:
+                from PySide6.QtCore import QCoreApplication
+
+                if QCoreApplication.instance() is not None:
+                    from .config_watcher import ConfigWatcher
+
+                    self._watcher = ConfigWatcher(self)
+                    for name, config_file in self._config_files.items():
+                        self._watcher.watch(name, config_file)
+            except Exception as e:
+                get_printer().verbose_msg(f"Config hot reload unavailable: {e}")
+        return self._watcher
+
+    def set_hot_reload_enabled(self, enabled: bool) -> None:
+        """Enable or disable watching of loaded configuration files"""
+        self._hot_reload = enabled
+        if not enabled and self._watcher is not None:
+            self._watcher.deleteLater()
+            self._watcher = None
+
+    def subscribe(
+        self, config_name: str, key_prefix: str, callback: Callable[[str, Any], None]
+    ) -> bool:
+        """
+        Call ``callback(key_path, value)`` when an edited file changes a key.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration file name
+        key_prefix : str
+            Only keys below this prefix are reported (empty: every key)
+        callback : Callable[[str, Any], None]
+            Function called with the changed key path and its new value
+
+        Returns
+        -------
+        bool
+            True if hot reload is available
+        """
+        watcher = self.get_watcher()
+        if watcher is None:
+            return False
+        watcher.subscribe(config_name, key_prefix, callback)
+        return True
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """
+        Remove every subscription of a callback.
+
+        Parameters
+        ----------
+        callback : Callable[[str, Any], None]
+            Function given to ``subscribe``
+        """
+        if self._watcher is not None:
+            self._watcher.unsubscribe(callback)
+
+    def _watch(self, config_name: str, config_file: Path) -> None:
+        """Watch a configuration file when hot reload is available"""
+        watcher = self._watcher if self._watcher is not None else self.get_watcher()
+        if watcher is not None:
+            watcher.watch(config_name, config_file)
+
     def copy_package_configs_to_project(self) -> bool:
         """
         Copy package configurations to child project.
@@ -239,56 +813,14 @@ class ConfigManager:
             get_printer().error("No project root defined")
             return False
 
-        # Find package configuration directory
-        package_config_dir = None
-
-        # Function to find EzQt_App package
-        def find_ezqt_package():
-            # 1. Search in current directory and parents
-            current = Path.cwd()
-            while current.parent != current:  # As long as we're not at system root
-                ezqt_path = current / "ezqt_app"
-                if ezqt_path.exists() and (ezqt_path / "resources" / "config").exists():
-                    return ezqt_path
-                current = current.parent
-
-            # 2. Search in Python paths
-            import sys
-
-            for path in sys.path:
-                ezqt_path = Path(path) / "ezqt_app"
-                if ezqt_path.exists() and (ezqt_path / "resources" / "config").exists():
-                    return ezqt_path
-
-            return None
-
-        # Find EzQt_App package
-        ezqt_package = find_ezqt_package()
-        if ezqt_package:
-            package_config_dir = ezqt_package / "resources" / "config"
-            get_printer().verbose_msg(f"EzQt_App package found: {ezqt_package}")
-            get_printer().verbose_msg(f"Configuration directory: {package_config_dir}")
-        else:
-            # Fallback to old paths
-            possible_paths = [
-                Path.cwd() / "ezqt_app" / "resources" / "config",
-                APP_PATH / "resources" / "config",
-                APP_PATH / "ezqt_app" / "resources" / "config",
-            ]
-
-            for path in possible_paths:
-                if path.exists():
-                    package_config_dir = path
-                    get_printer().verbose_msg(
-                        f"Configuration directory found (fallback): {path}"
-                    )
-                    break
-
-        if not package_config_dir:
+        # Located once per process through importlib.resources
+        package_config_dir = get_package_resource("resources/config")
+        if not package_config_dir.is_dir():
             get_printer().error(
-                f"EzQt_App package not found. Tested paths: {[str(p) for p in [Path.cwd(), APP_PATH]]}"
+                f"EzQt_App package configurations not found: {package_config_dir}"
             )
             return False
+        get_printer().verbose_msg(f"Configuration directory: {package_config_dir}")
 
         project_config_dir = self._project_root / "bin" / "config"
 
@@ -326,14 +858,36 @@ class ConfigManager:
 
     def clear_cache(self):
         """Clear configuration cache"""
-        self._config_cache.clear()
-        self._config_files.clear()
+        with self._lock:
+            self._config_cache.clear()
+            self._config_files.clear()
+            self._flat_index.clear()
+            self._resolver.invalidate(CONFIG)
+            self._layers.invalidate()
         get_printer().verbose_msg("Configuration cache cleared")
 
+    def get_resolver(self) -> ResourceResolver:
+        """Return the resource resolver used to locate configuration files"""
+        return self._resolver
+
     def get_loaded_configs(self) -> Dict[str, Path]:
         """Return list of loaded configurations"""
         return self._config_files.copy()
 
+    def set_snapshots_enabled(self, enabled: bool) -> None:
+        """Enable or disable persistent parsed-config snapshots"""
+        self._snapshots.set_enabled(enabled)
+
+    def clear_snapshots(self) -> int:
+        """Remove persistent parsed-config snapshots from disk"""
+        removed = self._snapshots.clear()
+        get_printer().verbose_msg(f"{removed} configuration snapshots removed")
+        return removed
+
+    def get_snapshot_stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics of the parsed-config snapshots"""
+        return self._snapshots.get_stats()
+
 
 # Global configuration manager instance
 _config_manager = None
@@ -343,7 +897,7 @@ def get_config_manager() -> ConfigManager:
     """Return global configuration manager instance"""
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager()
+        _config_manager = ConfigManager(get_resource_resolver())
     return _config_manager
 
 
@@ -376,15 +930,7 @@ def get_package_resource(resource_path: str) -> Path:
     Path
         Path to resource.
     """
-    try:
-        import pkg_resources
-
-        resource = Path(pkg_resources.resource_filename("ezqt_app", resource_path))
-        return resource
-    except Exception as e:
-        # Fallback to relative path
-        fallback_path = APP_PATH / "ezqt_app" / resource_path
-        return fallback_path
+    return get_package_locator().path(resource_path)
 
 
 def get_package_resource_content(resource_path: str) -> str:
@@ -401,16 +947,4 @@ def get_package_resource_content(resource_path: str) -> str:
     str
         Resource content.
     """
-    try:
-        import pkg_resources
-
-        content = pkg_resources.resource_string("ezqt_app", resource_path)
-        return content.decode("utf-8")
-    except Exception as e:
-        # Fallback to file reading
-        file_path = get_package_resource(resource_path)
-        if file_path.exists():
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        else:
-            raise FileNotFoundError(f"Resource not found: {resource_path}")
+    return get_package_locator().read_text(resource_path)
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Config Snapshot Cache for EzQt_App
+==================================
+
+Persistent cache of parsed configuration files. Each YAML file parsed
+by the ConfigManager is stored as JSON under ``bin/config/.cache/`` and
+reused on the next start as long as the source path, modification time,
+size and content hash still match.
+
+Snapshots hold plain data only (JSON is never executed, unlike pickle),
+so a writable cache directory cannot run code. A snapshot is two lines:
+the key, then the data. The modification time and size are compared
+first; the source is hashed and the data decoded only when they match.
+Parsed content that JSON cannot represent exactly (e.g., dates, non
+string keys) is not snapshotted and parsed on every load.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import hashlib
+import json
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+from .atomic_write import atomic_write
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Bump when the blob layout changes so old snapshots are ignored
+SNAPSHOT_VERSION = 2
+
+# Undecodable snapshot data
+_INVALID = object()
+
+# Types written as is in the JSON snapshots
+PLAIN_TYPES = (str, int, float, bool, type(None))
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ConfigSnapshotCache:
+    """
+    Persistent parsed-config snapshot store.
+
+    Snapshots are keyed by the resolved source path, its mtime, its size
+    and the SHA-256 of its content. Any mismatch is a miss: the source is
+    parsed again and the snapshot rewritten. The content is hashed only
+    when the path, mtime and size match.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True):
+        """
+        Initialize the snapshot cache.
+
+        Parameters
+        ----------
+        cache_dir : Path, optional
+            Directory holding the snapshot blobs.
+        enabled : bool, optional
+            Use persistent snapshots (default: True).
+        """
+        self._cache_dir: Optional[Path] = cache_dir
+        self._enabled = enabled
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "errors": 0,
+        }
+
+    # CONFIGURATION
+    # ///////////////////////////////////////////////////////////////
+
+    def set_cache_dir(self, cache_dir: Optional[Path]) -> None:
+        """Set the directory holding the snapshot blobs."""
+        self._cache_dir = cache_dir
+
+    def get_cache_dir(self) -> Optional[Path]:
+        """Return the directory holding the snapshot blobs."""
+        return self._cache_dir
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Enable or disable persistent snapshots."""
+        self._enabled = enabled
+
+    def is_enabled(self) -> bool:
+        """Return True if persistent snapshots are used."""
+        return self._enabled and self._cache_dir is not None
+
+    # LOADING
+    # ///////////////////////////////////////////////////////////////
+
+    def load(self, source: Path, parser: Callable[[str], Any]) -> Any:
+        """
+        Return the parsed content of a source file.
+
+        Parameters
+        ----------
+        source : Path
+            Source file to parse.
+        parser : Callable[[str], Any]
+            Parser applied to the file text on a snapshot miss.
+
+        Returns
+        -------
+        Any
+            Parsed content, from the snapshot when it is still valid.
+        """
+        if not self.is_enabled():
+            return parser(source.read_text(encoding="utf-8"))
+
+        key = self._make_key(source)
+        snapshot_file = self._snapshot_path(source)
+        raw = source.read_bytes()
+        digest = None
+
+        snapshot = self._read_snapshot(snapshot_file, key)
+        if snapshot is not None:
+            digest = hashlib.sha256(raw).hexdigest()
+            if snapshot[0] == digest:
+                data = self._decode(snapshot_file, snapshot[1])
+                if data is not _INVALID:
+                    self._stats["hits"] += 1
+                    get_printer().verbose_msg(f"Config snapshot hit: {source}")
+                    return data
+
+        self._stats["misses"] += 1
+        data = parser(raw.decode("utf-8"))
+        if digest is None:
+            digest = hashlib.sha256(raw).hexdigest()
+        self._write_snapshot(snapshot_file, key, digest, data)
+        return data
+
+    def clear(self) -> int:
+        """
+        Remove every snapshot blob from the cache directory.
+
+        Returns
+        -------
+        int
+            Number of removed snapshots.
+        """
+        if self._cache_dir is None or not self._cache_dir.exists():
+            return 0
+
+        removed = 0
+        for snapshot_file in self._cache_dir.glob("*.json"):
+            try:
+                snapshot_file.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    # STATISTICS
+    # ///////////////////////////////////////////////////////////////
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics of the snapshot cache."""
+        stats: Dict[str, Any] = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["enabled"] = self.is_enabled()
+        stats["cache_dir"] = self._cache_dir
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss statistics."""
+        for key in self._stats:
+            self._stats[key] = 0
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    @staticmethod
+    def _make_key(source: Path) -> List[Any]:
+        stat = source.stat()
+        return [
+            SNAPSHOT_VERSION,
+            str(source.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+        ]
+
+    def _snapshot_path(self, source: Path) -> Path:
+        digest = hashlib.sha1(str(source.resolve()).encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{source.stem}-{digest[:16]}.json"
+
+    def _read_snapshot(
+        self, snapshot_file: Path, key: List[Any]
+    ) -> Optional[Tuple[str, bytes]]:
+        # Returns (content hash, encoded data) when the key matches
+        if not snapshot_file.exists():
+            return None
+        try:
+            with open(snapshot_file, "rb") as f:
+                header = json.loads(f.readline())
+                if header.get("key") != key:
+                    return None
+                return header["sha256"], f.read()
+        except Exception as e:
+            self._stats["errors"] += 1
+            get_printer().verbose_msg(f"Invalid config snapshot {snapshot_file}: {e}")
+            return None
+
+    def _decode(self, snapshot_file: Path, encoded: bytes) -> Any:
+        try:
+            return json.loads(encoded)
+        except Exception as e:
+            self._stats["errors"] += 1
+            get_printer().verbose_msg(f"Invalid config snapshot {snapshot_file}: {e}")
+            return _INVALID
+
+    def _write_snapshot(
+        self, snapshot_file: Path, key: List[Any], digest: str, data: Any
+    ) -> None:
+        # Only write inside an existing bin/config directory, never create it
+        if not snapshot_file.parent.parent.exists():
+            return
+        # JSON would not give the parsed content back as is
+        if not _is_plain(data):
+            return
+
+        try:
+            snapshot_file.parent.mkdir(exist_ok=True)
+            header = json.dumps({"key": key, "sha256": digest})
+            body = json.dumps(data, separators=(",", ":"))
+            atomic_write(snapshot_file, f"{header}\n{body}")
+            self._stats["writes"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            get_printer().verbose_msg(f"Could not write config snapshot: {e}")
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _is_plain(data: Any) -> bool:
+    # Dicts with string keys, lists and JSON scalars only
+    if isinstance(data, PLAIN_TYPES):
+        return True
+    if type(data) is list:
+        return all(_is_plain(item) for item in data)
+    if type(data) is dict:
+        return all(
+            isinstance(key, str) and _is_plain(value) for key, value in data.items()
+        )
+    return False
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Config Watcher for EzQt_App
+===========================
+
+Hot reload of configuration files. The files resolved by the
+ConfigManager are watched with a QFileSystemWatcher; when one of them is
+edited outside the application, only that file is parsed again, its
+flattened index is diffed against the previous one and ``keyChanged`` is
+emitted for every leaf key path whose value changed.
+
+Writes performed by the ConfigManager itself are recognized and ignored.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import os
+import weakref
+from pathlib import Path
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+from PySide6.QtCore import (
+    QObject,
+    QFileSystemWatcher,
+    QThread,
+    QTimer,
+    Qt,
+    Signal,
+    Slot,
+)
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Editors often save in several steps: wait for the file to settle
+DEFAULT_RELOAD_DELAY_MS = 50
+
+_MISSING = object()
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def diff_flat_indexes(
+    old: Dict[str, Any], new: Dict[str, Any]
+) -> List[Tuple[str, Any]]:
+    """
+    Return the leaf key paths whose value differs between two indexes.
+
+    Parameters
+    ----------
+    old : Dict[str, Any]
+        Flattened index before the reload.
+    new : Dict[str, Any]
+        Flattened index after the reload.
+
+    Returns
+    -------
+    List[Tuple[str, Any]]
+        (key_path, new value) pairs, sorted by key path. Removed keys are
+        reported with a None value.
+    """
+    changes = []
+    for key in old.keys() | new.keys():
+        old_value = old.get(key, _MISSING)
+        new_value = new.get(key, _MISSING)
+        # Mappings are reported through their leaves
+        if isinstance(new_value, dict):
+            continue
+        if new_value is _MISSING and isinstance(old_value, dict):
+            continue
+        if old_value is _MISSING or old_value != new_value:
+            changes.append((key, None if new_value is _MISSING else new_value))
+    changes.sort(key=lambda change: change[0])
+    return changes
+
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ConfigWatcher(QObject):
+    """
+    Watches loaded configuration files and reports changed keys.
+
+    Subscribers register a key prefix and are only called for the key
+    paths below it, so a palette edit never reaches a settings widget.
+    """
+
+    # config name, key path, new value
+    keyChanged = Signal(str, str, object)
+    # config name, changed key paths
+    configReloaded = Signal(str, list)
+    # Internal: lets non-GUI threads ask for a file to be watched
+    _watchRequested = Signal(str, str)
+
+    def __init__(
+        self, config_manager, reload_delay_ms: int = DEFAULT_RELOAD_DELAY_MS
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Parameters
+        ----------
+        config_manager : ConfigManager
+            Manager owning the configurations to reload.
+        reload_delay_ms : int, optional
+            Delay between a change notification and the reload.
+        """
+        super().__init__()
+        # Weak: the watcher must not keep its manager in a reference cycle
+        self._config_manager = weakref.ref(config_manager)
+        self._reload_delay_ms = reload_delay_ms
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watchRequested.connect(self._add_watch, Qt.QueuedConnection)
+
+        self._files: Dict[str, str] = {}
+        self._own_writes: Dict[str, Tuple[int, int]] = {}
+        self._changed_paths: Set[str] = set()
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.timeout.connect(self._reload_changed_files)
+        self._subscribers: Dict[str, List[Tuple[str, Callable]]] = {}
+        self._stats: Dict[str, int] = {"reloads": 0, "ignored": 0, "changes": 0}
+
+        self.keyChanged.connect(self._dispatch)
+
+    # WATCHING
+    # ///////////////////////////////////////////////////////////////
+
+    def watch(self, config_name: str, config_file: Path) -> None:
+        """
+        Watch the file a configuration was loaded from.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+        config_file : Path
+            Resolved configuration file.
+        """
+        if QThread.currentThread() == self.thread():
+            self._add_watch(config_name, str(config_file))
+        else:
+            # QFileSystemWatcher is only used from its own thread
+            self._watchRequested.emit(config_name, str(config_file))
+
+    def note_write(self, config_file: Path) -> None:
+        """
+        Record a write performed by the application itself.
+
+        Parameters
+        ----------
+        config_file : Path
+            File that was just written.
+        """
+        signature = self._signature(str(config_file))
+        if signature is not None:
+            self._own_writes[str(config_file)] = signature
+
+    def get_watched_files(self) -> Dict[str, str]:
+        """Return the watched files, per configuration name."""
+        return {name: path for path, name in self._files.items()}
+
+    # SUBSCRIPTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def subscribe(
+        self, config_name: str, key_prefix: str, callback: Callable[[str, Any], None]
+    ) -> None:
+        """
+        Call ``callback(key_path, value)`` when a key below a prefix changes.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name (e.g., "palette").
+        key_prefix : str
+            Key path prefix (e.g., "theme_palette.dark"). Empty for every key.
+        callback : Callable[[str, Any], None]
+            Function called with the changed key path and its new value.
+        """
+        self._subscribers.setdefault(config_name, []).append((key_prefix, callback))
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """Remove every subscription of a callback."""
+        for name, subscribers in self._subscribers.items():
+            self._subscribers[name] = [s for s in subscribers if s[1] != callback]
+
+    # RELOADING
+    # ///////////////////////////////////////////////////////////////
+
+    def reload(self, config_name: str, changed_file: Optional[str] = None) -> List[str]:
+        """
+        Parse a configuration again and emit its changed keys.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+        changed_file : str, optional
+            File that changed: only its layer is parsed again.
+
+        Returns
+        -------
+        List[str]
+            Changed key paths.
+        """
+        manager = self._config_manager()
+        if manager is None:
+            return []
+        old_index = dict(manager.get_flat_index(config_name))
+        manager.reload_config(config_name, Path(changed_file) if changed_file else None)
+
+        # Updates still waiting for the write-behind queue win over the file
+        queue = manager._write_queue
+        if queue is not None:
+            for key_path, value in queue.get_pending_updates(config_name).items():
+                manager.set_value_in_memory(config_name, key_path, value)
+
+        changes = diff_flat_indexes(old_index, manager.get_flat_index(config_name))
+        self._stats["reloads"] += 1
+        self._stats["changes"] += len(changes)
+
+        for key_path, value in changes:
+            self.keyChanged.emit(config_name, key_path, value)
+        if changes:
+            get_printer().verbose_msg(
+                f"Configuration '{config_name}' reloaded: {len(changes)} changed keys"
+            )
+            self.configReloaded.emit(config_name, [key for key, _ in changes])
+        return [key for key, _ in changes]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return reload statistics."""
+        stats = dict(self._stats)
+        stats["watched"] = len(self._files)
+        return stats
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @Slot(str, str)
+    def _add_watch(self, config_name: str, path: str) -> None:
+        # A file watched for another configuration name keeps its first owner
+        self._files.setdefault(path, config_name)
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+
+    def _on_file_changed(self, path: str) -> None:
+        self._changed_paths.add(path)
+        self._reload_timer.start(self._reload_delay_ms)
+
+    def _reload_changed_files(self) -> None:
+        changed_paths, self._changed_paths = self._changed_paths, set()
+        for path in sorted(changed_paths):
+            self._reload_file(path)
+
+    def _reload_file(self, path: str) -> None:
+        config_name = self._files.get(path)
+        if config_name is None:
+            return
+
+        # Atomic replacements remove the watched inode: watch the new file
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+
+        signature = self._signature(path)
+        if signature is not None and self._own_writes.get(path) == signature:
+            self._stats["ignored"] += 1
+            return
+
+        try:
+            self.reload(config_name, path)
+        except Exception as e:
+            get_printer().warning(
+                f"Could not reload configuration '{config_name}': {e}"
+            )
+
+    def _dispatch(self, config_name: str, key_path: str, value: Any) -> None:
+        for prefix, callback in list(self._subscribers.get(config_name, ())):
+            if prefix and key_path != prefix and not key_path.startswith(f"{prefix}."):
+                continue
+            try:
+                callback(key_path, value)
+            except Exception as e:
+                get_printer().warning(f"Config subscriber failed for '{key_path}': {e}")
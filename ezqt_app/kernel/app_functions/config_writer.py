@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Config Write Queue for EzQt_App
+===============================
+
+Write-behind persistence for ``Kernel.writeYamlConfig``. Updates are
+applied to the in-memory configuration immediately, coalesced per key
+path, and written to disk once the configured window has elapsed without
+new updates. When ruamel.yaml is available only the pending keys are
+patched into the file, which keeps its comments and layout.
+Serialization runs on one long-lived background thread, which sleeps
+until the write deadline; new updates only move the deadline. Pending
+updates are flushed synchronously when the Qt application is about to
+quit.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import atexit
+import copy
+import threading
+import time
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+DEFAULT_WRITE_DELAY_MS = 300
+DEFAULT_MAX_WRITE_DELAY_MS = 2000
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ConfigWriteQueue:
+    """
+    Debounced write-behind queue for configuration updates.
+
+    A burst of updates (for example a slider drag) produces a single
+    disk write once no update arrived for ``delay_ms``. A continuous
+    burst is still written at least every ``max_delay_ms``.
+    """
+
+    def __init__(
+        self,
+        config_manager,
+        delay_ms: int = DEFAULT_WRITE_DELAY_MS,
+        max_delay_ms: int = DEFAULT_MAX_WRITE_DELAY_MS,
+    ) -> None:
+        """
+        Initialize the write queue.
+
+        Parameters
+        ----------
+        config_manager : ConfigManager
+            Manager owning the in-memory configurations and their files.
+        delay_ms : int, optional
+            Quiet period before pending updates are written. 0 writes
+            synchronously on every update.
+        max_delay_ms : int, optional
+            Maximum age of a pending update before it is written.
+        """
+        self._config_manager = config_manager
+        self._delay_ms = delay_ms
+        self._max_delay_ms = max_delay_ms
+
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._pending: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+        self._first_pending_at: Optional[float] = None
+        # Monotonic time of the next background write, None when idle
+        self._deadline: Optional[float] = None
+        self._wakeup = threading.Condition(self._lock)
+        self._worker: Optional[threading.Thread] = None
+        self._quit_hooked = False
+        self._stats: Dict[str, int] = {
+            "updates": 0,
+            "coalesced": 0,
+            "writes": 0,
+            "errors": 0,
+        }
+
+        atexit.register(self.flush)
+
+    # CONFIGURATION
+    # ///////////////////////////////////////////////////////////////
+
+    def set_delay(self, delay_ms: int, max_delay_ms: Optional[int] = None) -> None:
+        """
+        Set the coalescing window.
+
+        Parameters
+        ----------
+        delay_ms : int
+            Quiet period before pending updates are written (0: synchronous).
+        max_delay_ms : int, optional
+            Maximum age of a pending update before it is written.
+        """
+        self._delay_ms = max(0, int(delay_ms))
+        if max_delay_ms is not None:
+            self._max_delay_ms = max(self._delay_ms, int(max_delay_ms))
+        if self._delay_ms == 0:
+            self.flush()
+
+    def get_delay(self) -> int:
+        """Return the coalescing window in milliseconds."""
+        return self._delay_ms
+
+    # QUEUE
+    # ///////////////////////////////////////////////////////////////
+
+    def enqueue(self, config_name: str, keys: Sequence[str], value: Any) -> None:
+        """
+        Apply an update in memory and schedule its persistence.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name (e.g., "app").
+        keys : Sequence[str]
+            Key path inside the configuration.
+        value : Any
+            Value to write.
+        """
+        key_path = tuple(keys)
+        if not key_path:
+            return
+
+        with self._lock:
+            self._config_manager.set_value_in_memory(config_name, key_path, value)
+
+            pending = self._pending.setdefault(config_name, {})
+            if key_path in pending:
+                self._stats["coalesced"] += 1
+            pending[key_path] = value
+            self._stats["updates"] += 1
+
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+
+        self._hook_about_to_quit()
+
+        if self._delay_ms == 0:
+            self.flush()
+        else:
+            self._schedule()
+
+    def flush(self) -> int:
+        """
+        Write every pending configuration synchronously.
+
+        Returns
+        -------
+        int
+            Number of configuration files written.
+        """
+        # Holding the write lock while snapshotting keeps writes in order
+        manager = self._config_manager
+        written = 0
+        with self._write_lock:
+            with self._lock:
+                self._deadline = None
+                pending = self._pending
+                self._pending = {}
+                self._first_pending_at = None
+                patch = manager.get_patcher() is not None
+                if not patch:
+                    # Full dump: snapshot the whole configuration
+                    pending = {
+                        name: copy.deepcopy(manager.load_config(name))
+                        for name in pending
+                    }
+
+            for config_name, data in pending.items():
+                if patch:
+                    # Only the lines of the pending keys are rewritten
+                    success = manager.patch_config_file(config_name, data)
+                else:
+                    success = manager.write_config_file(config_name, data)
+                if success:
+                    self._stats["writes"] += 1
+                    written += 1
+                else:
+                    self._stats["errors"] += 1
+        return written
+
+    def has_pending(self) -> bool:
+        """Return True if updates are waiting to be written."""
+        with self._lock:
+            return bool(self._pending)
+
+    def get_pending_keys(self) -> Dict[str, List[Tuple[str, ...]]]:
+        """Return the key paths waiting to be written, per configuration."""
+        with self._lock:
+            return {name: list(keys) for name, keys in self._pending.items()}
+
+    def get_pending_updates(self, config_name: str) -> Dict[Tuple[str, ...], Any]:
+        """Return the values waiting to be written for a configuration."""
+        with self._lock:
+            return dict(self._pending.get(config_name, {}))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return update/write statistics."""
+        return dict(self._stats)
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _schedule(self) -> None:
+        with self._lock:
+            delay_s = self._delay_ms / 1000
+            if self._first_pending_at is not None:
+                age_s = time.monotonic() - self._first_pending_at
+                delay_s = max(0.0, min(delay_s, self._max_delay_ms / 1000 - age_s))
+            self._deadline = time.monotonic() + delay_s
+
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="ConfigWriteQueue", daemon=True
+                )
+                self._worker.start()
+            else:
+                self._wakeup.notify()
+
+    def _run_worker(self) -> None:
+        # Sleeps until the deadline, which enqueue keeps moving
+        while True:
+            with self._lock:
+                while self._deadline is None:
+                    self._wakeup.wait()
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+                self._deadline = None
+            self._flush_in_background()
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            self._stats["errors"] += 1
+            get_printer().warning(f"Background configuration write failed: {e}")
+
+    def _hook_about_to_quit(self) -> None:
+        if self._quit_hooked:
+            return
+        try:
+            from PySide6.QtCore import QCoreApplication
+
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.flush)
+                self._quit_hooked = True
+        except Exception as e:
+            get_printer().verbose_msg(f"Could not hook aboutToQuit: {e}")
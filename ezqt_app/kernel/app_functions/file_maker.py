@@ -46,9 +46,19 @@ from pathlib import Path
 # ///////////////////////////////////////////////////////////////
 from ..common import APP_PATH
 from .printer import get_printer
+from .package_resources import get_package_locator
+from .atomic_write import atomic_write
+from .stylesheet_cache import is_rendered_theme, write_rendered_themes
+from .qss_optimizer import (
+    OPTIMIZED_SUFFIX,
+    collect_object_names,
+    get_optimized_path,
+    measure_parse_time,
+    optimize_qss,
+)
 
 # TYPE HINTS IMPROVEMENTS
-from typing import Optional, List
+from typing import Any, Dict, Iterable, List, Optional
 
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -179,10 +189,7 @@ class FileMaker:
             Path to copied YAML file.
         """
         if yaml_package is None:
-            # Use pkg_resources to access installed package resources
-            import pkg_resources
-
-            yaml_package = Path(pkg_resources.resource_filename("ezqt_app", "app.yaml"))
+            yaml_package = get_package_locator().path("app.yaml")
 
         if not yaml_package.exists():
             self.printer.warning(f"YAML file not found at {yaml_package}")
@@ -202,6 +209,10 @@ class FileMaker:
         """
         Copy QSS theme files from package to application.
 
+        Each copied theme is also rendered for every palette of
+        palette.yaml (``<stem>.<theme>.qss``), loaded at runtime instead of
+        substituting the palette variables.
+
         Parameters
         ----------
         theme_package : Path, optional
@@ -214,12 +225,7 @@ class FileMaker:
         """
 
         if theme_package is None:
-            # Use pkg_resources to access installed package resources
-            import pkg_resources
-
-            theme_package = Path(
-                pkg_resources.resource_filename("ezqt_app", "resources/themes")
-            )
+            theme_package = get_package_locator().path("resources/themes")
 
         if not theme_package.exists():
             self.printer.warning(f"Theme directory not found at {theme_package}")
@@ -247,6 +253,8 @@ class FileMaker:
 
                     # Copy file even if it already exists (as in old code)
                     shutil.copy2(theme_package, target_file)
+                    self._discard_optimized(target_file)
+                    self._render_theme(target_file)
                     self.printer.verbose_msg(f"Copied theme file: {theme_package.name}")
 
                     self.printer.info("[FileMaker] Generated QSS theme files.")
@@ -276,6 +284,8 @@ class FileMaker:
 
                         # Copy file even if it already exists (as in old code)
                         shutil.copy2(theme_file, target_file)
+                        self._discard_optimized(target_file)
+                        self._render_theme(target_file)
                         copied_files.append(theme_file.name)
                         self.printer.verbose_msg(
                             f"Copied theme file: {theme_file.name}"
@@ -308,6 +318,108 @@ class FileMaker:
             self.printer.error(f"Error copying theme files: {e}")
             return False
 
+    def optimize_qss(
+        self,
+        prune: bool = True,
+        keep: Optional[Iterable[str]] = None,
+        measure: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Write a minified, pruned version of the project QSS themes.
+
+        Each ``bin/themes/<stem>.qss`` gives a ``<stem>.min.qss``, which the
+        theme manager loads instead of the source while it is up to date.
+
+        Parameters
+        ----------
+        prune : bool, optional
+            Remove the selectors whose ``#objectName`` is not used by the
+            package or project sources (default: True).
+        keep : Iterable[str], optional
+            Object names to keep, e.g. names set from variables.
+        measure : bool, optional
+            Measure the Qt parse time of both versions (default: True).
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Report per theme file (rule counts, sizes, parse times).
+        """
+        sources = self._get_theme_sources()
+        if not sources:
+            return {}
+
+        names = prefixes = None
+        if prune:
+            names, prefixes = collect_object_names(self._get_object_name_sources())
+            names.update(keep or ())
+        palette = self._get_default_palette() if measure else None
+        palettes = self._get_palettes()
+
+        reports = {}
+        for source in sources:
+            try:
+                text = source.read_text(encoding="utf-8")
+                optimized, report = optimize_qss(text, names, prefixes or ())
+                optimized_path = get_optimized_path(source)
+                atomic_write(optimized_path, optimized)
+                # Rendered again from the optimized version, now the newest
+                self._render_theme(optimized_path, palettes)
+            except Exception as e:
+                self.printer.warning(f"Failed to optimize theme {source.name}: {e}")
+                continue
+
+            if measure:
+                report["parse_ms_before"] = measure_parse_time(text, palette)
+                report["parse_ms_after"] = measure_parse_time(optimized, palette)
+            reports[source.name] = report
+
+            message = (
+                f"[FileMaker] Optimized {source.name}: "
+                f"{report['rules_before']} -> {report['rules_after']} rules, "
+                f"{report['bytes_before'] / 1024:.1f} -> "
+                f"{report['bytes_after'] / 1024:.1f} KB"
+            )
+            if report.get("parse_ms_before") is not None:
+                message += (
+                    f", parsed in {report['parse_ms_before']:.2f} -> "
+                    f"{report['parse_ms_after']:.2f} ms"
+                )
+            self.printer.info(message)
+            if report["removed_selectors"]:
+                self.printer.list_items(
+                    report["removed_selectors"], title="Removed selectors"
+                )
+        return reports
+
+    def render_themes(self) -> int:
+        """
+        Render the project QSS themes for every palette of palette.yaml.
+
+        The optimized version of a theme is rendered when up to date.
+
+        Returns
+        -------
+        int
+            Number of rendered themes.
+        """
+        palettes = self._get_palettes()
+        sources = self._get_theme_sources()
+        for source in sources:
+            optimized = get_optimized_path(source)
+            if (
+                optimized.exists()
+                and optimized.stat().st_mtime >= source.stat().st_mtime
+            ):
+                source = optimized
+            self._render_theme(source, palettes)
+
+        if sources:
+            self.printer.info(
+                f"[FileMaker] Rendered QSS themes for {len(palettes)} palettes."
+            )
+        return len(sources)
+
     def make_translations_from_package(
         self, translations_package: Optional[Path] = None
     ) -> bool:
@@ -325,12 +437,7 @@ class FileMaker:
             True if successful.
         """
         if translations_package is None:
-            # Use pkg_resources to access installed package resources
-            import pkg_resources
-
-            translations_package = Path(
-                pkg_resources.resource_filename("ezqt_app", "resources/translations")
-            )
+            translations_package = get_package_locator().path("resources/translations")
 
         if not translations_package.exists():
             self.printer.warning(
@@ -614,3 +721,69 @@ class FileMaker:
     def get_resources_module_file(self) -> str:
         """Get the resources module file path."""
         return self._resources_module_file
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_object_name_sources(self) -> List[Path]:
+        # Widgets of the project, of the package and of ezqt_widgets
+        sources = [self.base_path]
+        locator = get_package_locator()
+        if locator.is_on_disk():
+            sources.append(locator.get_root())
+        try:
+            import ezqt_widgets
+
+            sources.append(Path(ezqt_widgets.__file__).parent)
+        except ImportError:
+            pass
+        return sources
+
+    def _get_theme_sources(self) -> List[Path]:
+        themes_path = self._bin / "themes"
+        # Skip derived files: <stem>.min.qss and <stem>.<theme>.qss, the
+        # latter recognized by their header (dots are allowed in names)
+        sources = [
+            path
+            for path in sorted(themes_path.glob("*.qss"))
+            if not path.name.endswith(OPTIMIZED_SUFFIX) and not is_rendered_theme(path)
+        ]
+        if not sources:
+            self.printer.warning(f"No QSS theme files found in {themes_path}")
+        return sources
+
+    def _render_theme(
+        self, theme_file: Path, palettes: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> None:
+        # One fully rendered stylesheet per palette (see ThemeManager)
+        try:
+            palettes = self._get_palettes() if palettes is None else palettes
+            for path in write_rendered_themes(theme_file, palettes):
+                self.printer.verbose_msg(f"Rendered theme file: {path.name}")
+        except Exception as e:
+            self.printer.warning(f"Failed to render theme {theme_file.name}: {e}")
+
+    def _get_default_palette(self) -> Dict[str, str]:
+        palettes = self._get_palettes()
+        return palettes.get("dark") or next(iter(palettes.values()), {})
+
+    def _get_palettes(self) -> Dict[str, Dict[str, str]]:
+        from .yaml_backend import safe_load
+
+        palette_file = self._bin / "config" / "palette.yaml"
+        try:
+            if palette_file.exists():
+                text = palette_file.read_text(encoding="utf-8")
+            else:
+                text = get_package_locator().read_text("resources/config/palette.yaml")
+            return (safe_load(text) or {}).get("theme_palette") or {}
+        except Exception as e:
+            self.printer.verbose_msg(f"Could not load palette: {e}")
+            return {}
+
+    def _discard_optimized(self, theme_file: Path) -> None:
+        # The copy keeps the package mtime, older than a previous .min.qss
+        optimized = get_optimized_path(theme_file)
+        if optimized.exists():
+            optimized.unlink()
+            self.printer.verbose_msg(f"Removed outdated theme: {optimized.name}")
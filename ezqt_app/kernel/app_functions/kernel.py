@@ -24,6 +24,7 @@
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
+from pathlib import Path
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
@@ -41,6 +42,9 @@ from .config_manager import (
 )
 from .resource_manager import ResourceManager
 from .settings_manager import SettingsManager
+from .settings_model import get_app_settings_model
+from .preloader import get_preloader
+from .stylesheet_cache import get_stylesheet_cache
 
 # TYPE HINTS IMPROVEMENTS
 
@@ -102,6 +106,9 @@ class Kernel:
             Path to the project root directory.
         """
         get_config_manager().set_project_root(project_root)
+        get_stylesheet_cache().set_cache_dir(
+            Path(project_root) / "bin" / "themes" / ".cache"
+        )
 
     @classmethod
     def loadKernelConfig(cls, config_name: str):
@@ -116,7 +123,7 @@ class Kernel:
         Returns
         -------
         Dict[str, Any]
-            Loaded configuration.
+            Loaded configuration (read-only, ``copy.deepcopy`` it to edit).
         """
         return load_config(config_name)
 
@@ -141,6 +148,60 @@ class Kernel:
         """
         return get_config_value(config_name, key_path, default)
 
+    @classmethod
+    def getConfigAccessor(cls, config_name: str, key_path: str, default=None):
+        """
+        Get a precompiled accessor to a configuration value.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+        key_path : str
+            Key path (e.g., "app.name", "theme_palette.dark").
+        default : Any
+            Default value if key doesn't exist.
+
+        Returns
+        -------
+        ConfigAccessor
+            Callable returning the current value.
+        """
+        return get_config_manager().accessor(config_name, key_path, default)
+
+    @classmethod
+    def subscribeConfig(cls, config_name: str, key_prefix: str, callback) -> bool:
+        """
+        Call a function when an edited configuration file changes a key.
+
+        Parameters
+        ----------
+        config_name : str
+            Configuration name.
+        key_prefix : str
+            Only keys below this prefix are reported (empty: every key).
+        callback : Callable[[str, Any], None]
+            Function called with the changed key path and its new value.
+
+        Returns
+        -------
+        bool
+            True if hot reload is available.
+        """
+        return get_config_manager().subscribe(config_name, key_prefix, callback)
+
+    @classmethod
+    def unsubscribeConfig(cls, callback) -> None:
+        """
+        Stop calling a function registered with ``subscribeConfig``.
+
+        Parameters
+        ----------
+        callback : Callable[[str, Any], None]
+            Function to remove from every subscription.
+        """
+        get_config_manager().unsubscribe(callback)
+
     @classmethod
     def saveKernelConfig(cls, config_name: str, data):
         """
@@ -174,23 +235,49 @@ class Kernel:
         val : Union[str, int, Dict[str, str]]
             Value to write.
         """
-        # For compatibility, load current config and update
+        # The value is visible in memory immediately; the disk write is
+        # coalesced with other updates and performed on a background thread
         if keys:
             config_name = keys[0]  # First element as config name
-            config = load_config(config_name)
+            key_path = keys[1:] or keys[-1:]
+            get_config_manager().get_write_queue().enqueue(config_name, key_path, val)
 
-            # Navigate through structure
-            current = config
-            for key in keys[1:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
+    @classmethod
+    def flushYamlConfig(cls) -> int:
+        """
+        Write pending configuration updates to disk immediately.
 
-            # Write the value
-            current[keys[-1]] = val
+        Returns
+        -------
+        int
+            Number of configuration files written.
+        """
+        return get_config_manager().get_write_queue().flush()
 
-            # Save
-            save_config(config_name, config)
+    @classmethod
+    def setYamlWriteDelay(cls, delay_ms: int) -> None:
+        """
+        Set the coalescing window of writeYamlConfig.
+
+        Parameters
+        ----------
+        delay_ms : int
+            Quiet period before pending updates are written (0: synchronous).
+        """
+        get_config_manager().get_write_queue().set_delay(delay_ms)
+
+    @classmethod
+    def setConfigDurability(cls, mode) -> None:
+        """
+        Select the durability of configuration writes.
+
+        Parameters
+        ----------
+        mode : DurabilityMode or str
+            "fast" (no fsync) or "durable" (fsync before and after the
+            atomic rename).
+        """
+        get_config_manager().set_durability(mode)
 
     # RESOURCE MANAGEMENT
     # ///////////////////////////////////////////////////////////////
@@ -241,6 +328,38 @@ class Kernel:
         """
         ResourceManager.load_fonts_resources(app)
 
+    # PRELOADING
+    # ///////////////////////////////////////////////////////////////
+
+    @staticmethod
+    def startPreload() -> bool:
+        """
+        Start loading configurations, theme and translations in the background.
+
+        Returns
+        -------
+        bool
+            False if the preload was already started.
+        """
+        return get_preloader().start()
+
+    @staticmethod
+    def awaitPreload(timeout: float = None) -> bool:
+        """
+        Wait for the background preload started by startPreload.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait, in seconds.
+
+        Returns
+        -------
+        bool
+            True if every preloaded resource is ready.
+        """
+        return get_preloader().wait(timeout)
+
     # SETTINGS MANAGEMENT
     # ///////////////////////////////////////////////////////////////
 
@@ -255,3 +374,15 @@ class Kernel:
             Loaded settings.
         """
         return SettingsManager.load_app_settings()
+
+    @staticmethod
+    def getAppSettings():
+        """
+        Get the compiled application settings.
+
+        Returns
+        -------
+        AppSettingsModel, optional
+            Validated app.yaml, or None before loadAppSettings.
+        """
+        return get_app_settings_model()
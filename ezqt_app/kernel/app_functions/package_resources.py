@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Package Resources for EzQt_App
+==============================
+
+Locator of the files shipped inside the ezqt_app package (default
+configurations, themes, translations, templates), built on
+``importlib.resources.files``. It replaces ``pkg_resources``, whose
+import alone is slow, and the scans of the current directory and of
+``sys.path`` used to find the installed package.
+
+The package root is located once per process and every resolved path
+is memoized. Packages imported from a zip archive are supported: their
+text resources are read directly from the archive, and a resource that
+must exist on disk (e.g., a directory to copy) is extracted once to a
+temporary directory. Frozen applications (PyInstaller) expose the
+package through their bundle directory.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import atexit
+import shutil
+import sys
+import tempfile
+import threading
+from importlib import resources
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, Optional
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+PACKAGE_NAME = "ezqt_app"
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class PackageResourceLocator:
+    """
+    Cached locator for the resources of an installed package.
+
+    Parameters
+    ----------
+    package : str, optional
+        Name of the package holding the resources.
+    """
+
+    def __init__(self, package: str = PACKAGE_NAME) -> None:
+        self._package = package
+        self._lock = threading.Lock()
+        # importlib.resources Traversable (a Path when on disk)
+        self._root: Optional[Any] = None
+        self._paths: Dict[str, Path] = {}
+        self._extract_dir: Optional[Path] = None
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "extracted": 0}
+
+    # LOCATION
+    # ///////////////////////////////////////////////////////////////
+
+    def get_root(self):
+        """
+        Return the root of the package.
+
+        Returns
+        -------
+        Traversable
+            ``importlib.resources`` handle of the package (a ``Path`` when
+            the package is installed on disk).
+        """
+        if self._root is None:
+            self._root = self._find_root()
+        return self._root
+
+    def is_on_disk(self) -> bool:
+        """Return True if the package files are plain files on disk."""
+        return isinstance(self.get_root(), Path)
+
+    def path(self, resource_path: str) -> Path:
+        """
+        Return a resource as a path on disk.
+
+        Parameters
+        ----------
+        resource_path : str
+            Resource path inside the package (e.g., "resources/themes").
+
+        Returns
+        -------
+        Path
+            Location of the file or directory. It may not exist: callers
+            check it, as with any path.
+        """
+        resolved = self._paths.get(resource_path)
+        if resolved is not None:
+            self._stats["hits"] += 1
+            return resolved
+
+        self._stats["misses"] += 1
+        with self._lock:
+            resolved = self._paths.get(resource_path)
+            if resolved is None:
+                node = self._join(resource_path)
+                if isinstance(node, Path):
+                    resolved = node
+                else:
+                    resolved = self._extract(resource_path, node)
+                self._paths[resource_path] = resolved
+        return resolved
+
+    def read_text(self, resource_path: str, encoding: str = "utf-8") -> str:
+        """
+        Return the content of a text resource.
+
+        Read directly from the package, without extracting it.
+
+        Parameters
+        ----------
+        resource_path : str
+            Resource path inside the package.
+        encoding : str, optional
+            Text encoding.
+
+        Returns
+        -------
+        str
+            Resource content.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the resource does not exist.
+        """
+        node = self._join(resource_path)
+        if not node.is_file():
+            raise FileNotFoundError(f"Resource not found: {resource_path}")
+        return node.read_bytes().decode(encoding)
+
+    def exists(self, resource_path: str) -> bool:
+        """Return True if the package contains the resource."""
+        node = self._join(resource_path)
+        return node.is_file() or node.is_dir()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return memoization statistics."""
+        stats = dict(self._stats)
+        stats["entries"] = len(self._paths)
+        return stats
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _find_root(self):
+        try:
+            return resources.files(self._package)
+        except Exception as e:
+            get_printer().verbose_msg(
+                f"importlib.resources cannot locate {self._package}: {e}"
+            )
+
+        # Frozen bundle without resource reader, then source checkout
+        if hasattr(sys, "_MEIPASS"):
+            bundled = Path(sys._MEIPASS) / self._package
+            if bundled.is_dir():
+                return bundled
+        return Path(__file__).resolve().parent.parent.parent
+
+    def _join(self, resource_path: str):
+        # Traversable.joinpath only takes several parts from Python 3.11
+        node = self.get_root()
+        for part in resource_path.replace("\\", "/").split("/"):
+            if part:
+                node = node / part
+        return node
+
+    def _extract(self, resource_path: str, node) -> Path:
+        """Copy a resource out of an archive (lock held)."""
+        if self._extract_dir is None:
+            self._extract_dir = Path(tempfile.mkdtemp(prefix=f"{self._package}-"))
+            atexit.register(shutil.rmtree, self._extract_dir, True)
+        target = self._extract_dir / resource_path
+        if node.is_file() or node.is_dir():
+            _copy_tree(node, target)
+            self._stats["extracted"] += 1
+        return target
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _copy_tree(node, target: Path) -> None:
+    if node.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        for child in node.iterdir():
+            _copy_tree(child, target / child.name)
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(node.read_bytes())
+
+
+# Global package resource locator instance
+_package_locator = None
+
+
+def get_package_locator() -> PackageResourceLocator:
+    """Return global package resource locator instance"""
+    global _package_locator
+    if _package_locator is None:
+        _package_locator = PackageResourceLocator()
+    return _package_locator
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pixmap Cache for EzQt_App
+=========================
+
+Process-wide cache of recolored pixmaps, shared by ``colorize_pixmap``
+(menu buttons) and the theme icons. The header, the menu and the
+settings panel recolor the same icons on every theme switch: a pixmap is
+composited once per (source, color, opacity, size, device pixel ratio).
+
+Entries are dropped least recently used first once their size exceeds
+the byte budget (``app.pixmap_cache_kb`` in app.yaml). The store is
+dedicated rather than ``QPixmapCache``, whose budget is shared with the
+pixmaps Qt styles cache. Pixmaps belong to the GUI thread, as does the
+cache.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+from collections import OrderedDict
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QColor, QPainter, QPixmap
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, Hashable, Tuple, Union
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Default byte budget of the recolored pixmaps
+DEFAULT_BUDGET_BYTES = 8 * 1024 * 1024
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class PixmapCache:
+    """
+    LRU cache of recolored pixmaps within a byte budget.
+
+    Parameters
+    ----------
+    budget_bytes : int, optional
+        Size of the cached pixmaps (default: DEFAULT_BUDGET_BYTES, 0
+        disables the cache).
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self._budget = budget_bytes
+        self._bytes = 0
+        # key -> (pixmap, size in bytes)
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[QPixmap, int]]" = (
+            OrderedDict()
+        )
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # CONFIGURATION
+    # ///////////////////////////////////////////////////////////////
+
+    def set_budget(self, budget_bytes: int) -> None:
+        """Set the byte budget, dropping entries beyond it."""
+        self._budget = max(0, budget_bytes)
+        self._evict()
+
+    def get_budget(self) -> int:
+        """Return the byte budget."""
+        return self._budget
+
+    def clear(self) -> None:
+        """Drop every cached pixmap."""
+        self._entries.clear()
+        self._bytes = 0
+
+    # RECOLORING
+    # ///////////////////////////////////////////////////////////////
+
+    def get_colorized(
+        self,
+        source_key: Hashable,
+        color: Union[str, QColor],
+        opacity: float,
+        size: QSize,
+        ratio: float,
+        load: Callable[[], QPixmap],
+    ) -> QPixmap:
+        """
+        Return a source pixmap recolored, compositing it on a miss only.
+
+        Parameters
+        ----------
+        source_key : Hashable
+            Identifier of the source (e.g., icon path or cache key).
+        color : str or QColor
+            Color applied to the opaque pixels.
+        opacity : float
+            Opacity of the result.
+        size : QSize
+            Requested size, in device-independent pixels.
+        ratio : float
+            Device pixel ratio.
+        load : Callable[[], QPixmap]
+            Returns the source pixmap; only called on a miss.
+
+        Returns
+        -------
+        QPixmap
+            Recolored pixmap.
+        """
+        key = (
+            source_key,
+            QColor(color).rgba(),
+            round(opacity, 3),
+            size.width(),
+            size.height(),
+            ratio,
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+        self._stats["misses"] += 1
+        pixmap = render_colorized(load(), color, opacity)
+        cost = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        if cost <= self._budget:
+            self._entries[key] = (pixmap, cost)
+            self._bytes += cost
+            self._evict()
+        return pixmap
+
+    def colorize(
+        self, pixmap: QPixmap, color: Union[str, QColor], opacity: float
+    ) -> QPixmap:
+        """
+        Return a pixmap recolored, keyed by the pixmap cache key.
+
+        Parameters
+        ----------
+        pixmap : QPixmap
+            Source pixmap.
+        color : str or QColor
+            Color applied to the opaque pixels.
+        opacity : float
+            Opacity of the result.
+
+        Returns
+        -------
+        QPixmap
+            Recolored pixmap.
+        """
+        return self.get_colorized(
+            ("pixmap", pixmap.cacheKey()),
+            color,
+            opacity,
+            pixmap.deviceIndependentSize().toSize(),
+            pixmap.devicePixelRatio(),
+            lambda: pixmap,
+        )
+
+    # INSTRUMENTATION
+    # ///////////////////////////////////////////////////////////////
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics of the pixmap cache."""
+        stats: Dict[str, Any] = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = len(self._entries)
+        stats["bytes"] = self._bytes
+        stats["budget_bytes"] = self._budget
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss statistics."""
+        for key in self._stats:
+            self._stats[key] = 0
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _evict(self) -> None:
+        while self._entries and self._bytes > self._budget:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._bytes -= cost
+            self._stats["evictions"] += 1
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def render_colorized(
+    pixmap: QPixmap, color: Union[str, QColor], opacity: float = 1.0
+) -> QPixmap:
+    """
+    Composite a pixmap with a color, keeping its alpha channel.
+
+    Parameters
+    ----------
+    pixmap : QPixmap
+        Source pixmap.
+    color : str or QColor
+        Color applied to the opaque pixels.
+    opacity : float, optional
+        Opacity of the result (default: 1.0).
+
+    Returns
+    -------
+    QPixmap
+        New pixmap, with the device pixel ratio of the source.
+    """
+    result = QPixmap(pixmap.size())
+    result.setDevicePixelRatio(pixmap.devicePixelRatio())
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    painter.setOpacity(opacity)
+    painter.drawPixmap(0, 0, pixmap)
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(result.rect(), QColor(color))
+    painter.end()
+    return result
+
+
+# Global pixmap cache instance
+_pixmap_cache = None
+
+
+def get_pixmap_cache() -> PixmapCache:
+    """Return global pixmap cache instance"""
+    global _pixmap_cache
+    if _pixmap_cache is None:
+        _pixmap_cache = PixmapCache()
+    return _pixmap_cache
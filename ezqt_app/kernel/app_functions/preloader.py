@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Resource Preloader for EzQt_App
+===============================
+
+Concurrent loading of the files read while the main window is built.
+``start`` is called as soon as the project root is known (when the
+EzApplication is constructed) and submits to a thread pool:
+
+- the effective view of the app, palette and languages configurations;
+- the text of the main QSS theme;
+- the translations of the configured language (.ts file).
+
+The window constructor then calls ``wait`` and every consumer gets the
+preloaded result instead of touching the disk. No Qt object is created
+in the worker threads. A preloaded file is handed out once: later reads
+go to the disk again, so edits made afterwards are never hidden.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+from .resource_resolver import TRANSLATIONS
+from .qss_optimizer import resolve_theme_file
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+PRELOAD_CONFIGS = ("app", "palette", "languages")
+DEFAULT_THEME_FILE = "main_theme.qss"
+DEFAULT_WORKERS = 4
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ResourcePreloader:
+    """
+    Thread-pool loader of configurations, themes and translations.
+
+    Parameters
+    ----------
+    config_manager : ConfigManager, optional
+        Manager whose configurations are preloaded (default: global one).
+    max_workers : int, optional
+        Size of the thread pool.
+    """
+
+    def __init__(self, config_manager=None, max_workers: int = DEFAULT_WORKERS):
+        if config_manager is None:
+            from .config_manager import get_config_manager
+
+            config_manager = get_config_manager()
+        self._config_manager = config_manager
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._tasks: List[Future] = []
+        self._configs: Dict[str, Future] = {}
+        # Keyed by resolved file path, handed out once
+        self._texts: Dict[str, Future] = {}
+        self._translations: Dict[str, Future] = {}
+        self._stats: Dict[str, Any] = {"tasks": 0, "hits": 0, "wait_ms": 0.0}
+
+    # PRELOADING
+    # ///////////////////////////////////////////////////////////////
+
+    def start(
+        self,
+        config_names: Sequence[str] = PRELOAD_CONFIGS,
+        theme_file: Optional[str] = DEFAULT_THEME_FILE,
+    ) -> bool:
+        """
+        Submit the preload tasks.
+
+        Parameters
+        ----------
+        config_names : Sequence[str], optional
+            Configurations to load.
+        theme_file : str, optional
+            QSS theme file to read (None: no theme).
+
+        Returns
+        -------
+        bool
+            False if the preload was already started.
+        """
+        with self._lock:
+            if self._executor is not None:
+                return False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="ezqt-preload"
+            )
+
+        resolver = self._config_manager.get_resolver()
+        for name in config_names:
+            self._configs[name] = self._submit(
+                self._config_manager.get_effective_config, name
+            )
+        if theme_file:
+            self._submit(self._preload_theme, resolver, theme_file)
+        if "app" in self._configs:
+            self._submit(self._preload_translations, resolver)
+
+        get_printer().verbose_msg(f"Preloading {self._stats['tasks']} resources")
+        return True
+
+    def is_started(self) -> bool:
+        """Return True if the preload was started."""
+        return self._executor is not None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every preload task.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait, in seconds.
+
+        Returns
+        -------
+        bool
+            True if every task is finished.
+        """
+        if self._executor is None:
+            return True
+
+        start = time.perf_counter()
+        done, pending = wait_futures(self._tasks, timeout=timeout)
+        self._stats["wait_ms"] += (time.perf_counter() - start) * 1000
+        if pending:
+            get_printer().warning(f"{len(pending)} resources still loading")
+            return False
+        for future in done:
+            if future.exception() is not None:
+                get_printer().verbose_msg(f"Preload failed: {future.exception()}")
+
+        # Every task is done: release the worker threads
+        self._executor.shutdown(wait=False)
+        return True
+
+    # CONSUMERS
+    # ///////////////////////////////////////////////////////////////
+
+    def read_text(self, path: Path) -> str:
+        """
+        Return the content of a text file, preloaded if possible.
+
+        Parameters
+        ----------
+        path : Path
+            File to read.
+
+        Returns
+        -------
+        str
+            File content.
+        """
+        return self._take(self._texts, path, _read_text)
+
+    def load_translations(self, path: Path) -> Dict[str, str]:
+        """
+        Return the translations of a .ts file, preloaded if possible.
+
+        Parameters
+        ----------
+        path : Path
+            Translation file.
+
+        Returns
+        -------
+        Dict[str, str]
+            {source text: translation}
+        """
+        from ..translation.manager import parse_ts_file
+
+        return self._take(self._translations, path, parse_ts_file)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return task, hit and waiting statistics."""
+        stats = dict(self._stats)
+        finished = [future for future in self._tasks if future.done()]
+        stats["errors"] = sum(future.exception() is not None for future in finished)
+        stats["pending"] = len(self._tasks) - len(finished)
+        return stats
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _submit(self, func: Callable, *args: Any) -> Future:
+        self._stats["tasks"] += 1
+        # No done callback: a bound method stored in the future would put
+        # the preloader (and the config manager, which may own Qt objects)
+        # in a reference cycle, collected by whichever thread runs the GC
+        future = self._executor.submit(func, *args)
+        self._tasks.append(future)
+        return future
+
+    def _take(
+        self, futures: Dict[str, Future], path: Path, load: Callable[[Path], Any]
+    ) -> Any:
+        with self._lock:
+            future = futures.pop(str(path), None)
+        if future is not None:
+            try:
+                result = future.result()
+                self._stats["hits"] += 1
+                return result
+            except Exception:
+                # The error is raised again by the direct load
+                pass
+        return load(Path(path))
+
+    def _preload_theme(self, resolver, theme_file: str) -> None:
+        path = resolve_theme_file(resolver, theme_file)
+        if path is not None:
+            self._put(self._texts, path, _read_text)
+
+    def _preload_translations(self, resolver) -> None:
+        from ..translation.config import SUPPORTED_LANGUAGES
+        from ..translation.manager import parse_ts_file
+
+        app_config = self._configs["app"].result() or {}
+        panel = app_config.get("settings_panel") or {}
+        language = (panel.get("language") or {}).get("default", "English")
+        for info in SUPPORTED_LANGUAGES.values():
+            if info["name"] == language:
+                directory = resolver.resolve_dir(TRANSLATIONS)
+                if directory is not None:
+                    self._put(
+                        self._translations, directory / info["file"], parse_ts_file
+                    )
+                return
+
+    def _put(
+        self, futures: Dict[str, Future], path: Path, load: Callable[[Path], Any]
+    ) -> None:
+        # Runs in a worker: the load itself is a finished future
+        future: Future = Future()
+        try:
+            future.set_result(load(path))
+        except Exception as e:
+            future.set_exception(e)
+        with self._lock:
+            futures[str(path)] = future
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _read_text(path: Path) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# Global preloader instance
+_preloader = None
+
+
+def get_preloader() -> ResourcePreloader:
+    """Return global resource preloader instance"""
+    global _preloader
+    if _preloader is None:
+        _preloader = ResourcePreloader()
+    return _preloader
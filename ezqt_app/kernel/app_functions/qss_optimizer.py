@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+QSS Optimizer for EzQt_App
+==========================
+
+Build-time reduction of QSS themes. Qt parses the whole stylesheet on
+each ``setStyleSheet``, at a cost growing with the number of rules:
+
+- ``minify_qss`` drops comments, blank rules and insignificant whitespace;
+- ``prune_qss`` drops the selectors whose ``#objectName`` is never given
+  to a widget of the application, and the rules left without selector.
+
+Object names are collected from the ``setObjectName("...")`` calls of the
+Python sources and the ``name`` attributes of Qt Designer files. For an
+f-string such as ``f"menu_{name}"`` every name starting with ``menu_`` is
+kept. Names set from variables cannot be found and must be given with
+``keep``.
+
+Optimized themes are written next to their source as ``<stem>.min.qss``
+and used by ``resolve_theme_file`` as long as they are up to date.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import re
+import time
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .qss_template import get_qss_template
+from .resource_resolver import THEMES
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Suffix of optimized themes: main_theme.qss -> main_theme.min.qss
+OPTIMIZED_SUFFIX = ".min.qss"
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+OBJECT_NAME_PATTERN = re.compile(r"#([A-Za-z_][A-Za-z0-9_\-]*)")
+SET_OBJECT_NAME_PATTERN = re.compile(r"""setObjectName\(\s*(f?)u?(["'])(.*?)\2\s*\)""")
+UI_NAME_PATTERN = re.compile(r"""<(?:widget|layout)\b[^>]*\bname="([^"]+)\"""")
+
+# Directories never scanned for object names
+EXCLUDED_DIRS = {
+    "bin",
+    "build",
+    "dist",
+    "env",
+    "venv",
+    "node_modules",
+    "site-packages",
+    "__pycache__",
+}
+
+## ==> VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# QApplication created to measure parse times outside of an application
+_parse_app = None
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def parse_rules(text: str) -> List[Tuple[str, str]]:
+    """
+    Split a stylesheet into (selectors, declarations) rules.
+
+    Parameters
+    ----------
+    text : str
+        QSS source.
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        Rules in source order, comments removed.
+
+    Raises
+    ------
+    ValueError
+        If a rule is not closed.
+    """
+    text = COMMENT_PATTERN.sub("", text)
+    rules = []
+    position = 0
+    while True:
+        start = text.find("{", position)
+        if start == -1:
+            break
+        end = text.find("}", start)
+        if end == -1:
+            raise ValueError(f"Unclosed QSS rule at offset {start}")
+        rules.append((text[position:start].strip(), text[start + 1 : end].strip()))
+        position = end + 1
+    return rules
+
+
+def minify_qss(text: str) -> str:
+    """
+    Return a stylesheet without comments, empty rules and extra spaces.
+
+    Palette variables (``$_name``) are kept as is.
+    """
+    return _join_rules(_minify_rule(s, d) for s, d in parse_rules(text))
+
+
+def prune_qss(
+    text: str, object_names: Iterable[str], prefixes: Iterable[str] = ()
+) -> Tuple[str, List[str]]:
+    """
+    Drop the selectors referring to object names absent from the application.
+
+    Parameters
+    ----------
+    text : str
+        QSS source.
+    object_names : Iterable[str]
+        Object names used by the application.
+    prefixes : Iterable[str], optional
+        Prefixes of object names built at runtime (e.g., "menu_").
+
+    Returns
+    -------
+    Tuple[str, List[str]]
+        Minified stylesheet and removed selectors.
+    """
+    names = set(object_names)
+    prefixes = tuple(prefixes)
+    kept_rules = []
+    removed = []
+    for selectors, declarations in parse_rules(text):
+        kept = []
+        for selector in _split_selectors(selectors):
+            if all(
+                name in names or name.startswith(prefixes)
+                for name in OBJECT_NAME_PATTERN.findall(selector)
+            ):
+                kept.append(selector)
+            else:
+                removed.append(selector)
+        if kept:
+            kept_rules.append(_minify_rule(",".join(kept), declarations))
+    return _join_rules(kept_rules), removed
+
+
+def collect_object_names(paths: Iterable[Path]) -> Tuple[Set[str], Set[str]]:
+    """
+    Collect the object names given in Python sources and Designer files.
+
+    Parameters
+    ----------
+    paths : Iterable[Path]
+        Files or directories to scan.
+
+    Returns
+    -------
+    Tuple[Set[str], Set[str]]
+        Literal object names and prefixes of names built by f-strings.
+    """
+    names: Set[str] = set()
+    prefixes: Set[str] = set()
+    for source in _iter_sources(paths):
+        try:
+            content = source.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+        if source.suffix == ".ui":
+            names.update(UI_NAME_PATTERN.findall(content))
+            continue
+        for is_fstring, _, value in SET_OBJECT_NAME_PATTERN.findall(content):
+            if is_fstring and "{" in value:
+                prefix = value.split("{", 1)[0]
+                # f"{name}" gives no prefix, such names need ``keep``
+                if prefix:
+                    prefixes.add(prefix)
+            else:
+                names.add(value)
+    return names, prefixes
+
+
+def optimize_qss(
+    text: str,
+    object_names: Optional[Iterable[str]] = None,
+    prefixes: Iterable[str] = (),
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Minify a stylesheet and prune its unused selectors.
+
+    Parameters
+    ----------
+    text : str
+        QSS source.
+    object_names : Iterable[str], optional
+        Object names used by the application (None: minify only).
+    prefixes : Iterable[str], optional
+        Prefixes of object names built at runtime.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, Any]]
+        Optimized stylesheet and report (rule counts, sizes, removed
+        selectors).
+    """
+    rules_before = len(parse_rules(text))
+    if object_names is None:
+        optimized, removed = minify_qss(text), []
+    else:
+        optimized, removed = prune_qss(text, object_names, prefixes)
+
+    return optimized, {
+        "rules_before": rules_before,
+        "rules_after": len(parse_rules(optimized)),
+        "bytes_before": len(text.encode("utf-8")),
+        "bytes_after": len(optimized.encode("utf-8")),
+        "removed_selectors": removed,
+    }
+
+
+def measure_parse_time(
+    stylesheet: str, palette: Optional[Mapping[str, str]] = None, repeat: int = 5
+) -> Optional[float]:
+    """
+    Measure how long Qt takes to parse and apply a stylesheet.
+
+    An offscreen QApplication is created if the process has none.
+
+    Parameters
+    ----------
+    stylesheet : str
+        QSS source.
+    palette : Mapping[str, str], optional
+        Palette the stylesheet is rendered with first.
+    repeat : int, optional
+        Number of measures (default: 5).
+
+    Returns
+    -------
+    float, optional
+        Best time in milliseconds, None if Qt widgets are not available.
+    """
+    global _parse_app
+    try:
+        from PySide6.QtWidgets import QApplication, QLabel, QWidget
+    except ImportError:
+        return None
+
+    if QApplication.instance() is None:
+        _parse_app = QApplication(["ezqt_qss", "-platform", "offscreen"])
+    if palette:
+        stylesheet = get_qss_template(stylesheet).render(palette)
+
+    best = None
+    for _ in range(repeat):
+        # A new widget each time: Qt caches the parsed sheet per widget
+        host = QWidget()
+        label = QLabel(host)
+        start = time.perf_counter()
+        host.setStyleSheet(stylesheet)
+        label.ensurePolished()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+        host.deleteLater()
+    return best
+
+
+def get_optimized_path(theme_path: Path) -> Path:
+    """Return the path of the optimized version of a theme."""
+    return theme_path.with_name(theme_path.stem + OPTIMIZED_SUFFIX)
+
+
+def resolve_theme_file(resolver, theme_file: str) -> Optional[Path]:
+    """
+    Resolve a theme file, preferring its optimized version.
+
+    The optimized theme is only used when it is not older than its
+    source, so editing the source takes effect without optimizing again.
+
+    Parameters
+    ----------
+    resolver : ResourceResolver
+        Resolver locating the source theme.
+    theme_file : str
+        Theme file name (e.g., "main_theme.qss").
+
+    Returns
+    -------
+    Path, optional
+        Theme to load, or None if the source does not exist.
+    """
+    source = resolver.resolve(THEMES, theme_file)
+    if source is None or source.name.endswith(OPTIMIZED_SUFFIX):
+        return source
+
+    optimized = get_optimized_path(source)
+    try:
+        if optimized.stat().st_mtime >= source.stat().st_mtime:
+            return optimized
+    except OSError:
+        pass
+    return source
+
+
+# ////// UTILITY FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _split_selectors(selectors: str) -> List[str]:
+    return [" ".join(s.split()) for s in selectors.split(",") if s.strip()]
+
+
+def _minify_rule(selectors: str, declarations: str) -> str:
+    items = []
+    for declaration in declarations.split(";"):
+        name, colon, value = declaration.partition(":")
+        if colon and name.strip():
+            items.append(f"{name.strip()}:{' '.join(value.split())}")
+    if not items:
+        return ""
+    return f"{','.join(_split_selectors(selectors))}{{{';'.join(items)}}}"
+
+
+def _join_rules(rules: Iterable[str]) -> str:
+    return "\n".join(rule for rule in rules if rule)
+
+
+def _iter_sources(paths: Iterable[Path]):
+    for path in paths:
+        path = Path(path)
+        if path.is_file():
+            yield path
+        elif path.is_dir():
+            for source in path.rglob("*"):
+                if source.suffix not in (".py", ".ui") or not source.is_file():
+                    continue
+                parts = source.relative_to(path).parts[:-1]
+                if any(p in EXCLUDED_DIRS or p.startswith(".") for p in parts):
+                    continue
+                yield source
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+QSS Template for EzQt_App
+=========================
+
+Compiled form of a QSS theme using palette variables (``$_main_surface``,
+``$_accent_color1``...). The stylesheet is tokenized once into literal
+segments and variable slots; rendering it for a palette fills the slots
+and joins the segments, a single pass whatever the number of variables.
+
+Variables are matched as whole tokens, so ``$_accent_color1`` is never
+mistaken for a prefix of ``$_accent_color10``. Compiled templates are
+cached by content hash.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Dict, List, Mapping, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Palette variable: "$_" followed by the longest run of word characters
+VARIABLE_PATTERN = re.compile(r"(\$_[A-Za-z0-9_]+)")
+
+# Compiled templates kept in memory (least recently used dropped first)
+MAX_CACHED_TEMPLATES = 16
+
+## ==> VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+_templates: "OrderedDict[str, QssTemplate]" = OrderedDict()
+_templates_lock = threading.Lock()
+_stats: Dict[str, int] = {"hits": 0, "compiles": 0}
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class QssTemplate:
+    """
+    Stylesheet split into literal segments and variable slots.
+
+    Parameters
+    ----------
+    text : str
+        QSS source.
+    digest : str, optional
+        Content hash of ``text`` (computed if not given).
+    """
+
+    __slots__ = ("digest", "variables", "_segments", "_slots")
+
+    def __init__(self, text: str, digest: str = "") -> None:
+        self.digest = digest or content_hash(text)
+        # Odd indices hold the variable names
+        self._segments: List[str] = VARIABLE_PATTERN.split(text)
+        self._slots: Tuple[Tuple[int, str], ...] = tuple(
+            (i, self._segments[i]) for i in range(1, len(self._segments), 2)
+        )
+        self.variables = frozenset(name for _, name in self._slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Render the stylesheet for a palette.
+
+        Parameters
+        ----------
+        values : Mapping[str, str]
+            {variable: value}. Variables without a value are kept as is.
+
+        Returns
+        -------
+        str
+            Rendered stylesheet.
+        """
+        segments = self._segments.copy()
+        for i, name in self._slots:
+            value = values.get(name)
+            if value is not None:
+                segments[i] = str(value)
+        style = "".join(segments)
+
+        # Keys that are not "$_" variables keep the former plain
+        # substitution, longest first so prefixes do not clash
+        legacy = [key for key in values if not VARIABLE_PATTERN.fullmatch(key)]
+        for key in sorted(legacy, key=len, reverse=True):
+            style = style.replace(key, str(values[key]))
+        return style
+
+    def missing(self, values: Mapping[str, str]) -> List[str]:
+        """Return the variables used by the stylesheet but not in values."""
+        return sorted(self.variables.difference(values))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def content_hash(text: str) -> str:
+    """Return the hash identifying a stylesheet content."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_qss_template(text: str) -> QssTemplate:
+    """
+    Return the compiled template of a stylesheet, cached by content hash.
+
+    Parameters
+    ----------
+    text : str
+        QSS source.
+
+    Returns
+    -------
+    QssTemplate
+        Compiled template.
+    """
+    digest = content_hash(text)
+    with _templates_lock:
+        template = _templates.get(digest)
+        if template is not None:
+            _templates.move_to_end(digest)
+            _stats["hits"] += 1
+            return template
+
+    template = QssTemplate(text, digest)
+    with _templates_lock:
+        _stats["compiles"] += 1
+        _templates[digest] = template
+        while len(_templates) > MAX_CACHED_TEMPLATES:
+            _templates.popitem(last=False)
+    return template
+
+
+def render_qss(text: str, values: Mapping[str, str]) -> str:
+    """Render a stylesheet for a palette through its compiled template."""
+    return get_qss_template(text).render(values)
+
+
+def get_template_stats() -> Dict[str, int]:
+    """Return template cache statistics."""
+    with _templates_lock:
+        stats = dict(_stats)
+        stats["entries"] = len(_templates)
+    return stats
+
+
+def clear_template_cache() -> None:
+    """Drop every compiled template."""
+    with _templates_lock:
+        _templates.clear()
+        _stats.update(hits=0, compiles=0)
@@ -68,8 +68,10 @@ class ResourceManager:
             fonts = get_package_resource("resources/fonts")
             source = "Package"
         else:
-            fonts = APP_PATH / r"bin\fonts"
+            fonts = APP_PATH / "bin" / "fonts"
             source = "Application"
+            if not fonts.is_dir():
+                return
 
         # LOAD FONTS
         for font in fonts.iterdir():
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Resource Resolver for EzQt_App
+==============================
+
+Single place where configuration files, themes and translations are
+located on disk. The search roots are computed once, and the resolved
+location of each named resource is memoized until the project root
+changes or a watched resource directory changes.
+
+Search order for a resource ``<kind>/<name>``:
+
+1. Project root: ``<project>/bin/<kind>/<name>``
+2. Current directory: ``<cwd>/bin/<kind>/<name>``
+3. Application directory: ``<APP_PATH>/bin/<kind>/<name>``
+4. Package resources: ``ezqt_app/resources/<kind>/<name>``
+5. Frozen bundle: ``<_MEIPASS>/ezqt_app/resources/<kind>/<name>``
+
+The first three roots form the "project" scope and the last two the
+"package" scope; a lookup can be restricted to either of them.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import os
+import sys
+import threading
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ..common import APP_PATH
+from .printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Dict, List, Optional, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Resource kinds known by the resolver (sub-directory of each root)
+CONFIG = "config"
+THEMES = "themes"
+TRANSLATIONS = "translations"
+
+# Lookup scopes (subsets of the search roots)
+PROJECT_SCOPE = "project"
+PACKAGE_SCOPE = "package"
+
+PACKAGE_RESOURCES_DIR = Path(__file__).resolve().parent.parent.parent / "resources"
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ResourceResolver:
+    """
+    Cached locator for on-disk EzQt_App resources.
+
+    Resolution results are memoized per (kind, name, scope). Entries are
+    dropped when the project root changes, when ``invalidate`` is called,
+    or when a watched resource directory reports a change.
+    """
+
+    def __init__(self) -> None:
+        self._project_root: Optional[Path] = None
+        self._roots: Optional[List[Path]] = None
+        self._package_roots: List[Path] = []
+        self._resolved: Dict[Tuple[str, str, Optional[str]], Path] = {}
+        self._watcher = None
+        self._watched_kinds: Dict[str, str] = {}
+        # Directories resolved from worker threads, watched later
+        self._deferred_watches: Dict[str, str] = {}
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    # SEARCH ROOTS
+    # ///////////////////////////////////////////////////////////////
+
+    def set_project_root(self, project_root: Optional[Path]) -> None:
+        """
+        Set the project root and drop every memoized location.
+
+        Parameters
+        ----------
+        project_root : Path, optional
+            Path to the project root directory.
+        """
+        project_root = Path(project_root) if project_root else None
+        if project_root == self._project_root and self._roots is not None:
+            return
+        self._project_root = project_root
+        self.refresh_roots()
+
+    def get_project_root(self) -> Optional[Path]:
+        """Return the project root directory."""
+        return self._project_root
+
+    def refresh_roots(self) -> None:
+        """Recompute the search roots and drop every memoized location."""
+        self._roots = None
+        self.invalidate()
+
+    def get_search_roots(self, scope: Optional[str] = None) -> List[Path]:
+        """
+        Return the search roots in priority order.
+
+        Parameters
+        ----------
+        scope : str, optional
+            Only return the roots of this scope ("project" or "package").
+
+        Returns
+        -------
+        List[Path]
+            Directories whose ``<kind>`` sub-directories hold resources.
+        """
+        if self._roots is None:
+            roots = []
+            if self._project_root:
+                roots.append(self._project_root / "bin")
+            roots.append(Path.cwd() / "bin")
+            roots.append(APP_PATH / "bin")
+            package_roots = [PACKAGE_RESOURCES_DIR]
+            if hasattr(sys, "_MEIPASS"):
+                package_roots.append(Path(sys._MEIPASS) / "ezqt_app" / "resources")
+            roots.extend(package_roots)
+
+            # Remove duplicates while keeping priority order
+            unique_roots = []
+            seen = set()
+            for root in roots:
+                key = os.path.normcase(os.path.abspath(root))
+                if key not in seen:
+                    seen.add(key)
+                    unique_roots.append(root)
+            self._roots = unique_roots
+            self._package_roots = [r for r in unique_roots if r in package_roots]
+
+        if scope == PACKAGE_SCOPE:
+            return self._package_roots
+        if scope == PROJECT_SCOPE:
+            return [r for r in self._roots if r not in self._package_roots]
+        return self._roots
+
+    # RESOLUTION
+    # ///////////////////////////////////////////////////////////////
+
+    def candidates(
+        self, kind: str, name: str = "", scope: Optional[str] = None
+    ) -> List[Path]:
+        """
+        Return every candidate location of a resource, in priority order.
+
+        Parameters
+        ----------
+        kind : str
+            Resource kind ("config", "themes", "translations").
+        name : str, optional
+            Resource file name. An empty name targets the directory itself.
+        scope : str, optional
+            Only search the roots of this scope ("project" or "package").
+
+        Returns
+        -------
+        List[Path]
+            Candidate paths.
+        """
+        paths = [root / kind for root in self.get_search_roots(scope)]
+        return [path / name for path in paths] if name else paths
+
+    def resolve(
+        self, kind: str, name: str, scope: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Return the first existing location of a resource file.
+
+        Parameters
+        ----------
+        kind : str
+            Resource kind ("config", "themes", "translations").
+        name : str
+            Resource file name (e.g., "app.yaml").
+        scope : str, optional
+            Only search the roots of this scope ("project" or "package").
+
+        Returns
+        -------
+        Path, optional
+            Resolved path, or None if the resource does not exist anywhere.
+        """
+        if self._deferred_watches:
+            self._watch_deferred()
+        key = (kind, name, scope)
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            self._stats["hits"] += 1
+            return resolved
+
+        self._stats["misses"] += 1
+        for path in self.candidates(kind, name, scope):
+            if path.exists():
+                self._resolved[key] = path
+                self._watch_directory(kind, path.parent)
+                return path
+        return None
+
+    def resolve_dir(self, kind: str) -> Optional[Path]:
+        """
+        Return the first existing directory of a resource kind.
+
+        Parameters
+        ----------
+        kind : str
+            Resource kind ("config", "themes", "translations").
+
+        Returns
+        -------
+        Path, optional
+            Resolved directory, or None if it does not exist anywhere.
+        """
+        if self._deferred_watches:
+            self._watch_deferred()
+        key = (kind, "", None)
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            self._stats["hits"] += 1
+            return resolved
+
+        self._stats["misses"] += 1
+        for path in self.candidates(kind):
+            if path.is_dir():
+                self._resolved[key] = path
+                self._watch_directory(kind, path)
+                return path
+        return None
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Drop memoized locations.
+
+        Parameters
+        ----------
+        kind : str, optional
+            Only drop locations of this resource kind (default: all).
+        """
+        if kind is None:
+            self._resolved.clear()
+        else:
+            for key in [k for k in self._resolved if k[0] == kind]:
+                del self._resolved[key]
+        self._stats["invalidations"] += 1
+
+    def get_generation(self) -> int:
+        """
+        Return a counter incremented whenever memoized locations are dropped.
+
+        Callers caching the content of resolved files compare it to know
+        when to read them again.
+        """
+        return self._stats["invalidations"]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return memoization statistics."""
+        stats = dict(self._stats)
+        stats["entries"] = len(self._resolved)
+        return stats
+
+    # ////// DIRECTORY WATCHING
+    # ///////////////////////////////////////////////////////////////
+
+    def _watch_directory(self, kind: str, directory: Path) -> None:
+        """Watch a resource directory when a Qt application is running."""
+        directory_key = str(directory)
+        if directory_key in self._watched_kinds:
+            return
+
+        if threading.current_thread() is not threading.main_thread():
+            # The watcher belongs to the GUI thread. Qt is not queried from
+            # here: QThread.currentThread() would adopt the Python thread.
+            self._deferred_watches[directory_key] = kind
+            return
+
+        try:
+            from PySide6.QtCore import QCoreApplication, QFileSystemWatcher
+
+            if QCoreApplication.instance() is None:
+                return
+            if self._watcher is None:
+                self._watcher = QFileSystemWatcher()
+                self._watcher.directoryChanged.connect(self._on_directory_changed)
+            if self._watcher.addPath(directory_key):
+                self._watched_kinds[directory_key] = kind
+        except Exception as e:
+            get_printer().verbose_msg(f"Could not watch {directory}: {e}")
+
+    def _watch_deferred(self) -> None:
+        """Watch the directories resolved from worker threads."""
+        deferred = dict(self._deferred_watches)
+        for directory_key, kind in deferred.items():
+            self._deferred_watches.pop(directory_key, None)
+            self._watch_directory(kind, Path(directory_key))
+
+    def _on_directory_changed(self, directory: str) -> None:
+        kind = self._watched_kinds.get(directory)
+        if kind is not None:
+            get_printer().verbose_msg(f"Resource directory changed: {directory}")
+            self.invalidate(kind)
+
+
+# Global resource resolver instance
+_resource_resolver = None
+
+
+def get_resource_resolver() -> ResourceResolver:
+    """Return global resource resolver instance"""
+    global _resource_resolver
+    if _resource_resolver is None:
+        _resource_resolver = ResourceResolver()
+    return _resource_resolver
@@ -24,8 +24,15 @@
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
-import yaml
 from .printer import get_printer
+from .yaml_backend import safe_load
+from .pixmap_cache import get_pixmap_cache
+from .settings_model import (
+    AppSettingsModel,
+    SettingsValidationError,
+    compile_app_settings,
+    set_app_settings_model,
+)
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
@@ -59,57 +66,83 @@ class SettingsManager:
         """
         Load application settings.
 
+        app.yaml is validated and compiled into a slotted settings model
+        (see ``get_app_settings_model``) before ``Settings`` is updated.
+
         Parameters
         ----------
         yaml_file : Optional[Path], optional
-            YAML file to use (default: uses default file).
+            YAML file to use (default: app configuration of the project,
+            or of the package).
 
         Returns
         -------
         Dict[str, str]
             Loaded settings.
+
+        Raises
+        ------
+        SettingsValidationError
+            If app.yaml is unusable. Problems of single settings are only
+            reported as warnings (see ``compile_app_settings``).
         """
-        from .config_manager import get_package_resource
+        from .config_manager import get_config_manager
 
         # LOAD APP DATA
-        if not yaml_file:
-            yaml_file = get_package_resource("app.yaml")
-
-        with open(yaml_file, "r", encoding="utf-8") as file:
-            data = yaml.safe_load(file)
-            app_data = data.get("app", {})
-
-        # SET APP SETTINGS
-        Settings.App.NAME = app_data["name"]
-        Settings.App.DESCRIPTION = app_data["description"]
-        Settings.App.ENABLE_CUSTOM_TITLE_BAR = True
+        if yaml_file:
+            with open(yaml_file, "r", encoding="utf-8") as file:
+                data = safe_load(file)
+        else:
+            data = get_config_manager().load_config("app")
 
-        # SET DIMENSIONS
-        Settings.App.APP_MIN_SIZE = QSize(
-            app_data["app_min_width"], app_data["app_min_height"]
-        )
-        Settings.App.APP_WIDTH = app_data["app_width"]
-        Settings.App.APP_HEIGHT = app_data["app_height"]
-
-        # SET GUI SETTINGS
-        # Load theme from settings_panel if it exists, otherwise from app
         try:
-            settings_panel = data.get("settings_panel", {})
-            Settings.Gui.THEME = settings_panel.get("theme", {}).get(
-                "default", app_data["theme"]
-            )
-        except KeyError:
-            Settings.Gui.THEME = app_data["theme"]
-
-        Settings.Gui.MENU_PANEL_EXTENDED_WIDTH = app_data["menu_panel_extended_width"]
-        Settings.Gui.MENU_PANEL_SHRINKED_WIDTH = app_data["menu_panel_shrinked_width"]
-        Settings.Gui.SETTINGS_PANEL_WIDTH = app_data["settings_panel_width"]
-        Settings.Gui.TIME_ANIMATION = app_data["time_animation"]
+            model = compile_app_settings(data)
+        except SettingsValidationError as e:
+            for error in e.errors:
+                get_printer().error(f"[AppKernel] {error}")
+            raise
+        for warning in model.warnings:
+            get_printer().warning(f"[AppKernel] {warning}")
+        set_app_settings_model(model)
+        SettingsManager.apply_settings_model(model)
 
         # PRINT STATUS AND CONFIGURATION
         from .printer import Printer
 
+        app_data = data.get("app", {})
         printer = Printer(verbose=True)  # Force verbose mode to display ASCII frame
         printer.config_display(app_data)
 
         return app_data
+
+    @staticmethod
+    def apply_settings_model(model: AppSettingsModel) -> None:
+        """
+        Copy a compiled settings model into ``Settings``.
+
+        Parameters
+        ----------
+        model : AppSettingsModel
+            Validated application settings.
+        """
+        app = model.app
+
+        # SET APP SETTINGS
+        Settings.App.NAME = app.name
+        Settings.App.DESCRIPTION = app.description
+        Settings.App.ENABLE_CUSTOM_TITLE_BAR = True
+
+        # SET DIMENSIONS
+        Settings.App.APP_MIN_SIZE = QSize(app.app_min_width, app.app_min_height)
+        Settings.App.APP_WIDTH = app.app_width
+        Settings.App.APP_HEIGHT = app.app_height
+
+        # SET GUI SETTINGS
+        Settings.Gui.THEME = model.theme
+        Settings.Gui.THEME_MODE = app.theme_mode
+        Settings.Gui.RESTYLE_BUDGET_MS = app.restyle_budget_ms
+        get_pixmap_cache().set_budget(app.pixmap_cache_kb * 1024)
+        Settings.Gui.MENU_PANEL_EXTENDED_WIDTH = app.menu_panel_extended_width
+        Settings.Gui.MENU_PANEL_SHRINKED_WIDTH = app.menu_panel_shrinked_width
+        Settings.Gui.SETTINGS_PANEL_WIDTH = app.settings_panel_width
+        Settings.Gui.TIME_ANIMATION = app.time_animation
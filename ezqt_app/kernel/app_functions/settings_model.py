@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Settings Model for EzQt_App
+===========================
+
+Compiled, read-only view of app.yaml. The document is validated once,
+every problem being reported together, and turned into a tree of
+``__slots__`` objects: hot code reads ``model.app.app_width`` or
+``model.settings_panel.language.default`` instead of chaining
+``dict.get`` calls with fallbacks.
+
+Only an unusable ``app`` section is an error. Problems of a single
+setting (unknown type, default outside of its options or bounds, ...)
+are listed in ``model.warnings`` and replaced by a fallback: the
+settings panel still shows the setting.
+
+The ``settings_panel`` section has no fixed schema: a slotted class with
+one attribute per setting key is generated for it (and reused for
+documents with the same keys). Keys that are not Python identifiers are
+only available through ``settings_panel.get(key)``.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import keyword
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+THEMES = ("dark", "light")
+# "stylesheet": one rendered stylesheet per theme, "palette": see palette_theme
+THEME_MODES = ("stylesheet", "palette")
+SETTING_TYPES = ("toggle", "select", "slider", "checkbox", "text")
+DEFAULT_LANGUAGE = "English"
+# Byte budget of the recolored icons (see pixmap_cache)
+DEFAULT_PIXMAP_CACHE_KB = 8192
+
+# (field, minimum) of the app section integers
+_APP_INT_FIELDS: Tuple[Tuple[str, int], ...] = (
+    ("app_width", 1),
+    ("app_min_width", 1),
+    ("app_height", 1),
+    ("app_min_height", 1),
+    ("menu_panel_shrinked_width", 0),
+    ("menu_panel_extended_width", 0),
+    ("settings_panel_width", 0),
+    ("time_animation", 0),
+)
+
+## ==> VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+_panel_classes: Dict[Tuple[str, ...], type] = {}
+_current_model: Optional["AppSettingsModel"] = None
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class SettingsValidationError(ValueError):
+    """Raised when app.yaml does not match the settings schema."""
+
+    def __init__(self, errors: List[str]) -> None:
+        self.errors = list(errors)
+        super().__init__(
+            "Invalid application settings:\n"
+            + "\n".join(f"  - {error}" for error in self.errors)
+        )
+
+
+class AppSection:
+    """The ``app`` section of app.yaml."""
+
+    __slots__ = (
+        "name",
+        "description",
+        "theme_mode",
+        "restyle_budget_ms",
+        "pixmap_cache_kb",
+    ) + tuple(name for name, _ in _APP_INT_FIELDS)
+
+    def __init__(self, **values: Any) -> None:
+        for name in self.__slots__:
+            setattr(self, name, values[name])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the section as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SettingEntry:
+    """One entry of the ``settings_panel`` section."""
+
+    __slots__ = (
+        "key",
+        "type",
+        "label",
+        "description",
+        "default",
+        "enabled",
+        "options",
+        "min",
+        "max",
+        "unit",
+    )
+
+    def __init__(self, key: str, config: Dict[str, Any]) -> None:
+        self.key = key
+        self.type = config.get("type", "text")
+        self.label = config.get("label", key)
+        self.description = config.get("description", "")
+        self.default = config.get("default")
+        self.enabled = config.get("enabled", True)
+        self.options = tuple(config.get("options", ()))
+        self.min = config.get("min", 0)
+        self.max = config.get("max", 100)
+        self.unit = config.get("unit", "")
+
+    def __repr__(self) -> str:
+        return f"SettingEntry({self.key!r}, {self.type!r}, default={self.default!r})"
+
+
+class SettingsPanelSection:
+    """
+    Base of the generated ``settings_panel`` classes.
+
+    Subclasses get one slot per setting key that is a Python identifier.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries: List[SettingEntry]) -> None:
+        self._entries = {entry.key: entry for entry in entries}
+        for key in type(self).__slots__:
+            setattr(self, key, self._entries[key])
+
+    def __iter__(self) -> Iterator[SettingEntry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the setting keys, in file order."""
+        return tuple(self._entries)
+
+    def get(self, key: str) -> Optional[SettingEntry]:
+        """Return a setting by key, or None."""
+        return self._entries.get(key)
+
+    def default(self, key: str, fallback: Any = None) -> Any:
+        """Return the default value of a setting, or ``fallback``."""
+        entry = self.get(key)
+        if entry is None or entry.default is None:
+            return fallback
+        return entry.default
+
+
+class AppSettingsModel:
+    """Compiled view of app.yaml."""
+
+    __slots__ = ("app", "settings_panel", "theme", "language", "warnings")
+
+    def __init__(
+        self,
+        app: AppSection,
+        settings_panel: SettingsPanelSection,
+        theme: str,
+        language: str,
+        warnings: Tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.settings_panel = settings_panel
+        # Effective values, resolved once from settings_panel then app
+        self.theme = theme
+        self.language = language
+        # Problems replaced by a fallback value
+        self.warnings = warnings
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def compile_app_settings(data: Any) -> AppSettingsModel:
+    """
+    Validate an app.yaml document and compile it into a settings model.
+
+    Parameters
+    ----------
+    data : Any
+        Parsed app.yaml document.
+
+    Returns
+    -------
+    AppSettingsModel
+        Compiled settings. Problems of the ``settings_panel`` section are
+        listed in its ``warnings`` and replaced by fallback values.
+
+    Raises
+    ------
+    SettingsValidationError
+        If the document or its ``app`` section is unusable. Every problem
+        found is listed, not only the first one.
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+    if not isinstance(data, dict):
+        raise SettingsValidationError(["document must be a mapping"])
+
+    app_data = data.get("app")
+    if not isinstance(app_data, dict):
+        errors.append("'app' section is missing or is not a mapping")
+        app_data = {}
+    panel_data = data.get("settings_panel") or {}
+    if not isinstance(panel_data, dict):
+        warnings.append("'settings_panel' section is not a mapping, ignored")
+        panel_data = {}
+
+    app_values = _validate_app(app_data, errors)
+    entries = [
+        _validate_setting(key, config, warnings) for key, config in panel_data.items()
+    ]
+
+    if errors:
+        raise SettingsValidationError(errors)
+
+    theme = app_values.pop("theme")
+    theme_entry = panel_data.get("theme")
+    if isinstance(theme_entry, dict) and theme_entry.get("default") is not None:
+        if str(theme_entry["default"]).lower() in THEMES:
+            theme = str(theme_entry["default"]).lower()
+        else:
+            warnings.append(
+                f"settings_panel.theme.default must be one of {THEMES}, "
+                f"using {theme!r}"
+            )
+
+    panel_class = _get_panel_class(
+        tuple(entry.key for entry in entries if _is_slot_name(entry.key))
+    )
+    settings_panel = panel_class(entries)
+
+    language = settings_panel.default("language", DEFAULT_LANGUAGE)
+    return AppSettingsModel(
+        AppSection(**app_values),
+        settings_panel,
+        theme,
+        str(language),
+        tuple(warnings),
+    )
+
+
+def set_app_settings_model(model: Optional[AppSettingsModel]) -> None:
+    """Set the settings model of the running application."""
+    global _current_model
+    _current_model = model
+
+
+def get_app_settings_model() -> Optional[AppSettingsModel]:
+    """Return the settings model of the running application, if loaded."""
+    return _current_model
+
+
+# ////// UTILITY FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_app(app_data: Dict[str, Any], errors: List[str]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+
+    name = app_data.get("name")
+    if not isinstance(name, str) or not name:
+        errors.append("app.name must be a non-empty string")
+    values["name"] = name
+    description = app_data.get("description", "")
+    if not isinstance(description, str):
+        errors.append("app.description must be a string")
+    values["description"] = description
+
+    for field, minimum in _APP_INT_FIELDS:
+        value = app_data.get(field)
+        if not _is_int(value):
+            errors.append(f"app.{field} must be an integer")
+        elif value < minimum:
+            errors.append(f"app.{field} must be >= {minimum}")
+        values[field] = value
+
+    for size, minimum in (
+        ("app_width", "app_min_width"),
+        ("app_height", "app_min_height"),
+    ):
+        if _is_int(values[size]) and _is_int(values[minimum]):
+            if values[minimum] > values[size]:
+                errors.append(f"app.{minimum} must not exceed app.{size}")
+
+    theme = str(app_data.get("theme", "dark")).lower()
+    if theme not in THEMES:
+        errors.append(f"app.theme must be one of {THEMES}")
+    values["theme"] = theme
+
+    theme_mode = str(app_data.get("theme_mode", "stylesheet")).lower()
+    if theme_mode not in THEME_MODES:
+        errors.append(f"app.theme_mode must be one of {THEME_MODES}")
+    values["theme_mode"] = theme_mode
+
+    # Optional, 0: theme switches restyle every widget at once
+    restyle_budget_ms = app_data.get("restyle_budget_ms", 0)
+    if not _is_int(restyle_budget_ms):
+        errors.append("app.restyle_budget_ms must be an integer")
+    elif restyle_budget_ms < 0:
+        errors.append("app.restyle_budget_ms must be >= 0")
+    values["restyle_budget_ms"] = restyle_budget_ms
+
+    # Optional, 0: recolored icons are not cached
+    pixmap_cache_kb = app_data.get("pixmap_cache_kb", DEFAULT_PIXMAP_CACHE_KB)
+    if not _is_int(pixmap_cache_kb):
+        errors.append("app.pixmap_cache_kb must be an integer")
+    elif pixmap_cache_kb < 0:
+        errors.append("app.pixmap_cache_kb must be >= 0")
+    values["pixmap_cache_kb"] = pixmap_cache_kb
+    return values
+
+
+def _is_slot_name(key: str) -> bool:
+    return (
+        key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not hasattr(SettingsPanelSection, key)
+    )
+
+
+def _validate_setting(key: Any, config: Any, warnings: List[str]) -> SettingEntry:
+    key = str(key)
+    path = f"settings_panel.{key}"
+    if not _is_slot_name(key):
+        warnings.append(
+            f"{path}: key is not a Python identifier free in the model, "
+            "only available through settings_panel.get()"
+        )
+    if not isinstance(config, dict):
+        warnings.append(f"{path} must be a mapping, shown as text")
+        config = {}
+
+    entry = SettingEntry(key, config)
+    if entry.type not in SETTING_TYPES:
+        warnings.append(
+            f"{path}.type must be one of {SETTING_TYPES}, {entry.type!r} shown as text"
+        )
+        entry.type = "text"
+    if not isinstance(entry.enabled, bool):
+        warnings.append(f"{path}.enabled must be a boolean")
+        entry.enabled = bool(entry.enabled)
+
+    if entry.type == "select":
+        if not entry.options:
+            warnings.append(f"{path}.options must be a non-empty list, shown as text")
+            entry.type = "text"
+        elif entry.default is not None and entry.default not in entry.options:
+            warnings.append(
+                f"{path}.default must be one of its options, "
+                f"using {entry.options[0]!r}"
+            )
+            entry.default = entry.options[0]
+    elif entry.type == "slider":
+        if not _is_number(entry.min) or not _is_number(entry.max):
+            warnings.append(f"{path}.min and max must be numbers, using 0 and 100")
+            entry.min, entry.max = 0, 100
+        elif entry.min > entry.max:
+            warnings.append(f"{path}.min must not exceed max, bounds swapped")
+            entry.min, entry.max = entry.max, entry.min
+        if entry.default is not None and not (
+            _is_number(entry.default) and entry.min <= entry.default <= entry.max
+        ):
+            warnings.append(
+                f"{path}.default must be a number between min and max, "
+                f"using {entry.min!r}"
+            )
+            entry.default = entry.min
+    elif entry.type == "checkbox":
+        if entry.default is not None and not isinstance(entry.default, bool):
+            warnings.append(f"{path}.default must be a boolean")
+            entry.default = bool(entry.default)
+    return entry
+
+
+def _get_panel_class(keys: Tuple[str, ...]) -> type:
+    panel_class = _panel_classes.get(keys)
+    if panel_class is None:
+        panel_class = type(
+            "SettingsPanel", (SettingsPanelSection,), {"__slots__": keys}
+        )
+        _panel_classes[keys] = panel_class
+    return panel_class
@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Stylesheet Cache for EzQt_App
+=============================
+
+Cache of rendered stylesheets, keyed by the content hash of the QSS
+source, the hash of the palette and the theme name.
+
+- The QSS source text is read once and kept in memory until the caller
+  reports a new version of it (see ``render``).
+- Rendered stylesheets are kept in memory (most recently used ones) and
+  stored under ``bin/themes/.cache/``, so the next start renders nothing.
+
+Switching back to a theme used before neither touches the disk nor
+builds a new string.
+
+``ezqt init`` also writes one fully rendered stylesheet per palette next to
+the theme (``main_theme.dark.qss``, ``main_theme.light.qss``, see
+``write_rendered_themes``). ``load_rendered`` returns such a file as long
+as it is newer than its source and was rendered with the current palette.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+from .atomic_write import atomic_write
+from .qss_template import content_hash, get_qss_template
+from .qss_optimizer import OPTIMIZED_SUFFIX
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Rendered stylesheets kept in memory (least recently used dropped first)
+MAX_MEMORY_ENTRIES = 8
+
+# First line of the pre-rendered themes, identifying their inputs
+RENDERED_HEADER = (
+    "/* ezqt_app rendered theme={theme} source={source} palette={palette} */"
+)
+RENDERED_HEADER_PATTERN = re.compile(
+    r"/\* ezqt_app rendered theme=(\S+) source=(\w+) palette=(\w+) \*/"
+)
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class StylesheetCache:
+    """
+    Memory and disk cache of rendered stylesheets.
+
+    Parameters
+    ----------
+    cache_dir : Path, optional
+        Directory holding the rendered stylesheets (``bin/themes/.cache``).
+    enabled : bool, optional
+        Store rendered stylesheets on disk (default: True).
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True):
+        self._cache_dir = cache_dir
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        # source key -> (version, text, content hash)
+        self._sources: Dict[str, Tuple[Hashable, str, str]] = {}
+        # (content hash, palette hash, theme) -> rendered stylesheet
+        self._rendered: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        # (rendered file, mtime) -> (theme, palette hash, stylesheet)
+        self._prerendered: "OrderedDict[Tuple[str, int], Tuple[str, str, str]]" = (
+            OrderedDict()
+        )
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "disk_hits": 0,
+            "renders": 0,
+            "prerendered": 0,
+            "stale": 0,
+            "source_reads": 0,
+            "writes": 0,
+            "errors": 0,
+        }
+
+    # CONFIGURATION
+    # ///////////////////////////////////////////////////////////////
+
+    def set_cache_dir(self, cache_dir: Optional[Path]) -> None:
+        """Set the directory holding the rendered stylesheets."""
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+
+    def get_cache_dir(self) -> Optional[Path]:
+        """Return the directory holding the rendered stylesheets."""
+        return self._cache_dir
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Enable or disable the on-disk cache."""
+        self._enabled = enabled
+
+    def is_enabled(self) -> bool:
+        """Return True if rendered stylesheets are stored on disk."""
+        return self._enabled and self._cache_dir is not None
+
+    # RENDERING
+    # ///////////////////////////////////////////////////////////////
+
+    def render(
+        self,
+        source_key: str,
+        load: Callable[[], str],
+        palette: Mapping[str, Any],
+        theme: str,
+        version: Hashable = None,
+    ) -> str:
+        """
+        Return a stylesheet rendered for a palette.
+
+        Parameters
+        ----------
+        source_key : str
+            Identifier of the QSS source (e.g., its resolved path).
+        load : Callable[[], str]
+            Returns the QSS source text; only called when it is not cached.
+        palette : Mapping[str, Any]
+            {variable: color} of the theme.
+        theme : str
+            Theme name ("dark", "light").
+        version : Hashable, optional
+            Version of the source known by the caller. The source is read
+            again when it differs from the cached one.
+
+        Returns
+        -------
+        str
+            Rendered stylesheet.
+        """
+        _, text, digest = self._get_source(source_key, load, version)
+        key = (digest, palette_hash(palette), theme)
+
+        with self._lock:
+            style = self._rendered.get(key)
+            if style is not None:
+                self._rendered.move_to_end(key)
+                self._stats["hits"] += 1
+                return style
+
+        cache_file = self._cache_path(source_key, key)
+        style = self._read_cached(cache_file)
+        if style is None:
+            style = get_qss_template(text).render(palette)
+            self._stats["renders"] += 1
+            self._write_cached(cache_file, style)
+
+        with self._lock:
+            self._rendered[key] = style
+            while len(self._rendered) > MAX_MEMORY_ENTRIES:
+                self._rendered.popitem(last=False)
+        return style
+
+    def load_rendered(
+        self, theme_path: Path, palette: Mapping[str, Any], theme: str
+    ) -> Optional[str]:
+        """
+        Return the pre-rendered stylesheet of a theme, if up to date.
+
+        Parameters
+        ----------
+        theme_path : Path
+            QSS source the stylesheet was rendered from.
+        palette : Mapping[str, Any]
+            {variable: color} of the theme.
+        theme : str
+            Theme name ("dark", "light").
+
+        Returns
+        -------
+        str, optional
+            Rendered stylesheet, or None if it is missing, older than its
+            source or rendered with another palette.
+        """
+        rendered_path = get_rendered_path(theme_path, theme)
+        try:
+            rendered_mtime = rendered_path.stat().st_mtime_ns
+            if theme_path.stat().st_mtime_ns > rendered_mtime:
+                self._stats["stale"] += 1
+                return None
+        except OSError:
+            return None
+
+        key = (str(rendered_path), rendered_mtime)
+        with self._lock:
+            entry = self._prerendered.get(key)
+        if entry is None:
+            try:
+                style = rendered_path.read_text(encoding="utf-8")
+            except OSError as e:
+                self._stats["errors"] += 1
+                get_printer().verbose_msg(f"Could not read {rendered_path}: {e}")
+                return None
+            header = RENDERED_HEADER_PATTERN.match(style)
+            if header is None:
+                return None
+            entry = (header.group(1), header.group(3), style)
+            with self._lock:
+                self._prerendered[key] = entry
+                while len(self._prerendered) > MAX_MEMORY_ENTRIES:
+                    self._prerendered.popitem(last=False)
+
+        rendered_theme, rendered_palette, style = entry
+        if rendered_theme != theme or rendered_palette != palette_hash(palette):
+            self._stats["stale"] += 1
+            return None
+        self._stats["prerendered"] += 1
+        return style
+
+    def invalidate(self, source_key: Optional[str] = None) -> None:
+        """
+        Forget cached QSS sources so they are read again.
+
+        Parameters
+        ----------
+        source_key : str, optional
+            Only forget this source (default: all).
+        """
+        with self._lock:
+            if source_key is None:
+                self._sources.clear()
+            else:
+                self._sources.pop(source_key, None)
+
+    def clear(self) -> int:
+        """
+        Drop every cached stylesheet, in memory and on disk.
+
+        Returns
+        -------
+        int
+            Number of removed files.
+        """
+        with self._lock:
+            self._sources.clear()
+            self._rendered.clear()
+            self._prerendered.clear()
+        if self._cache_dir is None or not self._cache_dir.exists():
+            return 0
+
+        removed = 0
+        for cache_file in self._cache_dir.glob("*.qss"):
+            try:
+                cache_file.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    # STATISTICS
+    # ///////////////////////////////////////////////////////////////
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/render statistics of the stylesheet cache."""
+        stats: Dict[str, Any] = dict(self._stats)
+        stats["entries"] = len(self._rendered)
+        stats["enabled"] = self.is_enabled()
+        stats["cache_dir"] = self._cache_dir
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset hit/render statistics."""
+        for key in self._stats:
+            self._stats[key] = 0
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_source(
+        self, source_key: str, load: Callable[[], str], version: Hashable
+    ) -> Tuple[Hashable, str, str]:
+        source = self._sources.get(source_key)
+        if source is not None and source[0] == version:
+            return source
+
+        text = load()
+        self._stats["source_reads"] += 1
+        source = (version, text, content_hash(text))
+        with self._lock:
+            self._sources[source_key] = source
+        return source
+
+    def _cache_path(self, source_key: str, key: Tuple[str, str, str]) -> Optional[Path]:
+        if not self.is_enabled():
+            return None
+        digest, palette_digest, theme = key
+        stem = Path(source_key).stem
+        return (
+            self._cache_dir / f"{stem}.{theme}.{digest[:16]}{palette_digest[:16]}.qss"
+        )
+
+    def _read_cached(self, cache_file: Optional[Path]) -> Optional[str]:
+        # Content-addressed: a file with the right name is always valid
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            style = cache_file.read_text(encoding="utf-8")
+            self._stats["disk_hits"] += 1
+            get_printer().verbose_msg(f"Stylesheet cache hit: {cache_file.name}")
+            return style
+        except Exception as e:
+            self._stats["errors"] += 1
+            get_printer().verbose_msg(f"Invalid stylesheet cache {cache_file}: {e}")
+            return None
+
+    def _write_cached(self, cache_file: Optional[Path], style: str) -> None:
+        # Only write inside an existing bin/themes directory, never create it
+        if cache_file is None or not cache_file.parent.parent.exists():
+            return
+
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            # Older renderings of the same source and theme are stale
+            prefix = cache_file.name.rsplit(".", 2)[0] + "."
+            for old_file in cache_file.parent.iterdir():
+                name = old_file.name
+                if (
+                    old_file != cache_file
+                    and name.startswith(prefix)
+                    and name.count(".") == cache_file.name.count(".")
+                ):
+                    old_file.unlink()
+            atomic_write(cache_file, style)
+            self._stats["writes"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            get_printer().verbose_msg(f"Could not write stylesheet cache: {e}")
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def palette_hash(palette: Mapping[str, Any]) -> str:
+    """Return the hash identifying a palette."""
+    data = repr(sorted((str(k), str(v)) for k, v in palette.items()))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_source_version(theme_path: Optional[Path]) -> Optional[Tuple[int, int]]:
+    """
+    Return the (mtime, size) version of a theme file, for ``render``.
+
+    Only an edit of the file changes it, unlike configuration writes.
+    None for embedded themes, which never change at runtime.
+    """
+    if theme_path is None:
+        return None
+    try:
+        stat = Path(theme_path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_rendered_path(theme_path: Path, theme: str) -> Path:
+    """
+    Return the path of the pre-rendered stylesheet of a theme.
+
+    ``main_theme.qss`` and its optimized ``main_theme.min.qss`` both give
+    ``main_theme.<theme>.qss``.
+    """
+    name = theme_path.name
+    if name.endswith(OPTIMIZED_SUFFIX):
+        stem = name[: -len(OPTIMIZED_SUFFIX)]
+    else:
+        stem = theme_path.stem
+    return theme_path.with_name(f"{stem}.{theme}.qss")
+
+
+def is_rendered_theme(path: Path) -> bool:
+    """Return True if a QSS file was written by ``write_rendered_themes``."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return RENDERED_HEADER_PATTERN.match(f.readline()) is not None
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def write_rendered_themes(
+    theme_path: Path, palettes: Mapping[str, Mapping[str, Any]]
+) -> List[Path]:
+    """
+    Write the stylesheet of a theme rendered for each palette.
+
+    Files already rendered from the same source and palette are kept
+    untouched. A palette named like the optimized suffix ("min") is not
+    written, its file being the optimized theme: it is rendered at runtime.
+
+    Parameters
+    ----------
+    theme_path : Path
+        QSS source.
+    palettes : Mapping[str, Mapping[str, Any]]
+        {theme: {variable: color}} (``theme_palette`` of palette.yaml).
+
+    Returns
+    -------
+    List[Path]
+        Written files.
+    """
+    text = theme_path.read_text(encoding="utf-8")
+    digest = content_hash(text)
+    template = get_qss_template(text)
+
+    written = []
+    for theme, palette in palettes.items():
+        header = RENDERED_HEADER.format(
+            theme=theme, source=digest, palette=palette_hash(palette or {})
+        )
+        rendered_path = get_rendered_path(theme_path, theme)
+        if rendered_path.name.endswith(OPTIMIZED_SUFFIX):
+            continue
+        try:
+            with open(rendered_path, encoding="utf-8") as f:
+                if f.readline().rstrip("\n") == header:
+                    # Same inputs: only refresh the date, newer than the source
+                    rendered_path.touch()
+                    continue
+        except OSError:
+            pass
+        atomic_write(rendered_path, f"{header}\n{template.render(palette or {})}")
+        written.append(rendered_path)
+    return written
+
+
+# Global stylesheet cache instance
+_stylesheet_cache = None
+
+
+def get_stylesheet_cache() -> StylesheetCache:
+    """Return global stylesheet cache instance"""
+    global _stylesheet_cache
+    if _stylesheet_cache is None:
+        _stylesheet_cache = StylesheetCache()
+    return _stylesheet_cache
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+YAML Backend for EzQt_App
+=========================
+
+Single entry point for every YAML read and write in the package.
+The libyaml based ``CSafeLoader``/``CSafeDumper`` are used when PyYAML
+was built against libyaml, the pure-Python ``SafeLoader``/``SafeDumper``
+otherwise.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import yaml
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, Optional
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+try:
+    from yaml import CSafeLoader, CSafeDumper
+
+    HAS_LIBYAML = True
+except ImportError:
+    CSafeLoader = None
+    CSafeDumper = None
+    HAS_LIBYAML = False
+
+BACKEND_LIBYAML = "libyaml"
+BACKEND_PYTHON = "python"
+
+_BACKENDS: Dict[str, tuple] = {BACKEND_PYTHON: (yaml.SafeLoader, yaml.SafeDumper)}
+if HAS_LIBYAML:
+    _BACKENDS[BACKEND_LIBYAML] = (CSafeLoader, CSafeDumper)
+
+# Dump options matching the files historically written by the package
+DEFAULT_DUMP_OPTIONS: Dict[str, Any] = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+}
+
+## ==> VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+_active_backend: str = BACKEND_LIBYAML if HAS_LIBYAML else BACKEND_PYTHON
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_yaml_backend() -> str:
+    """Return the name of the active YAML backend ("libyaml" or "python")"""
+    return _active_backend
+
+
+def get_available_yaml_backends() -> list:
+    """Return the names of the YAML backends usable in this environment"""
+    return list(_BACKENDS.keys())
+
+
+def set_yaml_backend(backend: str) -> str:
+    """
+    Select the YAML backend used by the package.
+
+    Parameters
+    ----------
+    backend : str
+        "libyaml", "python" or "auto". Requesting libyaml when it is not
+        available falls back to the pure-Python backend.
+
+    Returns
+    -------
+    str
+        Name of the backend actually selected.
+    """
+    global _active_backend
+    if backend == "auto" or backend not in _BACKENDS:
+        backend = BACKEND_LIBYAML if HAS_LIBYAML else BACKEND_PYTHON
+    _active_backend = backend
+    return _active_backend
+
+
+def safe_load(stream: Any, backend: Optional[str] = None) -> Any:
+    """
+    Parse a YAML document with the active backend.
+
+    Parameters
+    ----------
+    stream : str, bytes or file
+        YAML document.
+    backend : str, optional
+        Backend to use instead of the active one.
+
+    Returns
+    -------
+    Any
+        Parsed document.
+    """
+    loader, _ = _BACKENDS.get(backend or _active_backend, _BACKENDS[BACKEND_PYTHON])
+    return yaml.load(stream, Loader=loader)
+
+
+def safe_dump(
+    data: Any, stream: Any = None, backend: Optional[str] = None, **kwargs: Any
+) -> Optional[str]:
+    """
+    Serialize data to YAML with the active backend.
+
+    Parameters
+    ----------
+    data : Any
+        Data to serialize.
+    stream : file, optional
+        Destination stream. The YAML text is returned when omitted.
+    backend : str, optional
+        Backend to use instead of the active one.
+    **kwargs : Any
+        Extra options forwarded to ``yaml.dump``.
+
+    Returns
+    -------
+    str, optional
+        YAML text when no stream is given.
+    """
+    _, dumper = _BACKENDS.get(backend or _active_backend, _BACKENDS[BACKEND_PYTHON])
+    options = dict(DEFAULT_DUMP_OPTIONS)
+    options.update(kwargs)
+    return yaml.dump(data, stream, Dumper=dumper, **options)
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+YAML Patcher for EzQt_App
+=========================
+
+Surgical updates of configuration files with ruamel.yaml. A round-trip
+document is kept in memory per file together with the text it was read
+from; a batch of key updates mutates only the targeted nodes. Comments,
+key order and quoting of the untouched parts of the file are preserved.
+
+Serializing a whole round-trip document is slow, so an update of an
+existing key only renders that key with ruamel.yaml, before and after
+the change: when the old rendering is found at the key's line of the
+file text, it is replaced by the new one. Any other update (new keys,
+flow-style parents, text that doesn't match) serializes the whole
+document. Parsing is slow too (about 2 s for an app.yaml with 1000
+settings, 160 KB), so files above ``ROUND_TRIP_MAX_SIZE`` are left to
+the PyYAML dump of the configuration manager.
+
+The in-memory document is reused as long as the file on disk still has
+the size and modification time of the last read or write, so external
+edits are never overwritten with stale content.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import copy
+import io
+import os
+import threading
+from pathlib import Path
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from .printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+try:
+    from ruamel.yaml import YAML
+    from ruamel.yaml.comments import CommentedMap
+    from ruamel.yaml.scalarstring import (
+        DoubleQuotedScalarString,
+        SingleQuotedScalarString,
+    )
+
+    HAS_RUAMEL = True
+except ImportError:
+    YAML = None
+    CommentedMap = dict
+    DoubleQuotedScalarString = SingleQuotedScalarString = str
+    HAS_RUAMEL = False
+
+# Files above this size (bytes) are not patched round-trip: ruamel.yaml
+# parses them slower than PyYAML dumps them
+ROUND_TRIP_MAX_SIZE = 16 * 1024
+
+# Marks a key that doesn't exist yet
+_MISSING = object()
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class YamlPatcher:
+    """
+    Round-trip patch engine for YAML configuration files.
+
+    Documents are cached per target file together with the (mtime, size)
+    signature they correspond to.
+    """
+
+    def __init__(self) -> None:
+        if not HAS_RUAMEL:
+            raise ImportError("ruamel.yaml is required for round-trip patching")
+
+        self._yaml = YAML(typ="rt")
+        self._yaml.preserve_quotes = True
+        # Never re-wrap long values, keep the package indentation style
+        self._yaml.width = 4096
+        self._yaml.indent(mapping=2, sequence=4, offset=2)
+
+        self._lock = threading.Lock()
+        # target -> [signature, document, lines]; lines is None once the
+        # line numbers recorded by the parser no longer match the text
+        self._documents: Dict[str, List[Any]] = {}
+        self._stats: Dict[str, int] = {
+            "patches": 0,
+            "parses": 0,
+            "keys": 0,
+            "block_updates": 0,
+            "full_dumps": 0,
+        }
+
+    # PATCHING
+    # ///////////////////////////////////////////////////////////////
+
+    def render(self, target: Path, updates: Mapping[Sequence[str], Any]) -> str:
+        """
+        Apply key updates to the document of a file and serialize it.
+
+        Parameters
+        ----------
+        target : Path
+            File the patched document will be written to. A missing file
+            starts from an empty document.
+        updates : Mapping[Sequence[str], Any]
+            New values, keyed by key path (e.g., ("app", "theme")).
+
+        Returns
+        -------
+        str
+            YAML text of the patched document.
+        """
+        with self._lock:
+            entry = self._get_entry(Path(target))
+            document, lines = entry[1], entry[2]
+            self._stats["patches"] += 1
+            self._stats["keys"] += len(updates)
+
+            # True while the parser line numbers still match ``lines``
+            in_place = lines is not None
+            for key_path, value in updates.items():
+                parent, key, old_value, value = self._set(
+                    document, key_path, copy.deepcopy(value)
+                )
+                spliced = None
+                if in_place:
+                    spliced = self._splice(
+                        lines, key_path, parent, key, old_value, value
+                    )
+                if spliced is None:
+                    in_place = False
+                    lines = None
+                    continue
+                self._stats["block_updates"] += 1
+                in_place = len(spliced) == len(lines)
+                lines = spliced
+
+            if lines is None:
+                self._stats["full_dumps"] += 1
+                stream = io.StringIO()
+                self._yaml.dump(document, stream)
+                text = stream.getvalue()
+            else:
+                text = "".join(lines)
+            # Line numbers are only reliable until the line count changes
+            entry[2] = lines if in_place else None
+            return text
+
+    def commit(self, target: Path) -> None:
+        """
+        Record that the last rendered document was written to ``target``.
+
+        Parameters
+        ----------
+        target : Path
+            File that was just written.
+        """
+        key = str(target)
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is not None:
+                entry[0] = self._signature(key)
+
+    def discard(self, target: Optional[Path] = None) -> None:
+        """
+        Drop cached documents.
+
+        Parameters
+        ----------
+        target : Path, optional
+            Only drop the document of this file (default: all).
+        """
+        with self._lock:
+            if target is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(str(target), None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return patch statistics."""
+        stats = dict(self._stats)
+        stats["documents"] = len(self._documents)
+        return stats
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_entry(self, target: Path) -> List[Any]:
+        key = str(target)
+        signature = self._signature(key)
+        entry = self._documents.get(key)
+        if (
+            entry is not None
+            and signature is not None
+            and entry[0] == signature
+            and entry[2] is not None
+        ):
+            return entry
+
+        document = None
+        lines: List[str] = []
+        if signature is not None:
+            with open(target, "r", encoding="utf-8") as f:
+                text = f.read()
+            document = self._yaml.load(text)
+            lines = text.splitlines(keepends=True)
+            self._stats["parses"] += 1
+            get_printer().verbose_msg(f"Round-trip document loaded: {target}")
+        if not isinstance(document, dict):
+            document = CommentedMap()
+
+        entry = [signature, document, lines]
+        self._documents[key] = entry
+        return entry
+
+    @staticmethod
+    def _set(
+        document: Any, key_path: Sequence[str], value: Any
+    ) -> Tuple[Any, Any, Any, Any]:
+        current = document
+        for key in key_path[:-1]:
+            if not isinstance(current.get(key), dict):
+                current[key] = CommentedMap()
+            current = current[key]
+
+        # Keep the quoting style of the replaced value
+        key = key_path[-1]
+        old_value = current.get(key, _MISSING)
+        if isinstance(value, str):
+            if isinstance(old_value, DoubleQuotedScalarString):
+                value = DoubleQuotedScalarString(value)
+            elif isinstance(old_value, SingleQuotedScalarString):
+                value = SingleQuotedScalarString(value)
+        current[key] = value
+        return current, key, old_value, value
+
+    def _splice(
+        self,
+        lines: List[str],
+        key_path: Sequence[str],
+        parent: Any,
+        key: Any,
+        old_value: Any,
+        value: Any,
+    ) -> Optional[List[str]]:
+        """Replace the text of one key, None when it can't be located."""
+        if old_value is _MISSING or not hasattr(parent, "lc"):
+            return None
+        position = parent.lc.data.get(key)
+        if position is None or parent.fa.flow_style():
+            return None
+
+        comment = parent.ca.items.get(key)
+        old_lines = self._render_key(key_path, old_value, comment)
+        # Comments attached before the key are rendered above it
+        offset = 0
+        for line in old_lines:
+            if line.strip() and not line.lstrip().startswith("#"):
+                break
+            offset += 1
+        start = position[0] - offset
+        if start < 0 or lines[start : start + len(old_lines)] != old_lines:
+            return None
+
+        new_lines = self._render_key(key_path, value, comment)
+        return lines[:start] + new_lines + lines[start + len(old_lines) :]
+
+    def _render_key(
+        self, key_path: Sequence[str], value: Any, comment: Optional[List[Any]]
+    ) -> List[str]:
+        """Render one key at its nesting level, with its comments."""
+        node = CommentedMap()
+        node[key_path[-1]] = value
+        if comment is not None:
+            node.ca.items[key_path[-1]] = comment
+        for ancestor in reversed(key_path[:-1]):
+            node = CommentedMap([(ancestor, node)])
+
+        stream = io.StringIO()
+        self._yaml.dump(node, stream)
+        # Drop the lines of the ancestor keys
+        return stream.getvalue().splitlines(keepends=True)[len(key_path) - 1 :]
@@ -82,6 +82,8 @@ class Settings:
 
         # ////// THEME SETTINGS
         THEME: str = "dark"
+        THEME_MODE: str = "stylesheet"
+        RESTYLE_BUDGET_MS: int = 0
 
         # ////// MENU SETTINGS
         MENU_PANEL_SHRINKED_WIDTH: int = 60
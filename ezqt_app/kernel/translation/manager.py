@@ -38,15 +38,58 @@ from PySide6.QtCore import (
 # ///////////////////////////////////////////////////////////////
 from ..common import APP_PATH, Path, sys
 from ..app_functions.printer import get_printer
+from ..app_functions.package_resources import get_package_locator
+from ..app_functions.resource_resolver import TRANSLATIONS, get_resource_resolver
+from ..app_functions.preloader import get_preloader
 from .config import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
 from .auto_translator import get_auto_translator
 
+# TYPE HINTS IMPROVEMENTS
+from typing import Dict
+
 ## ==> GLOBALS
 # ///////////////////////////////////////////////////////////////
 
 ## ==> VARIABLES
 # ///////////////////////////////////////////////////////////////
 
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def parse_ts_file(ts_file_path: Path) -> Dict[str, str]:
+    """
+    Extract the translations of a .ts file.
+
+    Parameters
+    ----------
+    ts_file_path : Path
+        Qt Linguist translation file.
+
+    Returns
+    -------
+    Dict[str, str]
+        {source text: translation}
+    """
+    import xml.etree.ElementTree as ET
+
+    tree = ET.parse(ts_file_path)
+    root = tree.getroot()
+
+    translations = {}
+    for message in root.findall(".//message"):
+        source = message.find("source")
+        translation = message.find("translation")
+
+        if source is not None and translation is not None:
+            source_text = source.text
+            translation_text = translation.text
+
+            if source_text and translation_text:
+                translations[source_text] = translation_text
+    return translations
+
+
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
 
@@ -73,46 +116,13 @@ class TranslationManager(QObject):
         self.auto_translator = get_auto_translator()
         self.auto_translation_enabled = False  # DÉSACTIVÉ TEMPORAIREMENT
 
-        # Determine translations path
-        if hasattr(sys, "_MEIPASS"):
-            # Frozen mode (executable)
-            self.translations_dir = (
-                Path(sys._MEIPASS) / "ezqt_app" / "resources" / "translations"
-            )
-        else:
-            # Development mode - search in priority order
-            # Use same logic as makeRequiredFiles
-            project_path = Path.cwd()  # Same logic as FileMaker(Path.cwd())
-            possible_paths = [
-                project_path / "bin" / "translations",  # User project (priority 1)
-                APP_PATH / "bin" / "translations",  # APP_PATH (priority 2)
-                Path(__file__).parent.parent.parent
-                / "resources"
-                / "translations",  # Local development (priority 3)
-            ]
-
-            # Try to get from installed package if not found
-            try:
-                package_translations = self._get_package_translations_dir()
-                if package_translations.exists():
-                    possible_paths.append(
-                        package_translations
-                    )  # Installed package (priority 4)
-            except Exception as e:
-                # print(f"⚠️ Unable to retrieve package translations: {e}")
-                pass
+        # Determine translations path (project, APP_PATH, package, frozen bundle)
+        self.translations_dir = get_resource_resolver().resolve_dir(TRANSLATIONS)
 
-            # Find first existing directory
-            self.translations_dir = None
-            for path in possible_paths:
-                if path.exists():
-                    self.translations_dir = path
-                    break
-
-            # If no directory found, create user project directory
-            if self.translations_dir is None:
-                self.translations_dir = project_path / "bin" / "translations"
-                self.translations_dir.mkdir(parents=True, exist_ok=True)
+        # If no directory found, create user project directory
+        if self.translations_dir is None:
+            self.translations_dir = Path.cwd() / "bin" / "translations"
+            self.translations_dir.mkdir(parents=True, exist_ok=True)
 
         # Language name to code mapping
         self.language_mapping = {
@@ -124,39 +134,16 @@ class TranslationManager(QObject):
 
     def _get_package_translations_dir(self) -> Path:
         """Get installed package translations directory"""
-        try:
-            import pkg_resources
-
-            return Path(
-                pkg_resources.resource_filename("ezqt_app", "resources/translations")
-            )
-        except Exception:
-            return Path(__file__).parent.parent.parent / "resources" / "translations"
+        return get_package_locator().path("resources/translations")
 
     def _load_ts_file(self, ts_file_path: Path) -> bool:
         """Load a .ts file and extract translations"""
         try:
-            import xml.etree.ElementTree as ET
-
             if not ts_file_path.exists():
                 return False
 
-            tree = ET.parse(ts_file_path)
-            root = tree.getroot()
-
-            # Extract translations from .ts file
-            translations = {}
-            for message in root.findall(".//message"):
-                source = message.find("source")
-                translation = message.find("translation")
-
-                if source is not None and translation is not None:
-                    source_text = source.text
-                    translation_text = translation.text
-
-                    if source_text and translation_text:
-                        translations[source_text] = translation_text
-
+            # Parsed in the background at startup (see preloader)
+            translations = get_preloader().load_translations(ts_file_path)
             self._ts_translations.update(translations)
             return True
 
@@ -22,6 +22,15 @@ from .window_manager import WindowManager
 from .panel_manager import PanelManager
 from .menu_manager import MenuManager
 from .theme_manager import ThemeManager
+from .restyle_engine import RestyleEngine, get_restyle_engine
+from .palette_theme import build_palette, get_stylesheet_values, parse_color
+from .theme_precompute import ThemePrecomputer, get_theme_precomputer
+from .progressive_restyle import ProgressiveRestyler
+from .component_themes import (
+    COMPONENT_MANIFEST,
+    get_component_containers,
+    split_stylesheet,
+)
 from .ui_definitions import UIDefinitions
 
 # Classe principale qui combine tous les managers
@@ -53,6 +62,7 @@ __all__ = [
     "PanelManager",
     "MenuManager",
     "ThemeManager",
+    "RestyleEngine",
     "UIDefinitions",
     "GLOBAL_STATE",
     "GLOBAL_TITLE_BAR",
@@ -73,4 +83,14 @@ __all__ = [
     "get_window_status",
     "apply_default_theme",
     "setup_window_title_bar",
+    "get_restyle_engine",
+    "build_palette",
+    "get_stylesheet_values",
+    "parse_color",
+    "COMPONENT_MANIFEST",
+    "get_component_containers",
+    "split_stylesheet",
+    "ThemePrecomputer",
+    "get_theme_precomputer",
+    "ProgressiveRestyler",
 ]
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Component Themes for EzQt_App
+=============================
+
+Stylesheets scoped to the components of the main window. Setting a
+stylesheet on a widget makes Qt restyle that widget and its descendants
+only, so the rules of a component are set on its container
+(``COMPONENT_MANIFEST``) instead of the root ``ui.styleSheet``.
+
+``split_stylesheet`` assigns a rule to a component when the first object
+name of each of its selectors, wherever it appears in the selector, only
+names widgets of that container (e.g., ``#topMenu QToolButton`` and
+``QFrame#topMenu > QLabel`` go to the menu). Rules matching widgets of
+several components, or none (e.g., ``QPushButton:hover``), stay global.
+
+Qt prefers the nearest stylesheet whatever the specificity of its rules,
+so moving a rule closer to its widgets can change the cascade. Rules
+without object name are always less specific than moved rules; when a
+global rule naming widgets of a component is at least as specific as a
+moved rule of that component setting the same properties, the component
+is not split and its rules stay global.
+
+The split is kept per (stylesheet content, containers, components of
+each object name): widgets are looked up on every call, so pages added
+later are assigned like the others, and palette theme switches of an
+unchanged window reuse the split.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import re
+import weakref
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+from PySide6.QtWidgets import QWidget
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ..app_functions.qss_optimizer import OBJECT_NAME_PATTERN, parse_rules
+from ..app_functions.qss_template import content_hash
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Component -> object name of its container in the main window
+COMPONENT_MANIFEST: Dict[str, str] = {
+    "header": "headerContainer",
+    "menu": "menuContainer",
+    "pages": "pagesContainer",
+    "settings": "settingsPanel",
+    "bottom_bar": "bottomBar",
+}
+
+# Splits kept per root widget, released with it
+SPLIT_CACHE_SIZE = 4
+_split_cache: "weakref.WeakKeyDictionary[QWidget, Dict[tuple, tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Parsed stylesheets: content hash -> (rules, object names)
+_parse_cache: Dict[str, tuple] = {}
+
+# Parts of a selector, by specificity rank
+_ID_PATTERN = re.compile(r"#[A-Za-z_][\w-]*")
+_CLASS_PATTERN = re.compile(r"\[[^\]]*\]|(?<!:):(?!:)[A-Za-z-]+|\.[A-Za-z_][\w-]*")
+_TYPE_PATTERN = re.compile(r"(?:^|[\s>+~])([A-Za-z_][\w-]*)|::[A-Za-z-]+")
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_component_containers(
+    root: QWidget, manifest: Optional[Mapping[str, str]] = None
+) -> Dict[str, QWidget]:
+    """
+    Find the containers of the components below a root widget.
+
+    Parameters
+    ----------
+    root : QWidget
+        Root of the main window (``ui.styleSheet``).
+    manifest : Mapping[str, str], optional
+        {component: container object name} (default: COMPONENT_MANIFEST).
+
+    Returns
+    -------
+    Dict[str, QWidget]
+        {component: container}, components without container omitted.
+    """
+    containers = {}
+    for name, object_name in (manifest or COMPONENT_MANIFEST).items():
+        container = root.findChild(QWidget, object_name)
+        if container is not None:
+            containers[name] = container
+    return containers
+
+
+def split_stylesheet(
+    stylesheet: str, root: QWidget, containers: Mapping[str, QWidget]
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a stylesheet into a global sheet and component sheets.
+
+    Parameters
+    ----------
+    stylesheet : str
+        Rendered stylesheet.
+    root : QWidget
+        Widget the global sheet is set on.
+    containers : Mapping[str, QWidget]
+        {component: container}, see ``get_component_containers``.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, str]]
+        Global sheet and {component: sheet}, one entry per container.
+    """
+    stylesheet_hash = content_hash(stylesheet)
+    parsed = _parse_cache.get(stylesheet_hash)
+    if parsed is None:
+        rules = parse_rules(stylesheet)
+        names = sorted(
+            {
+                match.group(1)
+                for selectors, _ in rules
+                for match in OBJECT_NAME_PATTERN.finditer(selectors)
+            }
+        )
+        if len(_parse_cache) >= SPLIT_CACHE_SIZE:
+            _parse_cache.pop(next(iter(_parse_cache)))
+        parsed = _parse_cache[stylesheet_hash] = (rules, names)
+    rules, names = parsed
+
+    # Components holding the widgets of each name, looked up every time
+    locations = tuple((name, _get_components(root, name, containers)) for name in names)
+    key = (
+        stylesheet_hash,
+        tuple((name, id(container)) for name, container in containers.items()),
+        locations,
+    )
+    splits = _split_cache.setdefault(root, {})
+    split = splits.get(key)
+    if split is None:
+        split = _split(rules, dict(locations), containers)
+        if len(splits) >= SPLIT_CACHE_SIZE:
+            splits.pop(next(iter(splits)))
+        splits[key] = split
+    # Callers append their own rules to the component sheets
+    return split[0], dict(split[1])
+
+
+# ////// UTILITY FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _split(
+    rules: List[Tuple[str, str]],
+    locations: Mapping[str, FrozenSet[Optional[str]]],
+    containers: Mapping[str, QWidget],
+) -> Tuple[str, Dict[str, str]]:
+    # Component of each rule, None: global
+    assigned = []
+    for selectors, declarations in rules:
+        components = set()
+        for selector in selectors.split(","):
+            match = OBJECT_NAME_PATTERN.search(selector)
+            owner = None
+            if match:
+                names = locations.get(match.group(1), frozenset())
+                owner = next(iter(names)) if len(names) == 1 else None
+            components.add(owner)
+        assigned.append(components.pop() if len(components) == 1 else None)
+
+    # A nearer sheet would override more specific global rules
+    unsplit = set()
+    moved = [
+        (component, _get_subjects(selectors), _properties(declarations))
+        for component, (selectors, declarations) in zip(assigned, rules)
+        if component is not None
+    ]
+    for component, (selectors, declarations) in zip(assigned, rules):
+        if component is not None or not OBJECT_NAME_PATTERN.search(selectors):
+            continue
+        touched = set()
+        for match in OBJECT_NAME_PATTERN.finditer(selectors):
+            touched.update(locations.get(match.group(1), ()))
+        subjects = _get_subjects(selectors)
+        properties = _properties(declarations)
+        for target, target_subjects, target_properties in moved:
+            if (
+                target in touched
+                and target not in unsplit
+                and properties & target_properties
+                and _may_override(subjects, target_subjects)
+            ):
+                unsplit.add(target)
+
+    sheets = {name: [] for name in list(containers) + [None]}
+    for component, (selectors, declarations) in zip(assigned, rules):
+        if component in unsplit:
+            component = None
+        sheets[component].append(f"{selectors} {{{declarations}}}")
+
+    global_sheet = "\n".join(sheets.pop(None))
+    return global_sheet, {name: "\n".join(rules) for name, rules in sheets.items()}
+
+
+def _get_components(
+    root: QWidget, object_name: str, containers: Mapping[str, QWidget]
+) -> FrozenSet[Optional[str]]:
+    # Components holding the widgets of that name, None for any outside
+    components = set()
+    widgets = root.findChildren(QWidget, object_name)
+    if root.objectName() == object_name:
+        widgets.append(root)
+    for widget in widgets:
+        components.add(
+            next(
+                (
+                    name
+                    for name, container in containers.items()
+                    if widget is container or container.isAncestorOf(widget)
+                ),
+                None,
+            )
+        )
+    return frozenset(components)
+
+
+def _specificity(selector: str) -> Tuple[int, int, int]:
+    # CSS 2 specificity: object names, pseudo-states/attributes, types
+    without_ids = _ID_PATTERN.sub(" ", selector)
+    return (
+        len(_ID_PATTERN.findall(selector)),
+        len(_CLASS_PATTERN.findall(without_ids)),
+        len(_TYPE_PATTERN.findall(_CLASS_PATTERN.sub(" ", without_ids))),
+    )
+
+
+def _get_subjects(selectors: str) -> List[Tuple[Optional[str], Tuple[int, int, int]]]:
+    # (object name of the styled widget or None, specificity) per selector
+    subjects = []
+    for selector in selectors.split(","):
+        compound = re.split(r"[\s>+~]+", selector.strip())[-1]
+        match = OBJECT_NAME_PATTERN.search(compound)
+        subjects.append((match.group(1) if match else None, _specificity(selector)))
+    return subjects
+
+
+def _may_override(
+    subjects: List[Tuple[Optional[str], Tuple[int, int, int]]],
+    targets: List[Tuple[Optional[str], Tuple[int, int, int]]],
+) -> bool:
+    # Whether a global selector may win over a moved one for some widget
+    return any(
+        specificity >= target_specificity
+        and (name is None or target_name is None or name == target_name)
+        for name, specificity in subjects
+        for target_name, target_specificity in targets
+    )
+
+
+def _properties(declarations: str) -> FrozenSet[str]:
+    # Families: "border" conflicts with "border-color"
+    return frozenset(
+        declaration.split(":", 1)[0].strip().split("-", 1)[0]
+        for declaration in declarations.split(";")
+        if ":" in declaration
+    )
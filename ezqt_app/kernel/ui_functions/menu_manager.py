@@ -34,6 +34,7 @@ from PySide6.QtWidgets import (
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
+from .restyle_engine import get_restyle_engine
 
 # TYPE HINTS IMPROVEMENTS
 
@@ -64,8 +65,8 @@ class MenuManager:
         """
         for w in self.ui.menuContainer.topMenu.findChildren(QToolButton):
             if w.objectName() == widget and isinstance(w, QToolButton):
-                w.setProperty("class", "active")
-                MenuManager.refreshStyle(w)
+                # Repolished only if it was not already selected
+                get_restyle_engine().set_dynamic_property(w, "class", "active")
 
     @staticmethod
     def deselectMenu(self, widget) -> None:
@@ -79,8 +80,7 @@ class MenuManager:
         """
         for w in self.ui.menuContainer.topMenu.findChildren(QToolButton):
             if w.objectName() != widget and isinstance(w, QToolButton):
-                w.setProperty("class", "inactive")
-                MenuManager.refreshStyle(w)
+                get_restyle_engine().set_dynamic_property(w, "class", "inactive")
 
     @staticmethod
     def refreshStyle(w: QWidget) -> None:
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Palette Theme for EzQt_App
+==========================
+
+Theming mode where the colors of palette.yaml are given by the QPalette
+of the application (``app.theme_mode: palette`` in app.yaml).
+
+Each palette variable of the theme is mapped onto a palette role and
+rendered as ``palette(<role>)`` in the QSS, so a single structural
+stylesheet serves every theme: it is parsed once and a light/dark switch
+only changes the application palette. Variables without a role (e.g.,
+custom variables added to palette.yaml) are substituted with their
+literal value. When that value is the same color in every theme (e.g.,
+``$_transparent``, fully transparent), the stylesheet stays shared;
+otherwise a warning is printed once and switching theme renders and
+parses a stylesheet again, as in the stylesheet mode.
+
+The palette is set with ``QApplication.setPalette``: it applies to the
+whole process, including dialogs and widgets outside the main window.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import re
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+from PySide6.QtGui import QColor, QPalette
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, Mapping, Optional, Set
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ..app_functions.printer import get_printer
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Theme giving the variables without palette role
+REFERENCE_THEME = "dark"
+
+# Palette variable -> QSS palette role
+PALETTE_ROLES: Dict[str, str] = {
+    "$_main_surface": "window",
+    "$_main_border": "mid",
+    "$_main_accent_color": "highlight",
+    "$_accent_color1": "button",
+    "$_accent_color2": "midlight",
+    "$_accent_color3": "alternate-base",
+    "$_accent_color4": "dark",
+    "$_page_color": "base",
+    "$_semi_transparent": "shadow",
+    "$_select_text_color": "highlighted-text",
+    "$_base_text_color": "window-text",
+}
+
+# QSS palette role -> QPalette roles given its color
+QPALETTE_ROLES: Dict[str, tuple] = {
+    "window": (QPalette.Window,),
+    "mid": (QPalette.Mid,),
+    "highlight": (QPalette.Highlight,),
+    "button": (QPalette.Button,),
+    "midlight": (QPalette.Midlight,),
+    "alternate-base": (QPalette.AlternateBase,),
+    "dark": (QPalette.Dark,),
+    "base": (QPalette.Base,),
+    "shadow": (QPalette.Shadow,),
+    "highlighted-text": (QPalette.HighlightedText,),
+    # Text drawn by the native style follows the theme too
+    "window-text": (
+        QPalette.WindowText,
+        QPalette.Text,
+        QPalette.ButtonText,
+        QPalette.ToolTipText,
+    ),
+}
+
+# Variables without palette role already reported
+_reported: Set[str] = set()
+
+RGB_PATTERN = re.compile(
+    r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*(\d+(?:\.\d+)?)\s*)?\)"
+)
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def parse_color(value: Any) -> Optional[QColor]:
+    """
+    Convert a palette.yaml color to a QColor.
+
+    Parameters
+    ----------
+    value : Any
+        "rgb(r, g, b)", "rgba(r, g, b, a)", "#rrggbb" or a color name.
+
+    Returns
+    -------
+    QColor, optional
+        Color, or None if the value is not a valid color.
+    """
+    text = str(value).strip()
+    match = RGB_PATTERN.fullmatch(text)
+    if match:
+        red, green, blue, alpha = match.groups()
+        color = QColor(int(red), int(green), int(blue))
+        if alpha is not None:
+            # QSS alpha is 0-255, or a 0-1 ratio when written as a float
+            alpha_value = float(alpha)
+            if "." in alpha:
+                alpha_value *= 255
+            color.setAlpha(int(round(alpha_value)))
+        return color
+
+    color = QColor(text)
+    return color if color.isValid() else None
+
+
+def _same_color(first: Any, second: Any) -> bool:
+    # Fully transparent colors are the same whatever their RGB
+    if str(first).strip() == str(second).strip():
+        return True
+    first_color, second_color = parse_color(first), parse_color(second)
+    if first_color is None or second_color is None:
+        return False
+    if first_color.alpha() == 0 and second_color.alpha() == 0:
+        return True
+    return first_color == second_color
+
+
+def get_stylesheet_values(
+    reference: Mapping[str, Any], colors: Optional[Mapping[str, Any]] = None
+) -> Dict[str, str]:
+    """
+    Return the values rendering the structural stylesheet.
+
+    Parameters
+    ----------
+    reference : Mapping[str, Any]
+        Palette shared by every theme for the variables without role.
+    colors : Mapping[str, Any], optional
+        Palette of the active theme (default: the reference). Variables
+        without role whose color differs from the reference take their
+        literal value here.
+
+    Returns
+    -------
+    Dict[str, str]
+        {variable: value}, ``palette(<role>)`` for mapped variables.
+    """
+    values = {name: str(value) for name, value in reference.items()}
+    for name, value in (colors or {}).items():
+        if name in PALETTE_ROLES:
+            continue
+        if name in values and _same_color(values[name], value):
+            continue
+        values[name] = str(value)
+        if name not in _reported:
+            _reported.add(name)
+            get_printer().warning(
+                f"Palette variable {name} has no palette role: its value "
+                "differs between themes, theme switches restyle the stylesheet"
+            )
+    values.update((name, f"palette({role})") for name, role in PALETTE_ROLES.items())
+    return values
+
+
+def build_palette(
+    colors: Mapping[str, Any], base: Optional[QPalette] = None
+) -> QPalette:
+    """
+    Build the application palette of a theme.
+
+    Parameters
+    ----------
+    colors : Mapping[str, Any]
+        {variable: color} of the theme (palette.yaml).
+    base : QPalette, optional
+        Palette giving the roles without variable (default: Qt default).
+
+    Returns
+    -------
+    QPalette
+        Palette with the theme colors in every color group.
+    """
+    palette = QPalette(base) if base is not None else QPalette()
+    for name, role in PALETTE_ROLES.items():
+        color = parse_color(colors[name]) if name in colors else None
+        if color is None:
+            continue
+        for color_role in QPALETTE_ROLES[role]:
+            palette.setColor(color_role, color)
+    return palette
@@ -35,6 +35,7 @@ from PySide6.QtCore import (
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
 from ..app_settings import Settings
+from .theme_manager import ThemeManager
 
 # TYPE HINTS IMPROVEMENTS
 
@@ -117,6 +118,10 @@ class PanelManager:
             self.settings_animation.setEasingCurve(QEasingCurve.InOutQuart)
             self.settings_animation.start()
 
+            # A theme switch is likely: prepare the other theme while idle
+            if widthExtended:
+                ThemeManager.prepareTheme(self)
+
             # Synchronize toggle with current theme
             current_theme = Settings.Gui.THEME
             theme_toggle = self.ui.settingsPanel.get_theme_toggle_button()
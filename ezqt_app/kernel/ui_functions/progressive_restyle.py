@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Progressive Restyle for EzQt_App
+================================
+
+Repolish of the widgets after a palette theme switch, spread over
+event-loop iterations (``app.restyle_budget_ms`` in app.yaml).
+
+Visible widgets are repolished first, in slices of at most ``budget_ms``:
+a zero-delay timer runs a slice, then yields to the event loop, which
+paints and handles input before the next one. Hidden widgets (pages of
+the stacked widget not shown, closed panels) are not repolished until
+shown: the topmost hidden widget of each hidden subtree is watched, and
+its subtree is repolished when it gets a Show event, before it is
+painted.
+
+Only the repolish can be split: a stylesheet set on a widget makes Qt
+restyle all of its descendants in one call. The restyle engine uses this
+class in palette mode, where a switch changes the application palette
+and keeps the stylesheet (see restyle_engine).
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import time
+from collections import deque
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+import shiboken6
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QWidget
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ..app_functions.printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, Iterable, List
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Time spent repolishing per event-loop iteration
+DEFAULT_BUDGET_MS = 8.0
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ProgressiveRestyler(QObject):
+    """
+    Repolishes widgets within a time budget per event-loop iteration.
+
+    Parameters
+    ----------
+    repolish : Callable[[QWidget], None]
+        Function restyling one widget.
+    """
+
+    def __init__(self, repolish: Callable[[QWidget], None]) -> None:
+        super().__init__()
+        self._repolish = repolish
+        self._budget_ms = DEFAULT_BUDGET_MS
+        self._queue: "deque[QWidget]" = deque()
+        # Watched hidden widget -> hidden widgets of its subtree
+        self._deferred: Dict[QWidget, List[QWidget]] = {}
+        self._scheduled = False
+        self._slices = 0
+        self._stats: Dict[str, Any] = {
+            "runs": 0,
+            "slices": 0,
+            "repolished": 0,
+            "on_show": 0,
+            "max_slice_ms": 0.0,
+        }
+
+    # RESTYLING
+    # ///////////////////////////////////////////////////////////////
+
+    def start(
+        self, widgets: Iterable[QWidget], budget_ms: float = DEFAULT_BUDGET_MS
+    ) -> None:
+        """
+        Repolish widgets, visible ones first and hidden ones when shown.
+
+        Work left from a previous run is dropped.
+
+        Parameters
+        ----------
+        widgets : Iterable[QWidget]
+            Widgets to repolish, parents before children.
+        budget_ms : float, optional
+            Time spent per event-loop iteration (default: DEFAULT_BUDGET_MS).
+        """
+        self.cancel()
+        self._budget_ms = budget_ms
+        self._slices = 0
+        roots: Dict[QWidget, QWidget] = {}
+        for widget in widgets:
+            if widget.isVisible():
+                self._queue.append(widget)
+                continue
+            root = self._get_hidden_root(widget, roots)
+            if root not in self._deferred:
+                self._deferred[root] = []
+                root.installEventFilter(self)
+            self._deferred[root].append(widget)
+
+        self._stats["runs"] += 1
+        if self._queue:
+            self._schedule()
+
+    def flush(self) -> int:
+        """
+        Repolish every pending widget now, hidden ones included.
+
+        Returns
+        -------
+        int
+            Number of widgets repolished.
+        """
+        widgets = list(self._queue)
+        for root, hidden in self._deferred.items():
+            if shiboken6.isValid(root):
+                root.removeEventFilter(self)
+            widgets.extend(hidden)
+        self._queue.clear()
+        self._deferred.clear()
+        return self._run(widgets)
+
+    def cancel(self) -> None:
+        """Drop the pending widgets."""
+        self._queue.clear()
+        for root in self._deferred:
+            if shiboken6.isValid(root):
+                root.removeEventFilter(self)
+        self._deferred.clear()
+
+    # INSTRUMENTATION
+    # ///////////////////////////////////////////////////////////////
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Return the restyle state and statistics.
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``state`` ("idle", "running" or "deferred"), ``pending``
+            visible widgets, ``deferred`` hidden widgets, and counters:
+            ``on_show`` counts widgets repolished when shown,
+            ``max_slice_ms`` the longest slice.
+        """
+        deferred = sum(len(hidden) for hidden in self._deferred.values())
+        if self._queue:
+            state = "running"
+        elif deferred:
+            state = "deferred"
+        else:
+            state = "idle"
+        status: Dict[str, Any] = dict(self._stats)
+        status.update(state=state, pending=len(self._queue), deferred=deferred)
+        return status
+
+    # EVENTS
+    # ///////////////////////////////////////////////////////////////
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Repolish a hidden subtree when it is shown, before its paint."""
+        if event.type() == QEvent.Show and watched in self._deferred:
+            watched.removeEventFilter(self)
+            self._stats["on_show"] += self._run(self._deferred.pop(watched))
+        return False
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_hidden_root(
+        self, widget: QWidget, roots: Dict[QWidget, QWidget]
+    ) -> QWidget:
+        # Topmost hidden ancestor: its Show event precedes the subtree paint
+        parent = widget.parentWidget()
+        if parent is None or parent.isVisible():
+            return widget
+        if parent not in roots:
+            roots[parent] = self._get_hidden_root(parent, roots)
+        return roots[parent]
+
+    def _schedule(self) -> None:
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._run_slice)
+
+    def _run_slice(self) -> None:
+        self._scheduled = False
+        if not self._queue:
+            return
+        start = time.perf_counter()
+        while self._queue:
+            self._run([self._queue.popleft()])
+            if (time.perf_counter() - start) * 1000 >= self._budget_ms:
+                break
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._slices += 1
+        self._stats["slices"] += 1
+        self._stats["max_slice_ms"] = max(self._stats["max_slice_ms"], elapsed_ms)
+        if self._queue:
+            self._schedule()
+        else:
+            get_printer().verbose_msg(
+                f"Visible widgets restyled in {self._slices} slices"
+                f" ({self.get_status()['deferred']} deferred until shown)"
+            )
+
+    def _run(self, widgets: Iterable[QWidget]) -> int:
+        count = 0
+        for widget in widgets:
+            # Deleted while pending (e.g., a closed page)
+            if shiboken6.isValid(widget):
+                self._repolish(widget)
+                count += 1
+        self._stats["repolished"] += count
+        return count
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Restyle Engine for EzQt_App
+===========================
+
+Theme switches without a global unpolish/polish loop.
+
+Setting a stylesheet on the host widget (``ui.styleSheet``) already makes
+Qt repolish that widget and all of its descendants once. The engine only
+adds what Qt does not do by itself:
+
+- nothing at all when the rendered stylesheet did not change;
+- a single repaint: updates of the window are disabled while styles are
+  recomputed.
+
+``set_dynamic_property`` is the scoped counterpart for property changes
+(e.g., the ``class`` of the selected menu button): it repolishes the one
+widget whose selector property changed, and nothing when it did not.
+
+``apply_palette`` serves the palette theme mode (see palette_theme): the
+structural stylesheet is set once, later switches only change the
+application palette and repolish, ``palette(<role>)`` references being
+resolved when a widget is polished. No stylesheet is parsed again. With
+a ``budget_ms``, the repolish is spread over event-loop iterations and
+hidden widgets are repolished when shown (see progressive_restyle).
+Widgets outside the host (detached windows, dialogs with their own
+``palette(<role>)`` stylesheet) are only repolished when registered with
+``register``. Registration has no effect on ``apply_stylesheet``: such
+widgets do not inherit the host stylesheet.
+
+``apply_component_sheets`` sets the stylesheets scoped to components (see
+component_themes): a changed component restyles its own subtree only.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import time
+import weakref
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+import shiboken6
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ..app_functions.printer import get_printer
+from .progressive_restyle import ProgressiveRestyler
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Dict, List, Mapping, Optional
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class RestyleEngine:
+    """
+    Applies theme stylesheets, restyling only what depends on them.
+    """
+
+    def __init__(self) -> None:
+        # Weak: registering a widget must not keep it alive
+        self._registered: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
+        self._progressive: Optional[ProgressiveRestyler] = None
+        self._stats: Dict[str, Any] = {
+            "switches": 0,
+            "skipped": 0,
+            "repolished": 0,
+            "components": 0,
+            "progressive": 0,
+            "last_ms": 0.0,
+        }
+
+    # REGISTRATION
+    # ///////////////////////////////////////////////////////////////
+
+    def register(self, widget: QWidget) -> None:
+        """
+        Repolish a widget outside the host on palette switches.
+
+        Parameters
+        ----------
+        widget : QWidget
+            Widget (and its descendants) styled with ``palette(<role>)``.
+        """
+        self._registered.add(widget)
+
+    def unregister(self, widget: QWidget) -> None:
+        """Stop repolishing a widget on palette switches."""
+        self._registered.discard(widget)
+
+    def get_registered(self) -> List[QWidget]:
+        """Return the registered widgets still alive."""
+        return [w for w in list(self._registered) if shiboken6.isValid(w)]
+
+    # RESTYLING
+    # ///////////////////////////////////////////////////////////////
+
+    def apply_stylesheet(self, host: QWidget, stylesheet: str) -> bool:
+        """
+        Set the stylesheet of the host and restyle the dependent widgets.
+
+        Parameters
+        ----------
+        host : QWidget
+            Widget holding the application stylesheet.
+        stylesheet : str
+            Rendered stylesheet.
+
+        Returns
+        -------
+        bool
+            False if the stylesheet was already applied (nothing done).
+        """
+        if host.styleSheet() == stylesheet:
+            self._stats["skipped"] += 1
+            return False
+
+        start = time.perf_counter()
+        # Every widget is restyled below, pending repolishes are outdated
+        self._cancel_progressive()
+        window = host.window()
+        frozen = window.updatesEnabled()
+
+        if frozen:
+            window.setUpdatesEnabled(False)
+        try:
+            # Qt repolishes the host and all of its descendants
+            host.setStyleSheet(stylesheet)
+        finally:
+            if frozen:
+                window.setUpdatesEnabled(True)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats["switches"] += 1
+        self._stats["last_ms"] = elapsed_ms
+        get_printer().verbose_msg(f"Theme applied in {elapsed_ms:.1f} ms")
+        return True
+
+    def apply_palette(
+        self,
+        host: QWidget,
+        stylesheet: str,
+        palette: QPalette,
+        budget_ms: float = 0,
+    ) -> bool:
+        """
+        Apply a theme given by the application palette.
+
+        The palette is set on the application: every widget of the
+        process follows it, dialogs and other windows included.
+
+        Parameters
+        ----------
+        host : QWidget
+            Widget holding the application stylesheet.
+        stylesheet : str
+            Structural stylesheet, colored with ``palette(<role>)``.
+        palette : QPalette
+            Palette of the theme.
+        budget_ms : float, optional
+            Repolish time per event-loop iteration, visible widgets first
+            and hidden ones when shown (default: 0, repolish at once).
+            Ignored when the stylesheet changed, Qt restyling the host
+            tree in one call.
+
+        Returns
+        -------
+        bool
+            False if the stylesheet and the palette were already applied
+            (nothing done).
+        """
+        app = QApplication.instance()
+        sheet_changed = host.styleSheet() != stylesheet
+        if not sheet_changed and app.palette() == palette:
+            self._stats["skipped"] += 1
+            return False
+
+        start = time.perf_counter()
+        self._cancel_progressive()
+        targets = self._collect_registered(host)
+        if not sheet_changed:
+            # setStyleSheet would repolish the host tree, do it here
+            targets = [host] + host.findChildren(QWidget) + targets
+            if budget_ms > 0:
+                return self._apply_palette_progressive(
+                    app, palette, targets, budget_ms, start
+                )
+        window = host.window()
+        frozen = window.updatesEnabled()
+
+        if frozen:
+            window.setUpdatesEnabled(False)
+        try:
+            app.setPalette(palette)
+            if sheet_changed:
+                host.setStyleSheet(stylesheet)
+            for widget in targets:
+                _repolish(widget)
+        finally:
+            if frozen:
+                window.setUpdatesEnabled(True)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats["switches"] += 1
+        self._stats["repolished"] += len(targets)
+        self._stats["last_ms"] = elapsed_ms
+        get_printer().verbose_msg(
+            f"Palette applied in {elapsed_ms:.1f} ms "
+            f"({len(targets)} widgets repolished)"
+        )
+        return True
+
+    def _apply_palette_progressive(
+        self,
+        app: QApplication,
+        palette: QPalette,
+        targets: List[QWidget],
+        budget_ms: float,
+        start: float,
+    ) -> bool:
+        # No frozen windows: slices are painted as they complete
+        app.setPalette(palette)
+        if self._progressive is None:
+            self._progressive = ProgressiveRestyler(_repolish)
+        self._progressive.start(targets, budget_ms)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats["switches"] += 1
+        self._stats["progressive"] += 1
+        self._stats["repolished"] += len(targets)
+        self._stats["last_ms"] = elapsed_ms
+        status = self._progressive.get_status()
+        get_printer().verbose_msg(
+            f"Palette applied in {elapsed_ms:.1f} ms, {status['pending']} "
+            f"widgets repolished within {budget_ms:g} ms per frame, "
+            f"{status['deferred']} when shown"
+        )
+        return True
+
+    def apply_component_sheets(self, sheets: Mapping[QWidget, str]) -> int:
+        """
+        Set the stylesheets of component containers.
+
+        Parameters
+        ----------
+        sheets : Mapping[QWidget, str]
+            {container: stylesheet}.
+
+        Returns
+        -------
+        int
+            Number of containers whose stylesheet changed.
+        """
+        changed = [
+            (container, sheet)
+            for container, sheet in sheets.items()
+            if container.styleSheet() != sheet
+        ]
+        if not changed:
+            return 0
+
+        start = time.perf_counter()
+        # Containers, not windows: enabling updates repaints the whole widget
+        frozen = [c for c, _ in changed if c.updatesEnabled()]
+        for container in frozen:
+            container.setUpdatesEnabled(False)
+        try:
+            # Qt repolishes each container and its descendants only
+            for container, sheet in changed:
+                container.setStyleSheet(sheet)
+        finally:
+            for container in frozen:
+                container.setUpdatesEnabled(True)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats["components"] += len(changed)
+        self._stats["last_ms"] = elapsed_ms
+        get_printer().verbose_msg(
+            f"{len(changed)} component stylesheets applied in {elapsed_ms:.1f} ms"
+        )
+        return len(changed)
+
+    def set_dynamic_property(self, widget: QWidget, name: str, value: Any) -> bool:
+        """
+        Set a property read by QSS selectors and repolish the widget.
+
+        Parameters
+        ----------
+        widget : QWidget
+            Widget to update.
+        name : str
+            Property name (e.g., "class").
+        value : Any
+            New property value.
+
+        Returns
+        -------
+        bool
+            False if the property already had this value (nothing done).
+        """
+        if widget.property(name) == value:
+            return False
+        widget.setProperty(name, value)
+        _repolish(widget)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return theme switch statistics."""
+        stats = dict(self._stats)
+        stats["registered"] = len(self._registered)
+        return stats
+
+    def get_progressive_status(self) -> Optional[Dict[str, Any]]:
+        """Return the progressive restyle status, None if never used."""
+        if self._progressive is None:
+            return None
+        return self._progressive.get_status()
+
+    def flush(self) -> int:
+        """
+        Finish a progressive restyle now, hidden widgets included.
+
+        Returns
+        -------
+        int
+            Number of widgets repolished.
+        """
+        if self._progressive is None:
+            return 0
+        return self._progressive.flush()
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _cancel_progressive(self) -> None:
+        if self._progressive is not None:
+            self._progressive.cancel()
+
+    def _collect_registered(self, host: QWidget) -> List[QWidget]:
+        # Registered widgets outside the host and their descendants
+        targets: List[QWidget] = []
+        seen = set()
+        for widget in self.get_registered():
+            if widget is host or host.isAncestorOf(widget):
+                continue
+            for candidate in [widget] + widget.findChildren(QWidget):
+                if id(candidate) not in seen:
+                    seen.add(id(candidate))
+                    targets.append(candidate)
+        return targets
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _repolish(widget: QWidget) -> None:
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    # Item views overload update() with a required index
+    QWidget.update(widget)
+
+
+# Global restyle engine instance
+_restyle_engine = None
+
+
+def get_restyle_engine() -> RestyleEngine:
+    """Return global restyle engine instance"""
+    global _restyle_engine
+    if _restyle_engine is None:
+        _restyle_engine = RestyleEngine()
+    return _restyle_engine
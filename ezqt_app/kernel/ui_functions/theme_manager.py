@@ -24,16 +24,34 @@
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
+import weakref
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
+from PySide6.QtCore import QTimer
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from ..common import APP_PATH
 from ..app_functions.printer import get_printer
 from ..app_settings import Settings
 from ..app_functions import Kernel
+from ..app_functions.resource_resolver import get_resource_resolver
+from ..app_functions.qss_optimizer import resolve_theme_file
+from ..app_functions.preloader import get_preloader
+from ..app_functions.stylesheet_cache import (
+    get_source_version,
+    get_stylesheet_cache,
+    palette_hash,
+)
+from .restyle_engine import get_restyle_engine
+from .palette_theme import REFERENCE_THEME, build_palette, get_stylesheet_values
+from .component_themes import (
+    COMPONENT_MANIFEST,
+    get_component_containers,
+    split_stylesheet,
+)
+from ..app_functions.qss_template import get_qss_template
+from .theme_precompute import get_theme_precomputer
 
 ## ==> CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -60,63 +78,282 @@ class ThemeManager:
         customThemeFile : str, optional
             Custom theme file to use.
         """
-        _style = ""
         # Use Settings.Gui.THEME which has been updated by loadAppSettings
         _theme = Settings.Gui.THEME
+        palette_mode = Settings.Gui.THEME_MODE == "palette"
+
+        # Objects prepared while idle (see prepareTheme), else rendered now
+        prepared = get_theme_precomputer().take(
+            _theme, ThemeManager._getThemeKey(_theme, customThemeFile)
+        )
+        if prepared is None or "stylesheet" not in prepared:
+            prepared = ThemeManager._renderTheme(_theme, customThemeFile)
+            if prepared is None:
+                return
+        _style = f"{prepared['stylesheet']}\n"
+        _values = prepared["values"]
+
+        # Component rules are set on their containers (see component_themes)
+        # ///////////////////////////////////////////////////////////////
+        containers = get_component_containers(self.ui.styleSheet)
+        if palette_mode:
+            _style, sheets = split_stylesheet(_style, self.ui.styleSheet, containers)
+        else:
+            # Every component changes on a light/dark switch: split, the
+            # page container would be restyled twice (root and own sheet)
+            sheets = dict.fromkeys(containers, "")
+        for component, component_style in getattr(self, "_componentThemes", {}).items():
+            if component in sheets:
+                rendered = get_qss_template(component_style).render(_values)
+                sheets[component] = f"{sheets[component]}\n{rendered}".strip()
+
+        # //////
+        # Only what depends on the theme is restyled (see restyle_engine)
+        get_restyle_engine().apply_component_sheets(
+            {containers[component]: sheet for component, sheet in sheets.items()}
+        )
+        if palette_mode:
+            # Spread over frames with app.restyle_budget_ms
+            get_restyle_engine().apply_palette(
+                self.ui.styleSheet,
+                _style,
+                prepared["palette"],
+                budget_ms=Settings.Gui.RESTYLE_BUDGET_MS,
+            )
+        else:
+            get_restyle_engine().apply_stylesheet(self.ui.styleSheet, _style)
+
+    @staticmethod
+    def prepareTheme(self, theme: str = None) -> bool:
+        """
+        Prepare a theme in idle time, ahead of a switch to it.
+
+        Its stylesheet is rendered and the theme icons are recolored in
+        idle slices (see theme_precompute), so the switch only applies
+        prepared objects.
+
+        Parameters
+        ----------
+        theme : str, optional
+            Theme to prepare (default: the theme not in use).
+
+        Returns
+        -------
+        bool
+            False if the theme is already prepared or in preparation.
+        """
+        # Lazy import to avoid circular import
+        from ...widgets.extended.theme_icon import ThemeIcon
+
+        if theme is None:
+            theme = "light" if Settings.Gui.THEME == "dark" else "dark"
+        customThemeFile = getattr(self, "_themeFileName", None)
+
+        tasks = [lambda: ThemeManager._renderTheme(theme, customThemeFile)]
+        tasks.extend(
+            (lambda icon=icon: icon.prepare(theme))
+            for icon in ThemeIcon.get_instances()
+        )
+        return get_theme_precomputer().prepare(
+            theme, ThemeManager._getThemeKey(theme, customThemeFile), tasks
+        )
+
+    @staticmethod
+    def _getThemeKey(theme: str, customThemeFile: str = None) -> tuple:
+        # Inputs of a rendered theme, prepared objects must match them
+        palette_config = Kernel.loadKernelConfig("palette")
+        colors = palette_config.get("theme_palette", {}).get(theme, {})
+        main_qss = resolve_theme_file(
+            get_resource_resolver(), customThemeFile or "main_theme.qss"
+        )
+        return (
+            theme,
+            customThemeFile,
+            Settings.Gui.THEME_MODE,
+            palette_hash(colors),
+            main_qss,
+            get_source_version(main_qss),
+        )
+
+    @staticmethod
+    def _renderTheme(theme: str, customThemeFile: str = None) -> dict:
+        # Returns {"stylesheet", "values", "palette"}, None on error
         # Load palette from palette.yaml file
         palette_config = Kernel.loadKernelConfig("palette")
-        _colors = palette_config.get("theme_palette", {}).get(_theme, {})
+        theme_palette = palette_config.get("theme_palette", {})
+        _colors = theme_palette.get(theme, {})
+        # Palette mode: one structural stylesheet for every theme
+        palette_mode = Settings.Gui.THEME_MODE == "palette"
+        if palette_mode:
+            _values = get_stylesheet_values(
+                theme_palette.get(REFERENCE_THEME) or _colors, _colors
+            )
+        else:
+            _values = _colors
 
         # Main Theme
         # ///////////////////////////////////////////////////////////////
-        if customThemeFile:
-            # Use Path to handle Windows paths correctly
-            main_qss = APP_PATH / "bin" / "themes" / customThemeFile
-            try:
-                if main_qss.exists():
-                    with open(main_qss, "r", encoding="utf-8") as f:
-                        main_style = f.read()
-                    get_printer().verbose_msg(f"Custom theme file loaded: {main_qss}")
-                else:
-                    get_printer().warning(f"Custom theme file not found: {main_qss}")
-                    return
-            except Exception as e:
-                get_printer().error(f"Error reading custom theme file {main_qss}: {e}")
-                return
+        theme_file = customThemeFile or "main_theme.qss"
+        resolver = get_resource_resolver()
+        # Optimized version first (see FileMaker.optimize_qss)
+        main_qss = resolve_theme_file(resolver, theme_file)
+
+        if main_qss is not None:
+            source_key = str(main_qss)
+
+            def load_style() -> str:
+                # Read in the background at startup (see preloader)
+                main_style = get_preloader().read_text(main_qss)
+                get_printer().verbose_msg(f"Theme file loaded: {main_qss}")
+                return main_style
+
+        elif customThemeFile:
+            get_printer().warning(f"Custom theme file not found: {customThemeFile}")
+            return None
         else:
-            # Try local directory first, then package
-            local_qss = APP_PATH / "bin" / "themes" / "main_theme.qss"
-
-            get_printer().verbose_msg(f"Searching for theme file:")
-            get_printer().verbose_msg(f"  - Local: {local_qss}")
-
-            if local_qss.exists():
-                # Use local file
-                try:
-                    with open(local_qss, "r", encoding="utf-8") as f:
-                        main_style = f.read()
-                    get_printer().verbose_msg(f"Local theme file loaded: {local_qss}")
-                except Exception as e:
-                    get_printer().error(f"Error reading local file {local_qss}: {e}")
-                    return
-            else:
-                # Use embedded package resource
-                try:
-                    main_style = Kernel.getPackageResourceContent(
-                        "resources/themes/main_theme.qss"
-                    )
-                    get_printer().verbose_msg(
-                        "Package theme file loaded from embedded resources"
-                    )
-                except Exception as e:
-                    get_printer().error(f"Error reading embedded resource: {e}")
-                    return
+            # Use embedded package resource
+            source_key = "resources/themes/main_theme.qss"
 
-        # //////
-        for key, color in _colors.items():
-            main_style = main_style.replace(key, color)
-        # //////
-        _style += f"{main_style}\n"
+            def load_style() -> str:
+                main_style = Kernel.getPackageResourceContent(source_key)
+                get_printer().verbose_msg(
+                    "Package theme file loaded from embedded resources"
+                )
+                return main_style
 
-        # //////
-        self.ui.styleSheet.setStyleSheet(_style)
+        # Only an edit of the theme file makes it read again
+        source_version = get_source_version(main_qss)
+
+        # Rendered by ezqt init (main_theme.<theme>.qss) unless outdated,
+        # else once per (QSS content, palette, theme): switching back to a
+        # theme reuses the stylesheet built before
+        cache = get_stylesheet_cache()
+        try:
+            main_style = None
+            if palette_mode:
+                main_style = cache.render(
+                    source_key,
+                    load_style,
+                    _values,
+                    "palette",
+                    version=source_version,
+                )
+            elif main_qss is not None:
+                main_style = cache.load_rendered(main_qss, _colors, theme)
+            if main_style is None:
+                main_style = cache.render(
+                    source_key,
+                    load_style,
+                    _colors,
+                    theme,
+                    version=source_version,
+                )
+        except Exception as e:
+            get_printer().error(f"Error reading theme file {source_key}: {e}")
+            return None
+
+        return {
+            "stylesheet": main_style,
+            "values": _values,
+            "palette": build_palette(_colors) if palette_mode else None,
+        }
+
+    @staticmethod
+    def componentTheme(self, component: str, stylesheet: str = None) -> bool:
+        """
+        Apply a stylesheet to one component of the main window.
+
+        The stylesheet is rendered with the active palette and set on the
+        component container, so only that component is restyled. It is
+        kept on theme switches.
+
+        Parameters
+        ----------
+        component : str
+            Component name (see COMPONENT_MANIFEST), e.g. "header".
+        stylesheet : str, optional
+            QSS source, palette variables allowed (None: remove).
+
+        Returns
+        -------
+        bool
+            False if the component is unknown.
+        """
+        if component not in COMPONENT_MANIFEST:
+            get_printer().warning(f"Unknown theme component: {component}")
+            return False
+
+        if not hasattr(self, "_componentThemes"):
+            self._componentThemes = {}
+        if stylesheet:
+            self._componentThemes[component] = stylesheet
+        else:
+            self._componentThemes.pop(component, None)
+        # Unchanged root stylesheet and palette are skipped
+        ThemeManager.theme(self, getattr(self, "_themeFileName", None))
+        return True
+
+    @staticmethod
+    def watchTheme(self, customThemeFile: str = None) -> bool:
+        """
+        Re-apply the theme when its configuration is edited on disk.
+
+        Only palette keys of the active theme and the selected theme
+        trigger a restyle; other configuration edits are ignored. A reload
+        editing several colors restyles once, and a selected theme goes
+        through the same update as the theme toggle (``updateUI``).
+
+        Parameters
+        ----------
+        customThemeFile : str, optional
+            Custom theme file to use.
+
+        Returns
+        -------
+        bool
+            True if hot reload is available.
+        """
+        # The watcher lives as long as the process: it holds the window
+        # weakly and forgets it once the window is destroyed
+        window = weakref.ref(self)
+
+        def restyle():
+            if window() is not None:
+                ThemeManager.theme(window(), customThemeFile)
+
+        # Keys of one reload are reported one by one: restyle once after
+        reload_timer = QTimer(self)
+        reload_timer.setSingleShot(True)
+        reload_timer.setInterval(0)
+        reload_timer.timeout.connect(restyle)
+
+        def on_palette_changed(key_path, value):
+            if window() is not None and key_path.startswith(
+                f"theme_palette.{Settings.Gui.THEME}."
+            ):
+                reload_timer.start()
+
+        def on_theme_changed(key_path, value):
+            target = window()
+            theme = str(value or "dark").lower()
+            if target is None or theme == Settings.Gui.THEME:
+                return
+            Settings.Gui.THEME = theme
+            if hasattr(target, "updateUI"):
+                # Icons and theme toggle follow, as for a manual switch
+                target.updateUI()
+            else:
+                ThemeManager.theme(target, customThemeFile)
+
+        watching = Kernel.subscribeConfig(
+            "palette", "theme_palette", on_palette_changed
+        )
+        Kernel.subscribeConfig("app", "settings_panel.theme.default", on_theme_changed)
+        if watching:
+            self.destroyed.connect(
+                lambda: (
+                    Kernel.unsubscribeConfig(on_palette_changed),
+                    Kernel.unsubscribeConfig(on_theme_changed),
+                )
+            )
+        return watching
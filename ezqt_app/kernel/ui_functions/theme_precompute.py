@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+# EzQt_App - A Modern Qt Application Framework
+# ///////////////////////////////////////////////////////////////
+#
+# Author: EzQt_App Team
+# Website: https://github.com/ezqt-app/ezqt_app
+#
+# This file is part of EzQt_App.
+#
+# EzQt_App is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# EzQt_App is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with EzQt_App.  If not, see <https://www.gnu.org/licenses/>.
+# ///////////////////////////////////////////////////////////////
+
+"""
+Theme Precompute for EzQt_App
+=============================
+
+Preparation of a theme before the user switches to it. Opening the
+settings panel makes a theme switch likely, so ``ThemeManager.prepareTheme``
+queues the work of the other theme here: rendering its stylesheet (and its
+QPalette in palette mode) and recoloring the theme icons.
+
+Tasks run on the GUI thread in idle slices: a zero-delay timer runs tasks
+until ``slice_ms`` is spent, then yields to the event loop (e.g., to the
+panel animation). The switch then takes the prepared objects with
+``take``; a switch happening before the end of the preparation runs the
+remaining tasks at once. The time spent in idle slices for a theme that
+is switched to is reported as saved (``get_status``).
+
+Qt still restyles the widgets during the switch: that part depends on
+the live widgets and cannot be prepared.
+"""
+
+# IMPORT BASE
+# ///////////////////////////////////////////////////////////////
+import time
+from collections import deque
+
+# IMPORT SPECS
+# ///////////////////////////////////////////////////////////////
+from PySide6.QtCore import QTimer
+
+# IMPORT / GUI AND MODULES AND WIDGETS
+# ///////////////////////////////////////////////////////////////
+from ..app_functions.printer import get_printer
+
+# TYPE HINTS IMPROVEMENTS
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+## ==> GLOBALS
+# ///////////////////////////////////////////////////////////////
+
+# Time spent on tasks before yielding to the event loop
+IDLE_SLICE_MS = 4.0
+
+## ==> CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class ThemePrecomputer:
+    """
+    Runs the preparation of a theme in idle slices.
+
+    Parameters
+    ----------
+    slice_ms : float, optional
+        Time spent on tasks per slice (default: IDLE_SLICE_MS).
+    """
+
+    def __init__(self, slice_ms: float = IDLE_SLICE_MS) -> None:
+        self._slice_ms = slice_ms
+        self._tasks: "deque[Callable[[], Optional[Dict[str, Any]]]]" = deque()
+        # Theme in preparation and its inputs
+        self._theme: Optional[str] = None
+        self._key: Hashable = None
+        self._entry: Dict[str, Any] = {}
+        self._scheduled = False
+        # theme -> prepared objects, with "key" and "cost_ms"
+        self._prepared: Dict[str, Dict[str, Any]] = {}
+        self._stats: Dict[str, Any] = {
+            "prepared": 0,
+            "hits": 0,
+            "misses": 0,
+            "flushed": 0,
+            "slices": 0,
+            "prepare_ms": 0.0,
+            "saved_ms": 0.0,
+        }
+
+    # PREPARATION
+    # ///////////////////////////////////////////////////////////////
+
+    def prepare(
+        self,
+        theme: str,
+        key: Hashable,
+        tasks: Iterable[Callable[[], Optional[Dict[str, Any]]]],
+    ) -> bool:
+        """
+        Queue the preparation of a theme.
+
+        Parameters
+        ----------
+        theme : str
+            Theme to prepare.
+        key : Hashable
+            Inputs of the preparation (palette, theme file...): prepared
+            objects are only taken for the same key.
+        tasks : Iterable[Callable]
+            Tasks to run, each returning prepared objects to keep
+            ({name: object}) or None.
+
+        Returns
+        -------
+        bool
+            False if the theme is already prepared or in preparation.
+        """
+        prepared = self._prepared.get(theme)
+        if (prepared is not None and prepared["key"] == key) or (
+            self._theme == theme and self._key == key
+        ):
+            return False
+
+        # A single theme in preparation: the latest request wins
+        self._theme = theme
+        self._key = key
+        self._entry = {"key": key, "cost_ms": 0.0}
+        self._tasks = deque(tasks)
+        self._schedule()
+        return True
+
+    def take(self, theme: str, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Return the prepared objects of a theme the UI switches to.
+
+        Parameters
+        ----------
+        theme : str
+            Theme being applied.
+        key : Hashable
+            Current inputs of the theme.
+
+        Returns
+        -------
+        Dict[str, Any], optional
+            Prepared objects, None if the theme was not prepared for
+            these inputs.
+        """
+        if self._theme == theme and self._key == key:
+            # Switch before the end: the rest is not saved time
+            saved_ms = self._entry["cost_ms"]
+            self._stats["flushed"] += 1
+            self._run_tasks(budget_ms=None)
+            self._prepared[theme]["cost_ms"] = saved_ms
+
+        entry = self._prepared.pop(theme, None)
+        if entry is None:
+            return None
+        if entry["key"] != key:
+            # Prepared with another palette or theme file
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        self._stats["saved_ms"] += entry["cost_ms"]
+        return entry
+
+    def cancel(self) -> None:
+        """Drop the pending tasks and the prepared objects."""
+        self._tasks.clear()
+        self._theme = None
+        self._key = None
+        self._prepared.clear()
+
+    # INSTRUMENTATION
+    # ///////////////////////////////////////////////////////////////
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Return the preparation state and statistics.
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``state`` ("idle", "preparing" or "ready"), ``theme`` being
+            prepared, ``pending`` tasks, ``ready`` themes, and counters:
+            ``saved_ms`` is the preparation time of the themes switched
+            to, spent in idle slices instead of during the switch.
+        """
+        if self._theme is not None:
+            state = "preparing"
+        elif self._prepared:
+            state = "ready"
+        else:
+            state = "idle"
+        status: Dict[str, Any] = dict(self._stats)
+        status.update(
+            state=state,
+            theme=self._theme,
+            pending=len(self._tasks),
+            ready=sorted(self._prepared),
+        )
+        return status
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _schedule(self) -> None:
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._run_slice)
+
+    def _run_slice(self) -> None:
+        self._scheduled = False
+        if self._theme is None:
+            return
+        self._stats["slices"] += 1
+        self._run_tasks(budget_ms=self._slice_ms)
+        if self._tasks:
+            self._schedule()
+
+    def _run_tasks(self, budget_ms: Optional[float]) -> None:
+        start = time.perf_counter()
+        while self._tasks:
+            task = self._tasks.popleft()
+            task_start = time.perf_counter()
+            try:
+                result = task()
+            except Exception as e:
+                get_printer().verbose_msg(f"Theme preparation task failed: {e}")
+                result = None
+            if result:
+                self._entry.update(result)
+            self._entry["cost_ms"] += (time.perf_counter() - task_start) * 1000
+            if budget_ms is not None and (
+                (time.perf_counter() - start) * 1000 >= budget_ms
+            ):
+                break
+
+        if not self._tasks and self._theme is not None:
+            self._prepared[self._theme] = self._entry
+            self._stats["prepared"] += 1
+            self._stats["prepare_ms"] += self._entry["cost_ms"]
+            get_printer().verbose_msg(
+                f"Theme '{self._theme}' prepared in " f"{self._entry['cost_ms']:.1f} ms"
+            )
+            self._theme = None
+            self._key = None
+
+
+## ==> FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+# Global theme precomputer instance
+_theme_precomputer = None
+
+
+def get_theme_precomputer() -> ThemePrecomputer:
+    """Return global theme precomputer instance"""
+    global _theme_precomputer
+    if _theme_precomputer is None:
+        _theme_precomputer = ThemePrecomputer()
+    return _theme_precomputer
@@ -159,6 +159,41 @@ class UIFunctions:
         """
         ThemeManager.theme(self, customThemeFile)
 
+    def componentTheme(self, component: str, stylesheet: str = None) -> bool:
+        """
+        Apply a stylesheet to one component of the main window.
+
+        Parameters
+        ----------
+        component : str
+            Component name (e.g., "header").
+        stylesheet : str, optional
+            QSS source, palette variables allowed (None: remove).
+        """
+        return ThemeManager.componentTheme(self, component, stylesheet)
+
+    def prepareTheme(self, theme: str = None) -> bool:
+        """
+        Prepare a theme in idle time, ahead of a switch to it.
+
+        Parameters
+        ----------
+        theme : str, optional
+            Theme to prepare (default: the theme not in use).
+        """
+        return ThemeManager.prepareTheme(self, theme)
+
+    def watchTheme(self, customThemeFile: str = None) -> bool:
+        """
+        Re-apply the theme when its configuration is edited on disk.
+
+        Parameters
+        ----------
+        customThemeFile : str, optional
+            Custom theme file to use.
+        """
+        return ThemeManager.watchTheme(self, customThemeFile)
+
     # UI DEFINITIONS
     # ///////////////////////////////////////////////////////////////
 
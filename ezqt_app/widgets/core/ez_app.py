@@ -29,6 +29,7 @@ from PySide6.QtGui import QGuiApplication
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
+from ...kernel.app_functions.printer import get_printer
 
 # TYPE HINTS IMPROVEMENTS
 from typing import Any
@@ -100,6 +101,15 @@ class EzApplication(QApplication):
         os.environ["PYTHONIOENCODING"] = "utf-8"
         os.environ["QT_FONT_DPI"] = "96"
 
+        # ////// PRELOAD RESOURCES
+        # Configs, theme and translations load while the window is set up
+        try:
+            from ...kernel.app_functions import Kernel
+
+            Kernel.startPreload()
+        except Exception as e:
+            get_printer().verbose_msg(f"Resource preload unavailable: {e}")
+
     @classmethod
     def create_for_testing(cls, *args: Any, **kwargs: Any) -> "EzApplication":
         """
@@ -3,6 +3,7 @@
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
+import weakref
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
@@ -189,30 +190,19 @@ class SettingsPanel(QFrame):
         # Connect setting changes
         self.settingChanged.connect(self._on_setting_changed)
 
+        # Follow edits of app.yaml made outside the application
+        if load_from_yaml:
+            self._subscribe_to_config()
+
     # ///////////////////////////////////////////////////////////////
 
     def load_settings_from_yaml(self) -> None:
         """Load settings from YAML file."""
         try:
-            import yaml
-            from pathlib import Path
-
-            # Try to load the full app.yaml file directly
-            # Try multiple possible paths
-            possible_paths = [
-                Path.cwd() / "bin" / "config" / "app.yaml",  # User project
-                Path(__file__).parent.parent.parent
-                / "resources"
-                / "config"
-                / "app.yaml",  # Package
-            ]
-
-            app_config = None
-            for path in possible_paths:
-                if path.exists():
-                    with open(path, "r", encoding="utf-8") as f:
-                        app_config = yaml.safe_load(f)
-                    break
+            from ...kernel.app_functions.config_manager import get_config_manager
+
+            # Same resolution (project, cwd, package) as every other config
+            app_config = get_config_manager().load_config("app") or None
 
             if app_config is None:
                 get_printer().warning("Could not find app.yaml file")
@@ -238,6 +228,38 @@ class SettingsPanel(QFrame):
         except Exception as e:
             get_printer().warning(f"Error loading settings from YAML: {e}")
 
+    def _subscribe_to_config(self) -> None:
+        """Update setting widgets when app.yaml is edited on disk."""
+        try:
+            from ...kernel.app_functions.config_manager import get_config_manager
+
+            # The watcher lives as long as the process: it holds the panel
+            # weakly and forgets it once the panel is destroyed
+            panel = weakref.ref(self)
+
+            def on_key_changed(key_path: str, value) -> None:
+                if panel() is not None:
+                    panel()._on_config_key_changed(key_path, value)
+
+            manager = get_config_manager()
+            if manager.subscribe("app", "settings_panel", on_key_changed):
+                self.destroyed.connect(lambda: manager.unsubscribe(on_key_changed))
+        except Exception as e:
+            get_printer().verbose_msg(f"Settings hot reload unavailable: {e}")
+
+    def _on_config_key_changed(self, key_path: str, value) -> None:
+        """Apply an externally edited settings_panel.<key>.default value."""
+        parts = key_path.split(".")
+        if len(parts) != 3 or parts[2] != "default" or parts[1] not in self._settings:
+            return
+
+        # The value comes from the file: don't write it back
+        self._processing_setting_change = True
+        try:
+            self._settings[parts[1]].set_value(value)
+        finally:
+            self._processing_setting_change = False
+
     def add_setting_from_config(self, key: str, config: dict) -> QWidget:
         """Add a setting based on its YAML configuration."""
         setting_type = config.get("type", "text")
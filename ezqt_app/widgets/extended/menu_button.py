@@ -31,6 +31,7 @@ from PySide6.QtWidgets import (
 from ...kernel.app_settings import Settings
 from ...kernel.app_resources import *
 from ...kernel.app_functions.printer import get_printer
+from ...kernel.app_functions.pixmap_cache import get_pixmap_cache
 
 # ////// TYPE HINTS IMPROVEMENTS FOR PYSIDE6 6.9.1
 from typing import Optional, Union, Tuple, Any
@@ -57,17 +58,9 @@ def colorize_pixmap(
     Returns
     -------
     QPixmap
-        The colorized pixmap.
+        The colorized pixmap, shared with other callers (see pixmap_cache).
     """
-    result = QPixmap(pixmap.size())
-    result.fill(Qt.transparent)
-    painter = QPainter(result)
-    painter.setOpacity(opacity)
-    painter.drawPixmap(0, 0, pixmap)
-    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-    painter.fillRect(result.rect(), QColor(color))
-    painter.end()
-    return result
+    return get_pixmap_cache().colorize(pixmap, color, opacity)
 
 
 def load_icon_from_source(source: Optional[Union[QIcon, str]]) -> Optional[QIcon]:
@@ -3,35 +3,193 @@
 
 # IMPORT BASE
 # ///////////////////////////////////////////////////////////////
+import weakref
 
 # IMPORT SPECS
 # ///////////////////////////////////////////////////////////////
+import shiboken6
 from PySide6.QtCore import (
     Qt,
+    QRect,
+    QSize,
 )
 from PySide6.QtGui import (
     QPainter,
     QPixmap,
     QIcon,
+    QIconEngine,
     QColor,
 )
+from PySide6.QtWidgets import (
+    QApplication,
+    QStyleOption,
+)
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
 from ...kernel.app_functions.printer import get_printer
+from ...kernel.app_functions.pixmap_cache import get_pixmap_cache
 from ...kernel.app_settings import Settings
 from ...kernel.app_resources import *
 
 # ////// TYPE HINTS IMPROVEMENTS FOR PYSIDE6 6.9.1
-from typing import Union
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 
 # UTILITY FUNCTIONS
 # ///////////////////////////////////////////////////////////////
 
+# (width, height, device pixel ratio, mode, state) of a rendered pixmap
+_PixmapKey = Tuple[int, int, float, QIcon.Mode, QIcon.State]
+
 # CLASS
 # ///////////////////////////////////////////////////////////////
 
 
+class ThemeIconEngine(QIconEngine):
+    """
+    Icon engine recoloring a source icon for the current theme.
+
+    Pixmaps are rendered when Qt asks for them, at the requested size and
+    device pixel ratio, and kept for the current theme only: a theme
+    switch drops them. At most one other theme is kept, recolored ahead
+    of a switch with ``prepare``.
+
+    Parameters
+    ----------
+    source : QIcon
+        Icon to recolor.
+    source_key : Hashable, optional
+        Identifier of the source in the pixmap cache, e.g. its path
+        (default: the icon cache key).
+    """
+
+    # Clones handed to Qt (see clone), dropped once Qt deleted them
+    _clones: List["ThemeIconEngine"] = []
+
+    def __init__(self, source: QIcon, source_key: Hashable = None) -> None:
+        super().__init__()
+        self.source = source
+        self.source_key = source_key if source_key is not None else source.cacheKey()
+        self._theme: Optional[str] = None
+        # Pixmaps of the current theme
+        self._pixmaps: Dict[_PixmapKey, QPixmap] = {}
+        # theme -> pixmaps rendered ahead of a switch to that theme
+        self._prepared: Dict[str, Dict[_PixmapKey, QPixmap]] = {}
+
+    # ////// THEME
+    # ///////////////////////////////////////////////////////////////
+
+    def set_theme(self, theme: str) -> None:
+        """
+        Make a theme current, dropping the pixmaps of the others.
+
+        Parameters
+        ----------
+        theme : str
+            Current theme ("dark", "light").
+        """
+        if theme == self._theme:
+            return
+        self._theme = theme
+        self._pixmaps = self._prepared.pop(theme, {})
+        self._prepared.clear()
+
+    def prepare(self, theme: str) -> None:
+        """
+        Recolor the pixmaps in use for a theme ahead of a switch.
+
+        Parameters
+        ----------
+        theme : str
+            Theme the next switch is expected to ("dark", "light").
+        """
+        if theme == self._theme or theme in self._prepared:
+            return
+        keys = list(self._pixmaps) or [self._get_default_key()]
+        self._prepared = {theme: {key: self._render(theme, key) for key in keys}}
+
+    def get_pixmap_count(self) -> int:
+        """Return the number of pixmaps held, prepared ones included."""
+        return len(self._pixmaps) + sum(len(p) for p in self._prepared.values())
+
+    # ////// QICONENGINE INTERFACE
+    # ///////////////////////////////////////////////////////////////
+
+    def scaledPixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float
+    ) -> QPixmap:
+        self.set_theme(Settings.Gui.THEME)
+        key = (size.width(), size.height(), scale, mode, state)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._pixmaps[key] = self._render(self._theme, key)
+        return pixmap
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def paint(
+        self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State
+    ) -> None:
+        scale = painter.device().devicePixelRatioF() if painter.device() else 1.0
+        pixmap = self.scaledPixmap(rect.size(), mode, state, scale)
+        painter.drawPixmap(rect, pixmap)
+
+    def actualSize(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QSize:
+        return self.source.actualSize(size, mode, state)
+
+    def availableSizes(
+        self, mode: QIcon.Mode = QIcon.Normal, state: QIcon.State = QIcon.Off
+    ) -> List[QSize]:
+        return self.source.availableSizes(mode, state)
+
+    def isNull(self) -> bool:
+        return self.source.isNull()
+
+    def key(self) -> str:
+        return "ThemeIconEngine"
+
+    def clone(self) -> "ThemeIconEngine":
+        # Qt owns the clone but not its Python object, which must stay alive
+        ThemeIconEngine._clones = [
+            engine for engine in ThemeIconEngine._clones if shiboken6.isValid(engine)
+        ]
+        engine = ThemeIconEngine(self.source, self.source_key)
+        ThemeIconEngine._clones.append(engine)
+        return engine
+
+    # ////// UTILITY FUNCTIONS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_default_key(self) -> _PixmapKey:
+        sizes = self.source.availableSizes()
+        size = sizes[0] if sizes else QSize(16, 16)
+        return (size.width(), size.height(), 1.0, QIcon.Normal, QIcon.Off)
+
+    def _render(self, theme: str, key: _PixmapKey) -> QPixmap:
+        width, height, scale, mode, state = key
+        size = QSize(width, height)
+        # Dark theme: light icon, light theme: dark icon
+        new_color = QColor(Qt.white if theme == "dark" else Qt.black)
+
+        # ////// RECOLOR ORIGINAL PIXMAP, SHARED WITH ICONS OF THE SAME SOURCE
+        new_pixmap = get_pixmap_cache().get_colorized(
+            (self.source_key, state),
+            new_color,
+            1.0,
+            size,
+            scale,
+            lambda: self.source.pixmap(size, scale, QIcon.Normal, state),
+        )
+
+        if mode != QIcon.Normal and QApplication.instance() is not None:
+            # Disabled, active and selected looks given by the style
+            new_pixmap = QApplication.style().generatedIconPixmap(
+                mode, new_pixmap, QStyleOption()
+            )
+        return new_pixmap
+
+
 class ThemeIcon(QIcon):
     """
     Icon with automatic theme support.
@@ -39,8 +197,16 @@ class ThemeIcon(QIcon):
     This class extends QIcon to provide an icon that adapts
     automatically to the current theme (light/dark). The icon changes
     color based on the application theme.
+
+    Drawing is done by a ThemeIconEngine: copies of the icon set on
+    widgets follow the theme too, and only the pixmaps of the current
+    theme are kept. The variant of a theme can be recolored ahead of a
+    switch with ``prepare`` (see theme_precompute).
     """
 
+    # Live instances, weak: an icon is released with its owner
+    _instances: "weakref.WeakSet[ThemeIcon]" = weakref.WeakSet()
+
     def __init__(self, original_icon: Union[QIcon, str]) -> None:
         """
         Initialize icon with theme support.
@@ -50,10 +216,18 @@ class ThemeIcon(QIcon):
         original_icon : QIcon or str
             The original icon or path to the icon.
         """
-        super().__init__()
-        self.original_icon = (
+        source = (
             QIcon(original_icon) if isinstance(original_icon, str) else original_icon
         )
+        # Icons of a same file share their recolored pixmaps
+        engine = ThemeIconEngine(
+            source, original_icon if isinstance(original_icon, str) else None
+        )
+        super().__init__(engine)
+        self.original_icon = source
+        # Shared with the copies of the icon, which own it on the C++ side
+        self.engine = engine
+        ThemeIcon._instances.add(self)
         self.updateIcon()
         self._connect_theme_changed()
 
@@ -75,6 +249,22 @@ class ThemeIcon(QIcon):
             # Fallback if import fails
             get_printer().warning("Could not connect to EzApplication theme signal")
 
+    @classmethod
+    def get_instances(cls) -> List["ThemeIcon"]:
+        """Return the live theme icons."""
+        return list(cls._instances)
+
+    def prepare(self, theme: str) -> None:
+        """
+        Recolor the icon for a theme ahead of a switch.
+
+        Parameters
+        ----------
+        theme : str
+            Theme the next switch is expected to ("dark", "light").
+        """
+        self.engine.prepare(theme)
+
     def updateIcon(self) -> None:
         """
         Update icon based on current theme.
@@ -82,27 +272,8 @@ class ThemeIcon(QIcon):
         Changes icon color based on theme:
         - Dark theme: light icon
         - Light theme: dark icon
-        """
-        icon_color = "light" if Settings.Gui.THEME == "dark" else "dark"
-
-        # ////// GET ORIGINAL PIXMAP
-        pixmap = self.original_icon.pixmap(self.original_icon.availableSizes()[0])
-
-        # ////// CREATE IMAGE FOR MANIPULATION
-        image = pixmap.toImage()
-
-        # ////// DETERMINE NEW COLOR
-        new_color = QColor(Qt.white if icon_color == "light" else Qt.black)
 
-        # ////// CREATE NEW PIXMAP
-        new_pixmap = QPixmap(image.size())
-        new_pixmap.fill(Qt.transparent)
-
-        # ////// DRAW COLORED ICON
-        painter = QPainter(new_pixmap)
-        painter.drawImage(0, 0, image)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(image.rect(), new_color)
-        painter.end()
-
-        self.addPixmap(new_pixmap)
+        Pixmaps of the previous theme are dropped, the new ones are
+        rendered when the icon is next drawn.
+        """
+        self.engine.set_theme(Settings.Gui.THEME)
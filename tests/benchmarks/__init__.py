@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Micro-benchmarks for EzQt_App.
+
+Benchmark scripts are named ``bench_*.py`` so that pytest does not
+collect them. Run them from the project root, for example:
+
+    python -m tests.benchmarks.bench_yaml_backend
+"""
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Compare blocking and frame-budgeted palette theme switches.
+
+The window holds a stacked widget with one page shown, like the pages of
+EzQt_App. For each budget, a switch is timed three ways: the synchronous
+call, the time until the visible widgets are restyled, and the longest
+interval between two ticks of a 1 ms timer while the visible widgets are
+restyled (how long input would wait). Hidden pages are restyled when shown.
+
+Usage:
+    python -m tests.benchmarks.bench_progressive_restyle [--pages 20]
+        [--widgets-per-page 100] [--budgets 0 8] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QApplication,
+    QLabel,
+    QPushButton,
+    QStackedWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ezqt_app.kernel.app_functions.qss_template import get_qss_template
+from ezqt_app.kernel.ui_functions.palette_theme import (
+    REFERENCE_THEME,
+    build_palette,
+    get_stylesheet_values,
+)
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+from .bench_theme_modes import THEMES, load_theme
+from .common import print_table, summarize
+
+
+def build_window(pages, widgets_per_page):
+    """Build a window showing one page of a stacked widget."""
+    window = QWidget()
+    stack = QStackedWidget(window)
+    QVBoxLayout(window).addWidget(stack)
+    for i in range(pages):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        for j in range(widgets_per_page):
+            if j % 5 == 0:
+                layout.addWidget(QPushButton(f"button {i}.{j}", page))
+            else:
+                layout.addWidget(QLabel(f"label {i}.{j}", page))
+        stack.addWidget(page)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+def run(pages, widgets_per_page, budgets, repeat):
+    """Run the benchmark and return the result rows."""
+    # Importing ezqt_app selects a desktop platform plugin, override it
+    app = QApplication.instance() or QApplication(["bench", "-platform", "offscreen"])
+    source, palettes = load_theme()
+    structural = get_qss_template(source).render(
+        get_stylesheet_values(palettes[REFERENCE_THEME])
+    )
+    qpalettes = [build_palette(palettes[theme]) for theme in THEMES]
+    default_palette = app.palette()
+
+    ticks = []
+    timer = QTimer()
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    timer.start(1)
+
+    rows = []
+    for budget_ms in budgets:
+        window = build_window(pages, widgets_per_page)
+        engine = RestyleEngine()
+        engine.apply_palette(window, structural, qpalettes[0])
+        samples = {"call": [], "visible": [], "gap": []}
+        for i in range(repeat + 1):
+            ticks.clear()
+            start = time.perf_counter()
+            engine.apply_palette(
+                window, structural, qpalettes[(i + 1) % 2], budget_ms=budget_ms
+            )
+            called = time.perf_counter()
+            status = engine.get_progressive_status()
+            while status is not None and status["state"] == "running":
+                app.processEvents()
+                status = engine.get_progressive_status()
+            app.processEvents()
+            end = time.perf_counter()
+            if i == 0:
+                # Warmup
+                continue
+            stamps = [start] + [t for t in ticks if t > start] + [end]
+            samples["call"].append((called - start) * 1000)
+            samples["visible"].append((end - start) * 1000)
+            samples["gap"].append(max(b - a for a, b in zip(stamps, stamps[1:])) * 1000)
+        medians = {name: summarize(s)["median_ms"] for name, s in samples.items()}
+        rows.append(
+            (
+                budget_ms or "blocking",
+                len(window.findChildren(QWidget)),
+                f"{medians['call']:.1f}",
+                f"{medians['visible']:.1f}",
+                f"{medians['gap']:.1f}",
+            )
+        )
+        engine.flush()
+        window.close()
+        window.deleteLater()
+        app.setPalette(default_palette)
+        app.processEvents()
+    timer.stop()
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Progressive restyle benchmark")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--widgets-per-page", type=int, default=100)
+    parser.add_argument("--budgets", type=float, nargs="+", default=[0, 8])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.pages, args.widgets_per_page, args.budgets, args.repeat)
+    print_table(
+        "Palette switch, main_theme.qss (median of runs)",
+        ["budget ms", "widgets", "call ms", "visible ms", "longest gap ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Compare a theme switch through the restyle engine with the former loop.
+
+The legacy path mirrors the previous EzQt_App.updateUI: setStyleSheet on
+the host, processEvents, then unpolish/polish of every widget of the
+application. The engine path only sets the stylesheet, Qt repolishing
+the host and its descendants once.
+
+Usage:
+    python -m tests.benchmarks.bench_restyle [--sizes 1000 5000 20000] [--repeat 3]
+"""
+
+import argparse
+
+from PySide6.QtWidgets import QApplication, QLabel, QPushButton, QVBoxLayout, QWidget
+
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+from .common import measure, print_table
+
+THEMES = [
+    "QWidget { background: #202020; color: #f0f0f0; }"
+    ' QPushButton[class="active"] { border: 1px solid #3080f0; }',
+    "QWidget { background: #f0f0f0; color: #202020; }"
+    ' QPushButton[class="active"] { border: 1px solid #1060c0; }',
+]
+
+
+def build_window(size):
+    """Build a window holding size widgets, one tenth of them with a class."""
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    for i in range(size // 10):
+        row = QWidget(window)
+        for j in range(9):
+            QLabel(f"label {i}.{j}", row)
+        button = QPushButton(f"button {i}", row)
+        if i % 4 == 0:
+            button.setProperty("class", "active")
+        layout.addWidget(row)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+def _legacy_switch(app, host, stylesheet):
+    host.setStyleSheet(stylesheet)
+    app.processEvents()
+    for widget in app.allWidgets():
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+def run(sizes, repeat):
+    """Run the benchmark and return the result rows."""
+    # Importing ezqt_app selects a desktop platform plugin, override it
+    app = QApplication.instance() or QApplication(["bench", "-platform", "offscreen"])
+    rows = []
+    for size in sizes:
+        window = build_window(size)
+        engine = RestyleEngine()
+        state = {"theme": 0}
+
+        def switch(func):
+            state["theme"] ^= 1
+            func(THEMES[state["theme"]])
+            app.processEvents()
+
+        legacy = measure(
+            lambda: switch(lambda qss: _legacy_switch(app, window, qss)), repeat
+        )
+        scoped = measure(
+            lambda: switch(lambda qss: engine.apply_stylesheet(window, qss)), repeat
+        )
+        rows.append(
+            (
+                len(window.findChildren(QWidget)),
+                f"{legacy['mean_ms']:.1f}",
+                f"{scoped['mean_ms']:.1f}",
+                f"{legacy['mean_ms'] / scoped['mean_ms']:.2f}x",
+            )
+        )
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Theme switch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.repeat)
+    print_table(
+        "Theme switch (mean of runs)",
+        ["widgets", "legacy ms", "engine ms", "legacy/engine"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
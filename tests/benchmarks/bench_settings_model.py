@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Compare reads through the compiled settings model with dict navigation.
+
+The dict path mirrors the lookups previously done in EzQt_App.__init__:
+chained ``dict.get`` calls guarded by try/except.
+
+Usage:
+    python -m tests.benchmarks.bench_settings_model [--sizes 10 1000] [--reads 100000]
+"""
+
+import argparse
+
+from ezqt_app.kernel.app_functions.settings_model import compile_app_settings
+
+from .common import generate_app_config, measure, print_table
+
+
+def _dict_reads(data, reads):
+    for _ in range(reads):
+        try:
+            settings_panel = data.get("settings_panel", {})
+            _theme = settings_panel.get("theme", {}).get("default", "dark").lower()
+            _width = data["app"]["app_width"]
+        except Exception:
+            _theme = "dark"
+
+
+def _model_reads(model, reads):
+    for _ in range(reads):
+        _theme = model.theme
+        _width = model.app.app_width
+
+
+def _entry_reads(model, key, reads):
+    panel = model.settings_panel
+    for _ in range(reads):
+        _default = getattr(panel, key).default
+
+
+def _entry_dict_reads(data, key, reads):
+    for _ in range(reads):
+        _default = data.get("settings_panel", {}).get(key, {}).get("default")
+
+
+def run(sizes, reads, repeat):
+    """Run the benchmark and return the result rows."""
+    rows = []
+    for size in sizes:
+        data = generate_app_config(size)
+        compile_ms = measure(lambda: compile_app_settings(data), repeat)["mean_ms"]
+        model = compile_app_settings(data)
+        key = f"setting_{size - 1}"
+
+        cases = [
+            ("theme + width", _dict_reads, data, _model_reads, model),
+            ("setting default", _entry_dict_reads, data, _entry_reads, model),
+        ]
+        for name, dict_func, dict_arg, model_func, model_arg in cases:
+            extra = () if dict_func is _dict_reads else (key,)
+            dict_ms = measure(lambda: dict_func(dict_arg, *extra, reads), repeat)
+            model_ms = measure(lambda: model_func(model_arg, *extra, reads), repeat)
+            rows.append(
+                (
+                    size,
+                    name,
+                    f"{compile_ms:.2f}",
+                    f"{dict_ms['mean_ms'] * 1e6 / reads:.0f}",
+                    f"{model_ms['mean_ms'] * 1e6 / reads:.0f}",
+                    f"{dict_ms['mean_ms'] / model_ms['mean_ms']:.2f}x",
+                )
+            )
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Settings model benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000])
+    parser.add_argument("--reads", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.reads, args.repeat)
+    print_table(
+        "Settings reads (mean of runs)",
+        ["settings", "read", "compile ms", "dict ns", "model ns", "dict/model"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
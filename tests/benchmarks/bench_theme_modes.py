@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Compare light/dark switches in the stylesheet and palette theme modes.
+
+Both modes use the shipped main_theme.qss and palette.yaml. In stylesheet
+mode a switch applies the stylesheet rendered for the other theme, which
+Qt parses again. In palette mode the structural stylesheet is applied
+once and a switch only sets the application palette and repolishes.
+
+Usage:
+    python -m tests.benchmarks.bench_theme_modes [--sizes 1000 5000] [--repeat 5]
+"""
+
+import argparse
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from ezqt_app.kernel.app_functions.qss_template import get_qss_template
+from ezqt_app.kernel.app_functions.resource_resolver import PACKAGE_RESOURCES_DIR
+from ezqt_app.kernel.app_functions.yaml_backend import safe_load
+from ezqt_app.kernel.ui_functions.palette_theme import (
+    REFERENCE_THEME,
+    build_palette,
+    get_stylesheet_values,
+)
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+from .bench_restyle import build_window
+from .common import measure, print_table
+
+THEMES = ("dark", "light")
+
+
+def load_theme():
+    """Return the shipped QSS source and theme palettes."""
+    source = (PACKAGE_RESOURCES_DIR / "themes" / "main_theme.qss").read_text(
+        encoding="utf-8"
+    )
+    with open(PACKAGE_RESOURCES_DIR / "config" / "palette.yaml", encoding="utf-8") as f:
+        palettes = safe_load(f)["theme_palette"]
+    return source, palettes
+
+
+def run(sizes, repeat):
+    """Run the benchmark and return the result rows."""
+    # Importing ezqt_app selects a desktop platform plugin, override it
+    app = QApplication.instance() or QApplication(["bench", "-platform", "offscreen"])
+    source, palettes = load_theme()
+    template = get_qss_template(source)
+    stylesheets = [template.render(palettes[theme]) for theme in THEMES]
+    structural = template.render(get_stylesheet_values(palettes[REFERENCE_THEME]))
+    qpalettes = [build_palette(palettes[theme]) for theme in THEMES]
+    default_palette = app.palette()
+
+    rows = []
+    for size in sizes:
+        state = {"theme": 0}
+
+        def switch(func):
+            state["theme"] ^= 1
+            func(state["theme"])
+            app.processEvents()
+
+        window = build_window(size)
+        engine = RestyleEngine()
+        engine.apply_stylesheet(window, stylesheets[0])
+        by_stylesheet = measure(
+            lambda: switch(lambda i: engine.apply_stylesheet(window, stylesheets[i])),
+            repeat,
+        )
+
+        # The structural stylesheet is applied once, outside the measure
+        engine.apply_palette(window, structural, qpalettes[state["theme"]])
+        by_palette = measure(
+            lambda: switch(
+                lambda i: engine.apply_palette(window, structural, qpalettes[i])
+            ),
+            repeat,
+        )
+        rows.append(
+            (
+                len(window.findChildren(QWidget)),
+                f"{by_stylesheet['median_ms']:.1f}",
+                f"{by_palette['median_ms']:.1f}",
+                f"{by_stylesheet['median_ms'] / by_palette['median_ms']:.2f}x",
+            )
+        )
+        window.close()
+        window.deleteLater()
+        app.setPalette(default_palette)
+        app.processEvents()
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Theme mode switch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.repeat)
+    print_table(
+        "Light/dark switch, main_theme.qss (median of runs)",
+        ["widgets", "stylesheet ms", "palette ms", "stylesheet/palette"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
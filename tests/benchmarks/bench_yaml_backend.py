@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Compare the libyaml and pure-Python YAML backends on large app.yaml files.
+
+Usage:
+    python -m tests.benchmarks.bench_yaml_backend [--sizes 1000 5000] [--repeat 5]
+"""
+
+import argparse
+
+from ezqt_app.kernel.app_functions.yaml_backend import (
+    get_available_yaml_backends,
+    safe_dump,
+    safe_load,
+)
+
+from .common import generate_app_config, measure, print_table
+
+
+def run(sizes, repeat):
+    """Run the benchmark and return the result rows."""
+    rows = []
+    for size in sizes:
+        data = generate_app_config(size)
+        text = safe_dump(data, backend="python")
+        for backend in get_available_yaml_backends():
+            load = measure(lambda: safe_load(text, backend=backend), repeat)
+            dump = measure(lambda: safe_dump(data, backend=backend), repeat)
+            rows.append(
+                (
+                    size,
+                    backend,
+                    f"{len(text) / 1024:.0f} KB",
+                    f"{load['mean_ms']:.1f}",
+                    f"{dump['mean_ms']:.1f}",
+                )
+            )
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="YAML backend benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.repeat)
+    print_table(
+        "YAML backends (mean of runs)",
+        ["settings", "backend", "size", "load ms", "dump ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Compare round-trip patching with the full-dump write path on large app.yaml files.
+
+Each run persists a batch of key updates, the way the write-behind queue
+does after a burst of settings changes. "patch" is patch_config_file,
+which dumps files above ROUND_TRIP_MAX_SIZE again; the "rt" columns time
+the round-trip engine alone, for the first batch (parse included) and
+the next ones.
+
+Usage:
+    python -m tests.benchmarks.bench_yaml_patcher [--sizes 50 1000 5000] [--keys 1 20]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from ezqt_app.kernel.app_functions.config_manager import ConfigManager
+from ezqt_app.kernel.app_functions.yaml_backend import safe_dump
+
+from .common import generate_app_config, measure, print_table
+
+
+def _make_project(root, data):
+    config_dir = Path(root) / "bin" / "config"
+    config_dir.mkdir(parents=True)
+    config_file = config_dir / "app.yaml"
+    config_file.write_text(safe_dump(data), encoding="utf-8")
+    return config_file
+
+
+def run(sizes, key_counts, repeat):
+    """Run the benchmark and return the result rows."""
+    rows = []
+    for size in sizes:
+        data = generate_app_config(size)
+        settings = list(data["settings_panel"])
+        for key_count in key_counts:
+            updates = {
+                ("settings_panel", key, "default"): i
+                for i, key in enumerate(settings[:key_count])
+            }
+            with tempfile.TemporaryDirectory() as root:
+                config_file = _make_project(root, data)
+                manager = ConfigManager()
+                manager.set_project_root(Path(root))
+                manager.set_snapshots_enabled(False)
+                config = manager.load_config("app")
+                file_size = config_file.stat().st_size
+
+                full = measure(lambda: manager.write_config_file("app", config), repeat)
+                patch = measure(
+                    lambda: manager.patch_config_file("app", updates), repeat
+                )
+
+                # Round-trip engine alone, whatever the size of the file
+                patcher = manager.get_patcher()
+
+                def first_render():
+                    # Parse the file again, as after a restart
+                    patcher.discard()
+                    patcher.render(config_file, updates)
+
+                first = measure(first_render, repeat)
+                steady = measure(lambda: patcher.render(config_file, updates), repeat)
+            rows.append(
+                (
+                    size,
+                    key_count,
+                    f"{file_size / 1024:.0f}",
+                    f"{full['mean_ms']:.1f}",
+                    f"{patch['mean_ms']:.1f}",
+                    f"{first['mean_ms']:.1f}",
+                    f"{steady['mean_ms']:.1f}",
+                )
+            )
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="YAML patcher benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 1000, 5000])
+    parser.add_argument("--keys", type=int, nargs="+", default=[1, 20])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.keys, args.repeat)
+    print_table(
+        "Config write paths (mean of runs)",
+        [
+            "settings",
+            "keys",
+            "file KB",
+            "full dump ms",
+            "patch ms",
+            "rt first ms",
+            "rt next ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
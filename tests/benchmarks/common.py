@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Shared helpers for the EzQt_App micro-benchmarks.
+"""
+
+import statistics
+import time
+
+
+def generate_app_config(settings_count):
+    """Generate an app.yaml-like document with many settings_panel entries."""
+    settings_panel = {
+        "theme": {
+            "type": "toggle",
+            "label": "Active Theme",
+            "options": ["Light", "Dark"],
+            "default": "dark",
+            "description": "Choose the application theme",
+            "enabled": True,
+        }
+    }
+    setting_types = ["checkbox", "slider", "select", "text", "toggle"]
+    for i in range(settings_count):
+        setting_type = setting_types[i % len(setting_types)]
+        setting = {
+            "type": setting_type,
+            "label": f"Setting {i}",
+            "description": f"Generated setting number {i} (é, ü, ç)",
+            "enabled": i % 3 != 0,
+        }
+        if setting_type == "slider":
+            setting.update({"min": 0, "max": 100, "default": i % 100, "unit": "%"})
+        elif setting_type == "select":
+            setting.update({"options": ["A", "B", "C"], "default": "B"})
+        elif setting_type == "text":
+            setting["default"] = f"value_{i}"
+        else:
+            setting["default"] = bool(i % 2)
+        settings_panel[f"setting_{i}"] = setting
+
+    return {
+        "app": {
+            "name": "BenchmarkApp",
+            "description": "Generated benchmark configuration",
+            "app_width": 1280,
+            "app_min_width": 940,
+            "app_height": 720,
+            "app_min_height": 560,
+            "theme": "dark",
+            "menu_panel_shrinked_width": 60,
+            "menu_panel_extended_width": 240,
+            "settings_panel_width": 240,
+            "time_animation": 400,
+        },
+        "settings_panel": settings_panel,
+    }
+
+
+def measure(func, repeat=5, warmup=1):
+    """Run func several times and return timing statistics in milliseconds."""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return summarize(samples)
+
+
+def summarize(samples):
+    """Return timing statistics of samples given in milliseconds."""
+    return {
+        "min_ms": min(samples),
+        "mean_ms": statistics.mean(samples),
+        "median_ms": statistics.median(samples),
+        "max_ms": max(samples),
+    }
+
+
+def print_table(title, headers, rows):
+    """Print benchmark results as an aligned text table."""
+    widths = [
+        max(len(str(headers[i])), *(len(str(row[i])) for row in rows))
+        for i in range(len(headers))
+    ]
+    print(f"\n{title}")
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
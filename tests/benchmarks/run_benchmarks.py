@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Time EzQt_App construction, theme switches and language switches.
+
+Each profile builds a synthetic project (menus, one page per menu, widgets
+per page, settings_panel entries) in a temporary directory and runs it in
+a fresh interpreter on the offscreen QPA platform, the kernel state being
+global. The restyle_* operations apply the same rule change to the root
+stylesheet (restyle_global) and to the stylesheet of one component (see
+component_themes). Results can be written as JSON and compared with the results of
+another commit: with --compare, the exit status is 1 when an operation is
+slower than the baseline by more than --threshold.
+
+Usage:
+    python -m tests.benchmarks.run_benchmarks [--profiles small medium]
+        [--menus 10 --widgets-per-page 50 --settings 20]
+        [--theme-mode palette] [--repeat 5] [--warmup 1] [--output results.json]
+        [--compare baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from .common import generate_app_config, print_table, summarize
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+PROFILES = {
+    "small": {"menus": 5, "widgets_per_page": 20, "settings": 10},
+    "medium": {"menus": 20, "widgets_per_page": 100, "settings": 100},
+    "large": {"menus": 50, "widgets_per_page": 400, "settings": 500},
+}
+
+OPERATIONS = ("construct", "set_app_theme", "load_language")
+
+# Statistic compared with the baseline, less sensitive to outliers than the mean
+COMPARED_STAT = "median_ms"
+
+
+# ////// WORKER (runs inside the synthetic project)
+# ///////////////////////////////////////////////////////////////
+
+
+def _write_app_config(project, settings, theme_mode):
+    from ezqt_app.kernel.app_functions.yaml_backend import safe_dump, safe_load
+
+    config_file = project / "bin" / "config" / "app.yaml"
+    config = safe_load(config_file.read_text(encoding="utf-8")) or {}
+    generated = generate_app_config(settings)["settings_panel"]
+    generated.pop("theme")
+    config.setdefault("settings_panel", {}).update(generated)
+    config.setdefault("app", {})["theme_mode"] = theme_mode
+    config_file.write_text(safe_dump(config), encoding="utf-8")
+
+
+def _populate(window, spec):
+    from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
+
+    from ezqt_app.kernel.resource_definitions import Icons
+
+    for i in range(spec["menus"]):
+        page = window.addMenu(f"Menu {i}", Icons.cil_home)
+        layout = QVBoxLayout(page)
+        for j in range(spec["widgets_per_page"]):
+            if j % 5 == 0:
+                widget = QPushButton(f"Button {i}.{j}", page)
+                widget.setProperty("class", "active" if j % 10 == 0 else "")
+            else:
+                widget = QLabel(f"Label {i}.{j}", page)
+            layout.addWidget(widget)
+
+
+def _destroy(app, window):
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def _run_worker(spec_file, output_file):
+    spec = json.loads(Path(spec_file).read_text(encoding="utf-8"))
+    project = Path.cwd()
+    # APP_PATH is the directory of the main script, resolved at import
+    sys.argv[0] = str(project / "main.py")
+
+    import ezqt_app.main as ezqt_app_main
+    from PySide6.QtWidgets import QWidget
+
+    from ezqt_app.app import EzApplication, EzQt_App
+    from ezqt_app.kernel.translation import get_translation_manager
+    from ezqt_app.kernel.ui_functions import COMPONENT_MANIFEST, get_restyle_engine
+
+    ezqt_app_main.init()
+    _write_app_config(project, spec["settings"], spec["theme_mode"])
+    # Importing ezqt_app selects a desktop platform plugin, override it
+    app = EzApplication(["ezqt_benchmark", "-platform", "offscreen"])
+
+    def build():
+        window = EzQt_App(themeFileName="main_theme.qss")
+        _populate(window, spec)
+        window.show()
+        app.processEvents()
+        return window
+
+    samples = {name: [] for name in OPERATIONS}
+    for i in range(spec["warmup"] + spec["repeat"]):
+        start = time.perf_counter()
+        window = build()
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= spec["warmup"]:
+            samples["construct"].append(elapsed)
+        _destroy(app, window)
+
+    window = build()
+    widgets = len(window.findChildren(QWidget))
+
+    toggle = window.ui.settingsPanel.get_theme_toggle_button()
+    for i in range(spec["warmup"] + spec["repeat"]):
+        if toggle is not None:
+            # Switch the selector silently, as setAppTheme reads it
+            toggle.blockSignals(True)
+            toggle.value_id = 1 - toggle.value_id
+            toggle.blockSignals(False)
+        start = time.perf_counter()
+        window.setAppTheme()
+        app.processEvents()
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= spec["warmup"]:
+            samples["set_app_theme"].append(elapsed)
+
+    manager = get_translation_manager()
+    languages = [code for code in manager.get_available_languages() if code != "en"]
+    for i in range(spec["warmup"] + spec["repeat"]):
+        code = languages[i % len(languages)] if i % 2 == 0 and languages else "en"
+        start = time.perf_counter()
+        manager.load_language_by_code(code)
+        app.processEvents()
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= spec["warmup"]:
+            samples["load_language"].append(elapsed)
+
+    # Same rule change, on the root stylesheet then on each component
+    engine = get_restyle_engine()
+    host = window.ui.styleSheet
+    base_style = host.styleSheet()
+    targets = {"global": host.objectName(), **COMPONENT_MANIFEST}
+    for component, object_name in targets.items():
+        name = f"restyle_{component}"
+        samples[name] = []
+        for i in range(spec["warmup"] + spec["repeat"]):
+            color = "$_main_accent_color" if i % 2 else "$_base_text_color"
+            rule = f"#{object_name} QLabel {{ color: {color}; }}"
+            start = time.perf_counter()
+            if component == "global":
+                engine.apply_stylesheet(host, f"{base_style}\n{rule}")
+            else:
+                window.setComponentTheme(component, rule)
+            app.processEvents()
+            elapsed = (time.perf_counter() - start) * 1000
+            if i >= spec["warmup"]:
+                samples[name].append(elapsed)
+        if component == "global":
+            engine.apply_stylesheet(host, base_style)
+        else:
+            window.setComponentTheme(component, None)
+
+    _destroy(app, window)
+    Path(output_file).write_text(
+        json.dumps(
+            {
+                "widgets": widgets,
+                "operations": {
+                    name: summarize(values) for name, values in samples.items()
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+# ////// HARNESS
+# ///////////////////////////////////////////////////////////////
+
+
+def run_profile(spec, repeat, warmup, theme_mode="stylesheet", timeout=900):
+    """Run the operations of a profile in a fresh interpreter."""
+    spec = dict(spec, repeat=repeat, warmup=warmup, theme_mode=theme_mode)
+    with tempfile.TemporaryDirectory(prefix="ezqt_bench_") as tmp:
+        project = Path(tmp)
+        spec_file = project / "spec.json"
+        output_file = project / "result.json"
+        spec_file.write_text(json.dumps(spec), encoding="utf-8")
+
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])
+        )
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "tests.benchmarks.run_benchmarks",
+                "--worker",
+                str(spec_file),
+                str(output_file),
+            ],
+            cwd=project,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if process.returncode != 0 or not output_file.exists():
+            raise RuntimeError(
+                f"Benchmark worker failed ({process.returncode}):\n"
+                f"{process.stderr[-2000:]}"
+            )
+        result = json.loads(output_file.read_text(encoding="utf-8"))
+
+    result["size"] = {key: spec[key] for key in PROFILES["small"]}
+    return result
+
+
+def get_metadata(repeat, warmup, theme_mode):
+    """Return the environment the results were measured in."""
+    try:
+        import PySide6
+
+        pyside = PySide6.__version__
+    except ImportError:
+        pyside = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pyside": pyside,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "theme_mode": theme_mode,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline.
+
+    Returns the table rows and the list of regressions, i.e. operations
+    whose median time exceeds the baseline one by more than threshold.
+    """
+    rows = []
+    regressions = []
+    for profile, result in results["profiles"].items():
+        base = baseline.get("profiles", {}).get(profile)
+        if base is None:
+            continue
+        for name, stats in result["operations"].items():
+            base_stats = base["operations"].get(name)
+            if base_stats is None:
+                continue
+            ratio = stats[COMPARED_STAT] / max(base_stats[COMPARED_STAT], 1e-9)
+            regressed = ratio > 1 + threshold
+            if regressed:
+                regressions.append((profile, name, ratio))
+            rows.append(
+                (
+                    profile,
+                    name,
+                    f"{base_stats[COMPARED_STAT]:.1f}",
+                    f"{stats[COMPARED_STAT]:.1f}",
+                    f"{ratio:.2f}x",
+                    "REGRESSION" if regressed else "ok",
+                )
+            )
+    return rows, regressions
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="EzQt_App benchmark harness")
+    parser.add_argument(
+        "--profiles", nargs="+", choices=sorted(PROFILES), default=["small", "medium"]
+    )
+    parser.add_argument("--menus", type=int, help="Custom profile: menus (pages)")
+    parser.add_argument("--widgets-per-page", type=int, help="Custom profile")
+    parser.add_argument("--settings", type=int, help="Custom profile")
+    parser.add_argument(
+        "--theme-mode", choices=["stylesheet", "palette"], default="stylesheet"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown over the baseline (default: 0.2, i.e. +20%%)",
+    )
+    parser.add_argument("--worker", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _run_worker(*args.worker)
+        return 0
+
+    profiles = {name: PROFILES[name] for name in args.profiles}
+    custom = (args.menus, args.widgets_per_page, args.settings)
+    if any(value is not None for value in custom):
+        profiles = {
+            "custom": {
+                key: PROFILES["small"][key] if value is None else value
+                for key, value in zip(PROFILES["small"], custom)
+            }
+        }
+
+    results = {
+        "meta": get_metadata(args.repeat, args.warmup, args.theme_mode),
+        "profiles": {},
+    }
+    rows = []
+    for name, spec in profiles.items():
+        result = run_profile(spec, args.repeat, args.warmup, args.theme_mode)
+        results["profiles"][name] = result
+        for operation, stats in result["operations"].items():
+            rows.append(
+                (
+                    name,
+                    result["widgets"],
+                    operation,
+                    f"{stats['min_ms']:.1f}",
+                    f"{stats['median_ms']:.1f}",
+                    f"{stats['max_ms']:.1f}",
+                )
+            )
+    print_table(
+        "EzQt_App operations (offscreen)",
+        ["profile", "widgets", "operation", "min ms", "median ms", "max ms"],
+        rows,
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        rows, regressions = compare(results, baseline, args.threshold)
+        if not rows:
+            print(f"\nNo profile in common with {args.compare}")
+            return 0
+        print_table(
+            f"Comparison with {args.compare} (threshold +{args.threshold:.0%})",
+            ["profile", "operation", "baseline ms", "current ms", "ratio", "status"],
+            rows,
+        )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the component-scoped stylesheets.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QFrame, QLabel, QPushButton, QWidget
+
+from ezqt_app.kernel.ui_functions import component_themes
+from ezqt_app.kernel.ui_functions.component_themes import (
+    get_component_containers,
+    split_stylesheet,
+)
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+QSS = """
+QLabel { color: #101010; }
+#headerContainer { background: #202020; }
+#headerAppName, #headerContainer QLabel { color: #ff0000; }
+#toggleButton { color: #00ff00; }
+#headerAppName, #toggleButton { font-weight: bold; }
+#title { color: #0000ff; }
+"""
+
+
+def _add(parent, cls, name):
+    widget = cls(parent)
+    widget.setObjectName(name)
+    return widget
+
+
+@pytest.fixture
+def root(qt_application):
+    """Create a window with a header, a menu and a widget outside both."""
+    widget = QWidget()
+    widget.setObjectName("styleSheet")
+    header = _add(widget, QFrame, "headerContainer")
+    _add(header, QLabel, "headerAppName")
+    _add(header, QLabel, "title")
+    menu = _add(widget, QFrame, "menuContainer")
+    _add(menu, QLabel, "toggleButton")
+    _add(widget, QLabel, "title")
+    yield widget
+    widget.deleteLater()
+
+
+class _StyleEvents(QObject):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.StyleChange:
+            self.count += 1
+        return False
+
+
+def _text_color(label):
+    label.ensurePolished()
+    return label.palette().color(QPalette.WindowText)
+
+
+STATE_QSS = """
+QPushButton { background-color: #101010; border: none; }
+QPushButton:hover { background-color: #202020; }
+#headerContainer QPushButton:checked { background-color: #00ff00; }
+#menuButton:pressed { background-color: #ff00ff; }
+#menuContainer QPushButton:hover { background-color: #ffff00; }
+"""
+
+CROSS_QSS = """
+#headerButton:pressed, #menuButton:checked { background-color: #00ffff; }
+#styleSheet #headerButton:checked { background-color: #0000ff; }
+"""
+
+
+@pytest.fixture
+def state_root(qt_application):
+    """Create a window with checked and pressed buttons in two components."""
+    widget = QWidget()
+    widget.setObjectName("styleSheet")
+    widget.resize(200, 100)
+    header = _add(widget, QFrame, "headerContainer")
+    header.setGeometry(0, 0, 200, 50)
+    for index, name in enumerate(("headerButton", "otherButton")):
+        button = _add(header, QPushButton, name)
+        button.setGeometry(10 + 60 * index, 10, 50, 30)
+        button.setCheckable(True)
+        button.setChecked(True)
+    menu = _add(widget, QFrame, "menuContainer")
+    menu.setGeometry(0, 50, 200, 50)
+    button = _add(menu, QPushButton, "menuButton")
+    button.setGeometry(10, 10, 50, 30)
+    button.setCheckable(True)
+    button.setDown(True)
+    widget.show()
+    yield widget
+    widget.deleteLater()
+
+
+def _apply_split(root, stylesheet):
+    containers = get_component_containers(root)
+    global_sheet, sheets = split_stylesheet(stylesheet, root, containers)
+    root.setStyleSheet(global_sheet)
+    RestyleEngine().apply_component_sheets(
+        {containers[name]: sheet for name, sheet in sheets.items()}
+    )
+    return global_sheet, sheets
+
+
+def _background_colors(root):
+    colors = []
+    for button in root.findChildren(QPushButton):
+        image = button.grab().toImage()
+        colors.append(image.pixelColor(image.width() // 2, 2).name())
+    return colors
+
+
+class TestComponentThemes:
+    """Tests for stylesheets scoped to component containers."""
+
+    def test_containers_follow_the_manifest(self, root):
+        """Test that missing containers are omitted."""
+        containers = get_component_containers(root)
+
+        assert set(containers) == {"header", "menu"}
+        assert containers["header"].objectName() == "headerContainer"
+
+    def test_rules_go_to_the_component_of_their_object_names(self, root):
+        """Test the assignment of rules to components."""
+        global_sheet, sheets = split_stylesheet(
+            QSS, root, get_component_containers(root)
+        )
+
+        assert sheets["header"].splitlines() == [
+            "#headerContainer {background: #202020;}",
+            "#headerAppName, #headerContainer QLabel {color: #ff0000;}",
+        ]
+        assert sheets["menu"] == "#toggleButton {color: #00ff00;}"
+        # No object name, two components, or a name used outside
+        assert "QLabel {color: #101010;}" in global_sheet
+        assert "#headerAppName, #toggleButton" in global_sheet
+        assert "#title" in global_sheet
+
+    def test_split_is_reused_for_the_same_stylesheet(self, root):
+        """Test that a palette switch does not parse the stylesheet again."""
+        containers = get_component_containers(root)
+        component_themes._parse_cache.clear()
+        with patch.object(
+            component_themes, "parse_rules", wraps=component_themes.parse_rules
+        ) as parse:
+            first = split_stylesheet(QSS, root, containers)
+            first[1]["header"] += "\n#extra { }"
+            second = split_stylesheet(QSS, root, containers)
+            split_stylesheet(QSS + "#title { }", root, containers)
+
+        assert parse.call_count == 2
+        assert "#extra" not in second[1]["header"]
+
+    def test_split_sheets_style_like_the_whole_sheet(self, root):
+        """Test that scoping rules does not change the result."""
+        labels = root.findChildren(QLabel)
+        root.setStyleSheet(QSS)
+        expected = [_text_color(label) for label in labels]
+
+        containers = get_component_containers(root)
+        global_sheet, sheets = split_stylesheet(QSS, root, containers)
+        root.setStyleSheet(global_sheet)
+        RestyleEngine().apply_component_sheets(
+            {containers[name]: sheet for name, sheet in sheets.items()}
+        )
+
+        assert [_text_color(label) for label in labels] == expected
+        assert expected[0] == QColor("#ff0000")
+
+    def test_split_follows_widgets_added_later(self, root):
+        """Test that a name reused in another component is not moved."""
+        containers = get_component_containers(root)
+        assert "#toggleButton" in split_stylesheet(QSS, root, containers)[1]["menu"]
+
+        _add(containers["header"], QLabel, "toggleButton")
+        global_sheet, sheets = split_stylesheet(QSS, root, containers)
+
+        assert "#toggleButton" not in sheets["menu"]
+        assert "#toggleButton {color: #00ff00;}" in global_sheet
+
+    def test_pseudo_state_rules_style_like_the_whole_sheet(self, state_root):
+        """Test checked, pressed and cross-component rules after a split."""
+        state_root.setStyleSheet(STATE_QSS)
+        expected = _background_colors(state_root)
+
+        global_sheet, sheets = _apply_split(state_root, STATE_QSS)
+
+        assert _background_colors(state_root) == expected
+        assert expected == ["#00ff00", "#00ff00", "#ff00ff"]
+        assert "QPushButton:hover" in global_sheet
+        assert "#menuContainer QPushButton:hover" in sheets["menu"]
+        assert "#menuButton:pressed" in sheets["menu"]
+        assert "#headerContainer QPushButton:checked" in sheets["header"]
+
+    def test_overriding_global_rules_keep_components_global(self, state_root):
+        """Test that a nearer sheet never overrides a later or stronger rule."""
+        stylesheet = STATE_QSS + CROSS_QSS
+        state_root.setStyleSheet(stylesheet)
+        expected = _background_colors(state_root)
+
+        global_sheet, sheets = _apply_split(state_root, stylesheet)
+
+        assert _background_colors(state_root) == expected
+        assert expected[0] == "#0000ff"
+        assert sheets == {"header": "", "menu": ""}
+        assert "#headerContainer QPushButton:checked" in global_sheet
+        assert "#menuContainer QPushButton:hover" in global_sheet
+
+    def test_component_update_restyles_its_subtree_only(self, root):
+        """Test that widgets of other components are left alone."""
+        engine = RestyleEngine()
+        containers = get_component_containers(root)
+        root.setStyleSheet(QSS)
+        root.show()
+        events = _StyleEvents()
+        toggle = root.findChild(QLabel, "toggleButton")
+        toggle.installEventFilter(events)
+
+        header = containers["header"]
+        assert engine.apply_component_sheets({header: "QLabel { color: #ffffff; }"})
+        assert _text_color(header.findChild(QLabel, "headerAppName")) == QColor(
+            "#ffffff"
+        )
+        assert events.count == 0
+        assert engine.get_stats()["components"] == 1
+
+    def test_unchanged_component_sheets_are_skipped(self, root):
+        """Test that only changed containers are restyled."""
+        engine = RestyleEngine()
+        containers = get_component_containers(root)
+        engine.apply_component_sheets({containers["header"]: "QLabel { }"})
+
+        assert (
+            engine.apply_component_sheets(
+                {containers["header"]: "QLabel { }", containers["menu"]: ""}
+            )
+            == 0
+        )
@@ -0,0 +1,846 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the configuration manager.
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+
+import pytest
+import yaml
+from pathlib import Path
+from unittest.mock import patch
+
+from ezqt_app.kernel.app_functions import config_snapshot, yaml_backend
+from ezqt_app.kernel.app_functions.atomic_write import DurabilityMode
+from ezqt_app.kernel.app_functions.config_layers import get_user_config_dir
+from ezqt_app.kernel.app_functions.config_manager import ConfigManager, flatten_config
+from ezqt_app.kernel.app_functions.config_snapshot import ConfigSnapshotCache
+from ezqt_app.kernel.app_functions.config_watcher import diff_flat_indexes
+from ezqt_app.kernel.app_functions.resource_resolver import (
+    PACKAGE_RESOURCES_DIR,
+    ResourceResolver,
+)
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    """Create a project with a bin/config/app.yaml file."""
+    config_dir = tmp_path / "bin" / "config"
+    config_dir.mkdir(parents=True)
+    with open(config_dir / "app.yaml", "w", encoding="utf-8") as f:
+        yaml.dump({"app": {"name": "Snapshot App", "theme": "dark"}}, f)
+    return tmp_path
+
+
+@pytest.fixture
+def manager(project_root):
+    """Create a configuration manager bound to the test project."""
+    config_manager = ConfigManager()
+    config_manager.set_project_root(project_root)
+    config_manager.set_user_config_dir(project_root / "user")
+    config_manager.refresh_environment({})
+    return config_manager
+
+
+class TestConfigSnapshots:
+    """Tests for the persistent parsed-config snapshots."""
+
+    def test_first_load_writes_snapshot(self, manager, project_root):
+        """Test that a cold load parses the YAML and writes a snapshot."""
+        config = manager.load_config("app")
+
+        assert config["app"]["name"] == "Snapshot App"
+        stats = manager.get_snapshot_stats()
+        # Package and project layers
+        assert stats["misses"] == 2
+        assert stats["hits"] == 0
+        assert stats["writes"] == 2
+        assert list((project_root / "bin" / "config" / ".cache").glob("*.json"))
+
+    def test_unchanged_file_hits_snapshot(self, manager, project_root):
+        """Test that a new manager reuses the snapshot of an unchanged file."""
+        manager.load_config("app")
+
+        other = ConfigManager()
+        other.set_project_root(project_root)
+        config = other.load_config("app")
+
+        assert config["app"]["name"] == "Snapshot App"
+        assert other.get_snapshot_stats()["hits"] == 2
+        assert other.get_snapshot_stats()["misses"] == 0
+
+    def test_modified_file_invalidates_snapshot(self, manager, project_root):
+        """Test that editing the YAML forces a new parse."""
+        manager.load_config("app")
+
+        config_file = project_root / "bin" / "config" / "app.yaml"
+        with open(config_file, "w", encoding="utf-8") as f:
+            yaml.dump({"app": {"name": "Edited App", "theme": "light"}}, f)
+
+        other = ConfigManager()
+        other.set_project_root(project_root)
+        config = other.load_config("app")
+
+        assert config["app"]["name"] == "Edited App"
+        assert other.get_snapshot_stats()["misses"] == 1
+
+    def test_corrupted_snapshot_falls_back_to_yaml(self, manager, project_root):
+        """Test that an unreadable snapshot is ignored and rewritten."""
+        manager.load_config("app")
+        for snapshot in (project_root / "bin" / "config" / ".cache").glob("*.json"):
+            snapshot.write_bytes(b"not a snapshot")
+
+        other = ConfigManager()
+        other.set_project_root(project_root)
+        config = other.load_config("app")
+
+        assert config["app"]["name"] == "Snapshot App"
+        stats = other.get_snapshot_stats()
+        assert stats["errors"] == 2
+        assert stats["writes"] == 2
+
+    def test_snapshots_are_plain_json(self, manager, project_root):
+        """Test that snapshots hold data only, never executable objects."""
+        manager.load_config("app")
+        config_file = project_root / "bin" / "config" / "app.yaml"
+        snapshots = {}
+        for snapshot in (project_root / "bin" / "config" / ".cache").glob("*.json"):
+            header, data = snapshot.read_text(encoding="utf-8").split("\n")
+            key = json.loads(header)["key"]
+            snapshots[key[1]] = (key[2:], json.loads(data))
+
+        stat = config_file.stat()
+        assert snapshots[str(config_file.resolve())] == (
+            [stat.st_mtime_ns, stat.st_size],
+            yaml.safe_load(config_file.read_text()),
+        )
+
+    def test_content_is_hashed_when_stat_matches(self, tmp_path):
+        """Test that a changed mtime or size is a miss without a hash check."""
+        (tmp_path / "config").mkdir()
+        source = tmp_path / "app.yaml"
+        source.write_text("app:\n  name: Hashed\n", encoding="utf-8")
+        snapshots = ConfigSnapshotCache(tmp_path / "config" / ".cache")
+        snapshots.load(source, yaml.safe_load)
+
+        with patch.object(
+            config_snapshot.hashlib, "sha256", wraps=config_snapshot.hashlib.sha256
+        ) as sha256:
+            assert snapshots.load(source, yaml.safe_load) == {"app": {"name": "Hashed"}}
+            assert sha256.call_count == 1
+            os.utime(source, ns=(0, 0))
+            snapshots.load(source, yaml.safe_load)
+            # Hash of the rewritten snapshot only
+            assert sha256.call_count == 2
+
+        assert snapshots.get_stats()["hits"] == 1
+        assert snapshots.get_stats()["misses"] == 2
+
+    def test_non_json_content_is_not_snapshotted(self, tmp_path):
+        """Test that content JSON cannot give back is parsed every time."""
+        (tmp_path / "config").mkdir()
+        source = tmp_path / "app.yaml"
+        source.write_text("release: 2024-01-31\n1: one\n", encoding="utf-8")
+        snapshots = ConfigSnapshotCache(tmp_path / "config" / ".cache")
+
+        for _ in range(2):
+            data = snapshots.load(source, yaml.safe_load)
+
+        assert data[1] == "one"
+        assert str(data["release"]) == "2024-01-31"
+        assert snapshots.get_stats()["writes"] == 0
+        assert snapshots.get_stats()["misses"] == 2
+
+    def test_disabled_snapshots(self, manager, project_root):
+        """Test that disabled snapshots never touch the cache directory."""
+        manager.set_snapshots_enabled(False)
+        manager.load_config("app")
+
+        assert not (project_root / "bin" / "config" / ".cache").exists()
+        assert manager.get_snapshot_stats()["enabled"] is False
+
+    def test_clear_snapshots(self, manager):
+        """Test removal of snapshot blobs."""
+        manager.load_config("app")
+
+        assert manager.clear_snapshots() == 2
+        assert manager.clear_snapshots() == 0
+
+
+class TestYamlBackend:
+    """Tests for the YAML backend layer."""
+
+    def teardown_method(self):
+        """Restore automatic backend selection."""
+        yaml_backend.set_yaml_backend("auto")
+
+    def test_python_backend_always_available(self):
+        """Test that the pure-Python backend is always usable."""
+        assert "python" in yaml_backend.get_available_yaml_backends()
+
+    def test_backends_round_trip_identically(self):
+        """Test that every backend reads and writes the same data."""
+        data = {"app": {"name": "Ünïcode App", "sizes": [1, 2, 3], "flag": True}}
+        for backend in yaml_backend.get_available_yaml_backends():
+            text = yaml_backend.safe_dump(data, backend=backend)
+            assert "Ünïcode App" in text
+            assert yaml_backend.safe_load(text, backend=backend) == data
+
+    def test_unknown_backend_falls_back(self):
+        """Test that an unavailable backend falls back to automatic selection."""
+        selected = yaml_backend.set_yaml_backend("does-not-exist")
+
+        assert selected in yaml_backend.get_available_yaml_backends()
+        assert yaml_backend.get_yaml_backend() == selected
+
+    def test_safe_load_rejects_python_tags(self):
+        """Test that arbitrary Python objects are never constructed."""
+        with pytest.raises(yaml.YAMLError):
+            yaml_backend.safe_load("value: !!python/object/apply:os.system ['echo']")
+
+
+class TestResourceResolver:
+    """Tests for the cached resource resolver."""
+
+    def test_project_root_has_priority(self, project_root):
+        """Test that the project bin directory is searched first."""
+        resolver = ResourceResolver()
+        resolver.set_project_root(project_root)
+
+        candidates = resolver.candidates("config", "app.yaml")
+
+        assert candidates[0] == project_root / "bin" / "config" / "app.yaml"
+        assert PACKAGE_RESOURCES_DIR / "config" / "app.yaml" in candidates
+        assert resolver.resolve("config", "app.yaml") == candidates[0]
+
+    def test_resolution_is_memoized(self, project_root):
+        """Test that a resolved location is not probed again."""
+        resolver = ResourceResolver()
+        resolver.set_project_root(project_root)
+
+        first = resolver.resolve("config", "app.yaml")
+        with patch.object(Path, "exists", side_effect=AssertionError("probed")):
+            second = resolver.resolve("config", "app.yaml")
+
+        assert first == second
+        assert resolver.get_stats()["hits"] == 1
+
+    def test_project_root_change_drops_entries(self, project_root, tmp_path_factory):
+        """Test that changing the project root invalidates memoized entries."""
+        resolver = ResourceResolver()
+        resolver.set_project_root(project_root)
+        resolver.resolve("config", "app.yaml")
+
+        other_root = tmp_path_factory.mktemp("other")
+        resolver.set_project_root(other_root)
+
+        assert resolver.get_stats()["entries"] == 0
+        assert resolver.resolve("config", "app.yaml") != (
+            project_root / "bin" / "config" / "app.yaml"
+        )
+
+    def test_package_fallback(self):
+        """Test that package resources are found without any project."""
+        resolver = ResourceResolver()
+
+        assert resolver.resolve("config", "palette.yaml").exists()
+        assert resolver.resolve_dir("translations").is_dir()
+        assert resolver.resolve("config", "missing.yaml") is None
+
+    def test_config_manager_uses_project_file(self, manager, project_root):
+        """Test that the manager loads the project file through the resolver."""
+        manager.load_config("app")
+
+        assert manager.get_loaded_configs()["app"] == (
+            project_root / "bin" / "config" / "app.yaml"
+        )
+
+
+class TestConfigWriteQueue:
+    """Tests for the debounced write-behind queue."""
+
+    def _read_project_config(self, project_root):
+        with open(project_root / "bin" / "config" / "app.yaml", encoding="utf-8") as f:
+            return yaml.safe_load(f)
+
+    def test_burst_is_coalesced_into_one_write(self, manager, project_root):
+        """Test that a slider-like burst produces a single disk write."""
+        queue = manager.get_write_queue()
+        queue.set_delay(50)
+
+        threads = threading.active_count()
+        for value in range(200):
+            queue.enqueue("app", ["settings_panel", "volume", "default"], value)
+        # One long-lived writer thread, not one per update
+        assert threading.active_count() <= threads + 1
+
+        # The new value is visible in memory before it reaches the disk
+        assert manager.get_config_value("app", "settings_panel.volume.default") == 199
+        assert queue.has_pending()
+
+        deadline = time.monotonic() + 5
+        while queue.has_pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        stats = queue.get_stats()
+        assert stats["writes"] == 1
+        assert stats["coalesced"] == 199
+        config = self._read_project_config(project_root)
+        assert config["settings_panel"]["volume"]["default"] == 199
+        assert config["app"]["name"] == "Snapshot App"
+
+    def test_flush_writes_synchronously(self, manager, project_root):
+        """Test that flush persists pending updates immediately."""
+        queue = manager.get_write_queue()
+        queue.set_delay(10_000)
+        queue.enqueue("app", ["app", "theme"], "light")
+
+        assert queue.flush() == 1
+        assert not queue.has_pending()
+        assert self._read_project_config(project_root)["app"]["theme"] == "light"
+
+    def test_zero_delay_writes_on_every_update(self, manager, project_root):
+        """Test the synchronous mode."""
+        queue = manager.get_write_queue()
+        queue.set_delay(0)
+        queue.enqueue("app", ["app", "theme"], "light")
+        queue.enqueue("app", ["app", "theme"], "dark")
+
+        assert queue.get_stats()["writes"] == 2
+        assert self._read_project_config(project_root)["app"]["theme"] == "dark"
+
+    def test_write_leaves_no_temporary_file(self, manager, project_root):
+        """Test that the atomic write cleans up after itself."""
+        manager.get_write_queue().set_delay(0)
+        manager.get_write_queue().enqueue("app", ["app", "name"], "Renamed")
+
+        config_dir = project_root / "bin" / "config"
+        assert not list(config_dir.glob("*.tmp"))
+
+
+class TestFlatIndex:
+    """Tests for the flattened key-path index."""
+
+    def test_flatten_config_indexes_every_node(self):
+        """Test that leaves and intermediate mappings are indexed."""
+        index = flatten_config({"app": {"name": "App", "sizes": {"w": 10}}})
+
+        assert index["app.name"] == "App"
+        assert index["app.sizes.w"] == 10
+        assert index["app.sizes"] == {"w": 10}
+        assert "app" in index
+
+    def test_get_config_value_uses_index(self, manager):
+        """Test lookups of leaves, mappings, missing keys and None values."""
+        manager.set_value_in_memory("app", ["app", "icon"], None)
+
+        assert manager.get_config_value("app", "app.name") == "Snapshot App"
+        assert manager.get_config_value("app", "app")["theme"] == "dark"
+        assert manager.get_config_value("app", "app.missing", "x") == "x"
+        assert manager.get_config_value("app", "app.icon", "x") is None
+
+    def test_set_value_updates_index(self, manager):
+        """Test that in-memory updates keep the index consistent."""
+        manager.set_value_in_memory("app", ["app", "theme"], {"name": "light"})
+        assert manager.get_config_value("app", "app.theme.name") == "light"
+
+        manager.set_value_in_memory("app", ["app", "theme"], "dark")
+        assert manager.get_config_value("app", "app.theme") == "dark"
+        assert manager.get_config_value("app", "app.theme.name") is None
+
+        manager.set_value_in_memory("app", ["panel", "volume", "default"], 5)
+        assert manager.get_config_value("app", "panel.volume") == {"default": 5}
+
+    def test_accessor_follows_updates(self, manager):
+        """Test that an accessor always returns the current value."""
+        theme = manager.accessor("app", "app.theme", "none")
+        missing = manager.accessor("app", "app.missing", "none")
+
+        assert theme() == "dark"
+        assert missing.get() == "none"
+
+        manager.set_value_in_memory("app", ["app", "theme"], "light")
+        assert theme() == "light"
+
+        manager.clear_cache()
+        assert theme() == "dark"
+
+
+class TestConfigWatcher:
+    """Tests for config hot reload."""
+
+    def _edit(self, project_root, data):
+        with open(
+            project_root / "bin" / "config" / "app.yaml", "w", encoding="utf-8"
+        ) as f:
+            yaml.dump(data, f)
+
+    def test_diff_reports_changed_leaves_only(self):
+        """Test that the diff ignores mappings and reports removals."""
+        old = flatten_config({"app": {"name": "A", "theme": "dark", "old": 1}})
+        new = flatten_config({"app": {"name": "A", "theme": "light", "new": 2}})
+
+        assert diff_flat_indexes(old, new) == [
+            ("app.new", 2),
+            ("app.old", None),
+            ("app.theme", "light"),
+        ]
+
+    def test_reload_emits_only_changed_keys(
+        self, qt_application, manager, project_root
+    ):
+        """Test that subscribers only receive the keys below their prefix."""
+        manager.load_config("app")
+        received = []
+        assert manager.subscribe(
+            "app", "app.theme", lambda k, v: received.append((k, v))
+        )
+
+        self._edit(project_root, {"app": {"name": "Renamed", "theme": "light"}})
+        changed = manager.get_watcher().reload("app")
+
+        assert changed == ["app.name", "app.theme"]
+        assert received == [("app.theme", "light")]
+        assert manager.get_config_value("app", "app.name") == "Renamed"
+
+    def test_file_edit_triggers_reload(
+        self, qt_application, qtbot, manager, project_root
+    ):
+        """Test that an external edit is picked up by the file watcher."""
+        manager.load_config("app")
+        watcher = manager.get_watcher()
+
+        with qtbot.waitSignal(watcher.keyChanged, timeout=3000) as blocker:
+            self._edit(
+                project_root, {"app": {"name": "Snapshot App", "theme": "light"}}
+            )
+
+        assert blocker.args == ["app", "app.theme", "light"]
+
+    def test_own_writes_are_ignored(self, qt_application, qtbot, manager):
+        """Test that writes made by the manager are not reported as edits."""
+        manager.load_config("app")
+        watcher = manager.get_watcher()
+        manager.get_write_queue().set_delay(0)
+        manager.get_write_queue().enqueue("app", ["app", "theme"], "light")
+
+        qtbot.wait(300)
+
+        assert watcher.get_stats()["reloads"] == 0
+        assert manager.get_config_value("app", "app.theme") == "light"
+
+
+class TestAtomicPersistence:
+    """Tests for crash-safe configuration writes."""
+
+    def test_durable_mode_syncs_to_disk(self, manager, project_root):
+        """Test that the durable mode fsyncs and records its latency."""
+        manager.set_durability("durable")
+        with patch("os.fsync") as fsync:
+            assert manager.save_config("app", {"app": {"name": "Durable"}})
+
+        assert fsync.call_count == 2  # file, then directory
+        stats = manager.get_write_stats()
+        assert stats["durability"] == "durable"
+        assert stats["count"] == 1
+        assert stats["last_ms"] > 0
+
+    def test_fast_mode_skips_fsync(self, manager):
+        """Test that the fast mode never calls fsync."""
+        with patch("os.fsync") as fsync:
+            assert manager.save_config("app", {"app": {"name": "Fast"}})
+
+        fsync.assert_not_called()
+        assert manager.get_durability() is DurabilityMode.FAST
+
+    def test_failed_write_keeps_original_file(self, manager, project_root):
+        """Test that an interrupted write never truncates the target."""
+        config_file = project_root / "bin" / "config" / "app.yaml"
+        original = config_file.read_text(encoding="utf-8")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            assert not manager.save_config("app", {"app": {"name": "Lost"}})
+
+        assert config_file.read_text(encoding="utf-8") == original
+        assert not list(config_file.parent.glob(".*.tmp"))
+        assert manager.get_write_stats()["errors"] == 1
+
+    def test_unknown_mode_falls_back_to_fast(self, manager):
+        """Test that an invalid durability mode is rejected."""
+        manager.set_durability("paranoid")
+
+        assert manager.get_durability() is DurabilityMode.FAST
+
+
+COMMENTED_APP_YAML = """\
+# Application settings
+app:
+  name: "Patched App"  # window title
+  theme: dark
+settings_panel:
+  volume:
+    # Slider value
+    default: 10
+    options: ["Low", "High"]
+"""
+
+
+class TestYamlPatcher:
+    """Tests for round-trip patching of configuration files."""
+
+    @pytest.fixture
+    def commented_manager(self, manager, project_root):
+        """Manager whose app.yaml contains comments and quoted values."""
+        config_file = project_root / "bin" / "config" / "app.yaml"
+        config_file.write_text(COMMENTED_APP_YAML, encoding="utf-8")
+        manager.load_config("app", force_reload=True)
+        return manager
+
+    def _read(self, project_root):
+        return (project_root / "bin" / "config" / "app.yaml").read_text("utf-8")
+
+    def test_scalar_updates_keep_comments_and_quotes(
+        self, commented_manager, project_root
+    ):
+        """Test that scalar updates keep comments, quotes and key order."""
+        assert commented_manager.patch_config_file(
+            "app",
+            {("app", "name"): "Renamed", ("settings_panel", "volume", "default"): 42},
+        )
+
+        lines = self._read(project_root).splitlines()
+        assert lines[0] == "# Application settings"
+        assert lines[2].startswith('  name: "Renamed"')
+        assert lines[2].endswith("# window title")
+        assert lines[6:8] == ["    # Slider value", "    default: 42"]
+        assert lines[8] == '    options: ["Low", "High"]'
+
+    def test_existing_keys_are_updated_in_place(self, commented_manager, project_root):
+        """Test that updating existing keys does not dump the whole document."""
+        commented_manager.patch_config_file("app", {("app", "theme"): "light"})
+        commented_manager.patch_config_file(
+            "app", {("settings_panel", "volume", "default"): 7}
+        )
+
+        stats = commented_manager.get_patcher().get_stats()
+        assert stats["block_updates"] == 2
+        assert stats["full_dumps"] == 0
+        assert stats["parses"] == 1
+        expected = COMMENTED_APP_YAML.replace("theme: dark", "theme: light")
+        assert self._read(project_root) == expected.replace("default: 10", "default: 7")
+
+    def test_line_count_change_is_followed_by_full_dump(
+        self, commented_manager, project_root
+    ):
+        """Test that updates after a multi-line value stay correct."""
+        assert commented_manager.patch_config_file(
+            "app",
+            {
+                ("app", "theme"): ["light", "dark"],
+                ("settings_panel", "volume", "default"): 3,
+            },
+        )
+        assert commented_manager.patch_config_file("app", {("app", "name"): "Again"})
+
+        config = yaml.safe_load(self._read(project_root))
+        assert config["app"] == {"name": "Again", "theme": ["light", "dark"]}
+        assert config["settings_panel"]["volume"]["default"] == 3
+        assert commented_manager.get_patcher().get_stats()["full_dumps"] == 1
+
+    def test_structural_update_keeps_comments(self, commented_manager, project_root):
+        """Test that new keys are inserted in the round-trip document."""
+        assert commented_manager.patch_config_file(
+            "app", {("settings_panel", "language", "default"): "English"}
+        )
+
+        text = self._read(project_root)
+        assert "# Application settings" in text
+        assert "# window title" in text
+        assert yaml.safe_load(text)["settings_panel"]["language"]["default"] == (
+            "English"
+        )
+
+    def test_external_edit_is_not_overwritten(self, commented_manager, project_root):
+        """Test that a file edited on disk is parsed again before patching."""
+        commented_manager.patch_config_file("app", {("app", "theme"): "light"})
+        config_file = project_root / "bin" / "config" / "app.yaml"
+        config_file.write_text(
+            self._read(project_root) + "extra: true\n", encoding="utf-8"
+        )
+
+        commented_manager.patch_config_file("app", {("app", "theme"): "dark"})
+
+        config = yaml.safe_load(self._read(project_root))
+        assert config["extra"] is True
+        assert config["app"]["theme"] == "dark"
+
+    def test_write_queue_patches_pending_keys(self, commented_manager, project_root):
+        """Test that the write-behind queue goes through the patcher."""
+        queue = commented_manager.get_write_queue()
+        queue.set_delay(10_000)
+        for value in range(5):
+            queue.enqueue("app", ["settings_panel", "volume", "default"], value)
+        queue.flush()
+
+        assert "# Slider value\n    default: 4\n" in self._read(project_root)
+
+    def test_first_write_only_contains_updates(self, tmp_path):
+        """Test that a new project file holds the patched keys only."""
+        config_manager = ConfigManager()
+        config_manager.set_project_root(tmp_path)
+        config_manager.set_snapshots_enabled(False)
+        config_manager.load_config("app")
+
+        assert config_manager.patch_config_file("app", {("app", "theme"): "light"})
+
+        text = (tmp_path / "bin" / "config" / "app.yaml").read_text("utf-8")
+        assert yaml.safe_load(text) == {"app": {"theme": "light"}}
+        config = config_manager.load_config("app", force_reload=True)
+        assert config["app"]["theme"] == "light"
+        assert "settings_panel" in config
+
+    def test_large_files_are_dumped_again(self, manager, project_root):
+        """Test that files too large to parse round-trip take the dump path."""
+        config_file = project_root / "bin" / "config" / "app.yaml"
+        padding = {f"key_{i}": "x" * 40 for i in range(500)}
+        config_file.write_text(
+            yaml.safe_dump({"app": {"theme": "dark"}, "padding": padding}),
+            encoding="utf-8",
+        )
+        manager.load_config("app", force_reload=True)
+
+        assert manager.patch_config_file("app", {("app", "theme"): "light"})
+
+        config = yaml.safe_load(self._read(project_root))
+        assert config["app"]["theme"] == "light"
+        assert config["padding"] == padding
+        assert manager.get_patcher().get_stats()["parses"] == 0
+
+    def test_updates_are_written_without_ruamel(self, manager, project_root):
+        """Test the fallback that dumps the whole configuration."""
+        manager.load_config("app")
+
+        with patch.object(manager, "get_patcher", return_value=None):
+            assert manager.patch_config_file("app", {("app", "theme"): "light"})
+
+        assert yaml.safe_load(self._read(project_root))["app"]["theme"] == "light"
+
+
+class TestConfigLayers:
+    """Tests for the layered configuration merge."""
+
+    def _write(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.dump(data, f)
+
+    def test_project_file_overrides_package_defaults(self, manager):
+        """Test that a small project file is completed by the package."""
+        config = manager.load_config("app")
+
+        assert config["app"]["name"] == "Snapshot App"
+        assert config["app"]["app_width"] == 1280
+        assert "theme" in config["settings_panel"]
+        layers = [layer for layer, _ in manager.get_config_layers("app")]
+        assert layers == ["package", "project"]
+
+    def test_user_and_environment_layers(self, manager, project_root):
+        """Test the priority of the per-user file and of variables."""
+        self._write(
+            project_root / "user" / "app.yaml",
+            {"app": {"name": "User App", "app_width": 900}},
+        )
+        manager.refresh_environment({"EZQT_APP__APP__APP__APP_WIDTH": "1024"})
+
+        config = manager.load_config("app")
+
+        assert config["app"]["name"] == "User App"
+        assert config["app"]["app_width"] == 1024
+        assert config["app"]["theme"] == "dark"
+
+    def test_effective_snapshot_is_memoized_and_read_only(self, manager):
+        """Test that the merged view is shared until a layer changes."""
+        first = manager.get_effective_config("app")
+        second = manager.get_effective_config("app")
+
+        assert first is second
+        assert manager.get_layer_stats()["hits"] == 1
+        with pytest.raises(TypeError):
+            first["app"]["name"] = "Changed"
+        with pytest.raises(TypeError):
+            first.update({})
+
+    def test_invalidation_is_per_layer(self, manager, project_root):
+        """Test that a changed file only parses its own layer again."""
+        manager.load_config("app")
+        loads = manager.get_layer_stats()["layer_loads"]
+        project_file = project_root / "bin" / "config" / "app.yaml"
+        self._write(project_file, {"app": {"name": "Edited", "theme": "light"}})
+
+        config = manager.reload_config("app", project_file)
+
+        assert config["app"]["name"] == "Edited"
+        assert config["app"]["app_width"] == 1280
+        assert manager.get_layer_stats()["layer_loads"] == loads + 1
+
+    def test_save_writes_only_overrides(self, manager, project_root):
+        """Test that saved project files do not duplicate other layers."""
+        config = copy.deepcopy(manager.load_config("app"))
+        config["app"]["theme"] = "light"
+
+        assert manager.save_config("app", config)
+
+        with open(project_root / "bin" / "config" / "app.yaml", encoding="utf-8") as f:
+            saved = yaml.safe_load(f)
+        assert saved == {"app": {"name": "Snapshot App", "theme": "light"}}
+
+    def test_save_does_not_cache_caller_data(self, manager):
+        """Test that edits after a save do not leak into the cache."""
+        config = copy.deepcopy(manager.load_config("app"))
+        config["app"]["theme"] = "light"
+        assert manager.save_config("app", config)
+
+        config["app"]["theme"] = "blue"
+
+        assert manager.load_config("app")["app"]["theme"] == "light"
+        assert manager.get_config_value("app", "app.theme") == "light"
+
+    def test_save_keeps_project_values_equal_to_user_overrides(
+        self, manager, project_root
+    ):
+        """Test that a user override does not erase the project value."""
+        project_file = project_root / "bin" / "config" / "app.yaml"
+        self._write(project_file, {"app": {"name": "Snapshot App", "app_width": 1000}})
+        self._write(project_root / "user" / "app.yaml", {"app": {"app_width": 1000}})
+
+        assert manager.save_config("app", manager.load_config("app"))
+
+        with open(project_file, encoding="utf-8") as f:
+            assert yaml.safe_load(f)["app"]["app_width"] == 1000
+
+    def test_save_does_not_persist_environment_overrides(self, manager, project_root):
+        """Test that values of the upper layers stay out of the project file."""
+        self._write(project_root / "user" / "app.yaml", {"app": {"app_width": 900}})
+        manager.refresh_environment({"EZQT_APP__APP__APP__THEME": "light"})
+        config = copy.deepcopy(manager.load_config("app"))
+        config["app"]["name"] = "Renamed"
+
+        assert manager.save_config("app", config)
+
+        with open(project_root / "bin" / "config" / "app.yaml", encoding="utf-8") as f:
+            saved = yaml.safe_load(f)
+        assert saved == {"app": {"name": "Renamed", "theme": "dark"}}
+
+    def test_environment_targets_mixed_case_keys(self, manager, project_root):
+        """Test that variables override keys whatever their case."""
+        self._write(
+            project_root / "bin" / "config" / "app.yaml",
+            {"app": {"name": "Snapshot App", "accentColor": "red"}},
+        )
+        manager.refresh_environment({"EZQT_APP__APP__APP__ACCENTCOLOR": "blue"})
+
+        config = manager.load_config("app")
+
+        assert config["app"]["accentColor"] == "blue"
+        assert "accentcolor" not in config["app"]
+
+    def test_user_directory_is_scoped_per_project(self, tmp_path):
+        """Test that two applications do not share per-user overrides."""
+        first = get_user_config_dir(tmp_path / "first")
+        second = get_user_config_dir(tmp_path / "second")
+
+        assert first != second
+        assert first.name.startswith("first-")
+        assert first == get_user_config_dir(tmp_path / "first")
+        assert get_user_config_dir(None) is None
+
+
+class TestConcurrentAccess:
+    """Tests for concurrent readers with a single writer."""
+
+    def test_updates_publish_new_snapshots(self, manager):
+        """Test that published dictionaries are never mutated."""
+        config = manager.load_config("app")
+        index = manager.get_flat_index("app")
+
+        manager.set_value_in_memory("app", ["app", "theme"], "light")
+
+        assert config["app"]["theme"] == "dark"
+        assert index["app.theme"] == "dark"
+        assert manager.load_config("app")["app"]["theme"] == "light"
+        assert manager.get_config_value("app", "app.theme") == "light"
+
+    def test_loaded_config_is_read_only(self, manager):
+        """Test that the loaded configuration cannot drift from its index."""
+        config = manager.load_config("app")
+
+        with pytest.raises(TypeError):
+            config["app"]["theme"] = "light"
+        editable = copy.deepcopy(config)
+        editable["app"]["theme"] = "light"
+
+        assert manager.load_config("app")["app"]["theme"] == "dark"
+        assert manager.get_config_value("app", "app.theme") == "dark"
+
+    def test_published_updates_are_read_only(self, manager):
+        """Test that in-memory updates publish read-only snapshots."""
+        manager.set_value_in_memory("app", ["app", "window"], {"size": [1, 2]})
+
+        config = manager.load_config("app")
+        with pytest.raises(TypeError):
+            config["app"]["window"]["size"] = (3, 4)
+        assert manager.get_config_value("app", "app.window") is config["app"]["window"]
+        assert manager.get_config_value("app", "app.window.size") == (1, 2)
+
+    @pytest.mark.slow
+    def test_readers_never_see_torn_updates(self, manager, record_property):
+        """Stress many readers against one writer updating key pairs."""
+        manager.load_config("app")
+        manager.set_value_in_memory("app", ["app", "pair"], {"a": 0, "b": 0})
+        stop = threading.Event()
+        torn = []
+        reads = []
+
+        def reader():
+            count = 0
+            while not stop.is_set():
+                index = manager.get_flat_index("app")
+                pair = manager.load_config("app")["app"]["pair"]
+                if index["app.pair.a"] != index["app.pair.b"] or (
+                    pair["a"] != pair["b"]
+                ):
+                    torn.append((index["app.pair.a"], pair["a"]))
+                    break
+                count += 1
+            reads.append(count)
+
+        def writer():
+            try:
+                for value in range(1, 2001):
+                    manager.set_value_in_memory(
+                        "app", ["app", "pair"], {"a": value, "b": value}
+                    )
+            finally:
+                stop.set()
+
+        readers = [threading.Thread(target=reader, daemon=True) for _ in range(8)]
+        start = time.perf_counter()
+        for thread in readers:
+            thread.start()
+        writer()
+        for thread in readers:
+            thread.join(timeout=30)
+        elapsed = time.perf_counter() - start
+
+        assert not torn
+        assert manager.get_config_value("app", "app.pair.a") == 2000
+        throughput = sum(reads) / elapsed
+        record_property("reads_per_second", round(throughput))
+        assert throughput > 0
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the package resource locator.
+"""
+
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from ezqt_app.kernel.app_functions.package_resources import PackageResourceLocator
+from ezqt_app.kernel.app_functions.resource_resolver import PACKAGE_RESOURCES_DIR
+
+ZIPPED_PACKAGE = "ezqt_zipped_resources"
+
+
+@pytest.fixture
+def zipped_package(tmp_path, monkeypatch):
+    """Create a package importable only from a zip archive."""
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr(f"{ZIPPED_PACKAGE}/__init__.py", "")
+        bundle.writestr(
+            f"{ZIPPED_PACKAGE}/resources/config/app.yaml", "app:\n  name: Zipped\n"
+        )
+        bundle.writestr(f"{ZIPPED_PACKAGE}/resources/themes/main_theme.qss", "")
+    monkeypatch.syspath_prepend(str(archive))
+    yield ZIPPED_PACKAGE
+    sys.modules.pop(ZIPPED_PACKAGE, None)
+
+
+class TestPackageResourceLocator:
+    """Tests for importlib.resources based lookups."""
+
+    def test_installed_package_is_on_disk(self):
+        """Test that the package resources are returned in place."""
+        locator = PackageResourceLocator()
+
+        assert locator.is_on_disk()
+        assert locator.path("resources/config").resolve() == (
+            PACKAGE_RESOURCES_DIR / "config"
+        )
+        assert locator.read_text("resources/config/palette.yaml") == (
+            PACKAGE_RESOURCES_DIR / "config" / "palette.yaml"
+        ).read_text(encoding="utf-8")
+
+    def test_paths_are_memoized(self):
+        """Test that a resource is only located once."""
+        locator = PackageResourceLocator()
+
+        first = locator.path("resources/themes")
+        second = locator.path("resources/themes")
+
+        assert first is second
+        stats = locator.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_missing_resource(self):
+        """Test the lookups of a resource the package does not contain."""
+        locator = PackageResourceLocator()
+
+        assert not locator.exists("resources/config/missing.yaml")
+        assert not locator.path("resources/config/missing.yaml").exists()
+        with pytest.raises(FileNotFoundError):
+            locator.read_text("resources/config/missing.yaml")
+
+    def test_zipped_package(self, zipped_package):
+        """Test that zipped resources are read in place and extracted once."""
+        locator = PackageResourceLocator(zipped_package)
+
+        assert not locator.is_on_disk()
+        assert "Zipped" in locator.read_text("resources/config/app.yaml")
+        assert locator.get_stats()["extracted"] == 0
+
+        config_dir = locator.path("resources/config")
+        locator.path("resources/config")
+
+        assert (config_dir / "app.yaml").read_text() == "app:\n  name: Zipped\n"
+        assert locator.get_stats()["extracted"] == 1
+
+    def test_import_does_not_load_pkg_resources(self):
+        """Test that importing the kernel and the CLI skips pkg_resources."""
+        code = (
+            "import sys, ezqt_app.kernel.app_functions, ezqt_app.cli.main; "
+            "print('pkg_resources' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the palette theme mode.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QLabel, QWidget
+
+from ezqt_app.kernel.app_functions.qss_template import get_qss_template
+from ezqt_app.kernel.ui_functions import palette_theme
+from ezqt_app.kernel.ui_functions.palette_theme import (
+    build_palette,
+    get_stylesheet_values,
+    parse_color,
+)
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+QSS = "QLabel { color: $_base_text_color; background: $_transparent; }"
+
+DARK = {
+    "$_base_text_color": "rgb(221, 221, 221)",
+    "$_transparent": "rgba(255, 255, 255, 0)",
+}
+LIGHT = {
+    "$_base_text_color": "rgb(34, 34, 34)",
+    "$_transparent": "rgba(0, 0, 0, 0)",
+}
+
+
+@pytest.fixture
+def host(qt_application):
+    """Create a stylesheet host holding a label, restoring the palette."""
+    palette = QApplication.palette()
+    widget = QWidget()
+    QLabel("text", widget).setObjectName("label")
+    yield widget
+    widget.deleteLater()
+    QApplication.setPalette(palette)
+
+
+def _text_color(label):
+    label.ensurePolished()
+    return label.palette().color(QPalette.WindowText)
+
+
+class TestPaletteTheme:
+    """Tests for themes given by the application palette."""
+
+    def test_parse_color(self, qt_application):
+        """Test the color notations of palette.yaml."""
+        assert parse_color("rgb(33, 37, 43)") == QColor(33, 37, 43)
+        assert parse_color("rgba(33, 37, 43, 180)").alpha() == 180
+        assert parse_color("rgba(0, 0, 0, 0.5)").alpha() == 128
+        assert parse_color("#96CD32") == QColor("#96cd32")
+        assert parse_color("not a color") is None
+
+    def test_build_palette_sets_text_roles(self, qt_application):
+        """Test that the text color reaches every text role."""
+        palette = build_palette(LIGHT)
+
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            assert palette.color(role) == QColor(34, 34, 34)
+
+    def test_structural_stylesheet_is_shared(self):
+        """Test that one stylesheet serves every theme."""
+        values = get_stylesheet_values(DARK)
+        rendered = get_qss_template(QSS).render(values)
+
+        assert "color: palette(window-text)" in rendered
+        assert "background: rgba(255, 255, 255, 0)" in rendered
+
+    def test_transparent_variables_stay_shared(self):
+        """Test that the same color written differently keeps one stylesheet."""
+        assert get_stylesheet_values(DARK, LIGHT) == get_stylesheet_values(DARK)
+
+    def test_unmapped_variables_use_the_theme_value(self):
+        """Test that custom variables without role follow the theme."""
+        palette_theme._reported.clear()
+        dark = dict(DARK, **{"$_custom_color": "rgb(1, 2, 3)"})
+        light = dict(LIGHT, **{"$_custom_color": "rgb(4, 5, 6)"})
+
+        with patch.object(palette_theme, "get_printer") as printer:
+            assert get_stylesheet_values(dark, dark)["$_custom_color"] == (
+                "rgb(1, 2, 3)"
+            )
+            values = get_stylesheet_values(dark, light)
+            get_stylesheet_values(dark, light)
+
+        assert values["$_custom_color"] == "rgb(4, 5, 6)"
+        assert values["$_base_text_color"] == "palette(window-text)"
+        printer.return_value.warning.assert_called_once()
+        assert "$_custom_color" in printer.return_value.warning.call_args[0][0]
+
+    def test_palette_switch_keeps_the_stylesheet(self, host):
+        """Test that a switch changes colors without a new stylesheet."""
+        engine = RestyleEngine()
+        label = host.findChild(QLabel, "label")
+        stylesheet = get_qss_template(QSS).render(get_stylesheet_values(DARK))
+
+        assert engine.apply_palette(host, stylesheet, build_palette(DARK))
+        assert _text_color(label) == QColor(221, 221, 221)
+        assert engine.apply_palette(host, stylesheet, build_palette(LIGHT))
+        assert host.styleSheet() == stylesheet
+        assert _text_color(label) == QColor(34, 34, 34)
+        assert not engine.apply_palette(host, stylesheet, build_palette(LIGHT))
+        assert engine.get_stats()["skipped"] == 1
+
+    def test_palette_switch_reaches_registered_windows(self, host):
+        """Test that registered windows outside the host follow the palette."""
+        engine = RestyleEngine()
+        window = QWidget()
+        window.setStyleSheet("QLabel { color: palette(window-text); }")
+        label = QLabel("detached", window)
+        engine.register(window)
+        stylesheet = get_qss_template(QSS).render(get_stylesheet_values(DARK))
+
+        engine.apply_palette(host, stylesheet, build_palette(DARK))
+        assert _text_color(label) == QColor(221, 221, 221)
+        engine.apply_palette(host, stylesheet, build_palette(LIGHT))
+        assert _text_color(label) == QColor(34, 34, 34)
+
+        engine.unregister(window)
+        engine.apply_palette(host, stylesheet, build_palette(DARK))
+        assert _text_color(label) == QColor(34, 34, 34)
+        assert engine.get_stats()["registered"] == 0
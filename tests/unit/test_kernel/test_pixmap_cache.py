@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the shared cache of recolored pixmaps.
+"""
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QPixmap
+
+from ezqt_app.kernel.app_functions.pixmap_cache import PixmapCache
+from ezqt_app.widgets.extended.theme_icon import ThemeIcon
+
+# 16x16 ARGB pixmap
+PIXMAP_BYTES = 16 * 16 * 4
+
+
+def _pixmap(size=16, ratio=1.0):
+    pixmap = QPixmap(size, size)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.red)
+    return pixmap
+
+
+def _loader(calls, pixmap=None):
+    def load():
+        calls.append(1)
+        return pixmap or _pixmap()
+
+    return load
+
+
+class TestPixmapCache:
+    """Tests for the LRU cache of recolored pixmaps."""
+
+    def test_identical_requests_are_composited_once(self, qt_application):
+        """Test that a second request is a hit."""
+        cache = PixmapCache()
+        calls = []
+        args = ("icon.png", "#ffffff", 0.5, QSize(16, 16), 1.0)
+
+        first = cache.get_colorized(*args, _loader(calls))
+        second = cache.get_colorized(*args, _loader(calls))
+
+        assert len(calls) == 1
+        assert first.cacheKey() == second.cacheKey()
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+        assert stats["bytes"] == PIXMAP_BYTES
+
+    def test_every_key_part_is_compared(self, qt_application):
+        """Test that source, color, opacity, size and ratio make a miss."""
+        cache = PixmapCache()
+        base = ["icon.png", "#ffffff", 0.5, QSize(16, 16), 1.0]
+        cache.get_colorized(*base, _loader([]))
+
+        for index, value in enumerate(["other.png", "#000000", 1.0, QSize(8, 8), 2.0]):
+            args = list(base)
+            args[index] = value
+            cache.get_colorized(*args, _loader([]))
+        assert cache.get_stats()["misses"] == 6
+
+    def test_least_recently_used_entries_are_evicted(self, qt_application):
+        """Test the byte budget."""
+        cache = PixmapCache(budget_bytes=2 * PIXMAP_BYTES)
+        for source in ("a", "b", "a", "c"):
+            cache.get_colorized(source, "#ffffff", 1.0, QSize(16, 16), 1.0, _pixmap)
+
+        stats = cache.get_stats()
+        assert (stats["entries"], stats["evictions"]) == (2, 1)
+        calls = []
+        cache.get_colorized("a", "#ffffff", 1.0, QSize(16, 16), 1.0, _loader(calls))
+        assert calls == []
+
+        cache.set_budget(0)
+        assert cache.get_stats()["bytes"] == 0
+        cache.get_colorized("a", "#ffffff", 1.0, QSize(16, 16), 1.0, _pixmap)
+        assert cache.get_stats()["entries"] == 0
+
+    def test_colorize_keeps_alpha_and_ratio(self, qt_application):
+        """Test the recolored pixmap of a source pixmap."""
+        cache = PixmapCache()
+        source = _pixmap(32, ratio=2.0)
+
+        result = cache.colorize(source, "#00ff00", 0.5)
+
+        assert result.devicePixelRatio() == 2.0
+        color = result.toImage().pixelColor(31, 31)
+        assert (color.green(), color.red()) == (255, 0)
+        assert 0 < color.alpha() < 255
+        assert cache.colorize(source, "#00ff00", 0.5).cacheKey() == result.cacheKey()
+
+    def test_theme_icons_of_a_file_share_pixmaps(self, qt_application, tmp_path):
+        """Test that two icons of one file are recolored once."""
+        path = tmp_path / "icon.png"
+        _pixmap().save(str(path))
+        first, second = ThemeIcon(str(path)), ThemeIcon(str(path))
+
+        pixmap = first.pixmap(QSize(16, 16))
+        assert second.pixmap(QSize(16, 16)).cacheKey() == pixmap.cacheKey()
+        assert pixmap.toImage().pixelColor(0, 0) in (QColor(Qt.white), QColor(Qt.black))
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the resource preloader.
+"""
+
+import pytest
+import yaml
+
+from ezqt_app.kernel.app_functions.config_manager import ConfigManager
+from ezqt_app.kernel.app_functions.preloader import ResourcePreloader
+
+TS_FILE = """<?xml version="1.0" encoding="utf-8"?>
+<TS version="2.1" language="en">
+<context>
+    <name>ezqt_app</name>
+    <message>
+        <source>Settings</source>
+        <translation>Preferences</translation>
+    </message>
+</context>
+</TS>
+"""
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    """Create a project with an app config, a theme and a translation."""
+    config_dir = tmp_path / "bin" / "config"
+    config_dir.mkdir(parents=True)
+    with open(config_dir / "app.yaml", "w", encoding="utf-8") as f:
+        yaml.dump({"app": {"name": "Preloaded App"}}, f)
+    theme_dir = tmp_path / "bin" / "themes"
+    theme_dir.mkdir()
+    (theme_dir / "main_theme.qss").write_text("QWidget {}\n", encoding="utf-8")
+    translations_dir = tmp_path / "bin" / "translations"
+    translations_dir.mkdir()
+    (translations_dir / "ezqt_app_en.ts").write_text(TS_FILE, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def manager(project_root):
+    """Create a configuration manager bound to the test project."""
+    config_manager = ConfigManager()
+    config_manager.set_project_root(project_root)
+    config_manager.set_user_config_dir(None)
+    config_manager.refresh_environment({})
+    config_manager.set_snapshots_enabled(False)
+    return config_manager
+
+
+class TestResourcePreloader:
+    """Tests for concurrent startup loading."""
+
+    def test_configs_are_loaded_in_background(self, manager):
+        """Test that waiting leaves the effective configs memoized."""
+        preloader = ResourcePreloader(manager)
+
+        assert preloader.start()
+        assert preloader.wait(timeout=10)
+
+        stats = preloader.get_stats()
+        assert stats["pending"] == 0
+        assert stats["errors"] == 0
+        hits = manager.get_layer_stats()["hits"]
+        assert manager.load_config("app")["app"]["name"] == "Preloaded App"
+        assert manager.get_layer_stats()["hits"] == hits + 1
+
+    def test_start_is_idempotent(self, manager):
+        """Test that a second start does not submit the tasks again."""
+        preloader = ResourcePreloader(manager)
+        preloader.start()
+        tasks = preloader.get_stats()["tasks"]
+
+        assert not preloader.start()
+        assert preloader.get_stats()["tasks"] == tasks
+        preloader.wait(timeout=10)
+
+    def test_theme_text_is_handed_out_once(self, manager, project_root):
+        """Test that a later read sees edits made after the preload."""
+        theme_file = project_root / "bin" / "themes" / "main_theme.qss"
+        preloader = ResourcePreloader(manager)
+        preloader.start()
+        preloader.wait(timeout=10)
+        theme_file.write_text("QLabel {}\n", encoding="utf-8")
+
+        assert preloader.read_text(theme_file) == "QWidget {}\n"
+        assert preloader.read_text(theme_file) == "QLabel {}\n"
+        assert preloader.get_stats()["hits"] == 1
+
+    def test_configured_language_is_preloaded(self, manager, project_root):
+        """Test that the .ts file of the configured language is parsed."""
+        preloader = ResourcePreloader(manager)
+        preloader.start()
+        preloader.wait(timeout=10)
+        ts_file = project_root / "bin" / "translations" / "ezqt_app_en.ts"
+        ts_file.unlink()
+
+        translations = preloader.load_translations(ts_file)
+
+        assert translations == {"Settings": "Preferences"}
+        assert preloader.get_stats()["hits"] == 1
+
+    def test_without_start_files_are_read_directly(self, manager, project_root):
+        """Test the fallback when nothing was preloaded."""
+        preloader = ResourcePreloader(manager)
+        theme_file = project_root / "bin" / "themes" / "main_theme.qss"
+
+        assert preloader.wait()
+        assert preloader.read_text(theme_file) == "QWidget {}\n"
+        assert preloader.get_stats()["hits"] == 0
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the frame-budgeted restyle of palette theme switches.
+"""
+
+import pytest
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QLabel, QStackedWidget, QWidget
+
+from ezqt_app.kernel.ui_functions.palette_theme import build_palette
+from ezqt_app.kernel.ui_functions.progressive_restyle import ProgressiveRestyler
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+
+@pytest.fixture
+def window(qt_application):
+    """Create a shown window with a visible and a hidden page."""
+    widget = QWidget()
+    stack = QStackedWidget(widget)
+    for name in ("visible", "hidden"):
+        page = QWidget()
+        page.setObjectName(name)
+        QLabel(name, page)
+        stack.addWidget(page)
+    widget.show()
+    QApplication.processEvents()
+    yield widget
+    widget.close()
+    widget.deleteLater()
+
+
+def _run_slices(restyler):
+    while restyler.get_status()["state"] == "running":
+        QApplication.processEvents()
+
+
+class TestProgressiveRestyler:
+    """Tests for the repolish of widgets within a frame budget."""
+
+    def test_visible_widgets_are_repolished_in_slices(self, window):
+        """Test that visible widgets wait for the event loop."""
+        calls = []
+        restyler = ProgressiveRestyler(calls.append)
+        visible = window.findChild(QWidget, "visible")
+        widgets = [visible, visible.findChild(QLabel)]
+
+        restyler.start(widgets, budget_ms=0)
+        assert calls == []
+        assert restyler.get_status()["pending"] == 2
+
+        _run_slices(restyler)
+        assert calls == widgets
+        status = restyler.get_status()
+        assert (status["state"], status["slices"]) == ("idle", 2)
+
+    def test_hidden_pages_are_repolished_when_shown(self, window):
+        """Test that hidden widgets are deferred until their page is shown."""
+        calls = []
+        restyler = ProgressiveRestyler(calls.append)
+        hidden = window.findChild(QWidget, "hidden")
+        label = hidden.findChild(QLabel)
+
+        restyler.start([hidden, label])
+        _run_slices(restyler)
+        assert calls == []
+        assert restyler.get_status()["state"] == "deferred"
+
+        hidden.parentWidget().setCurrentWidget(hidden)
+        assert calls == [hidden, label]
+        status = restyler.get_status()
+        assert (status["state"], status["on_show"]) == ("idle", 2)
+
+    def test_flush_repolishes_everything(self, window):
+        """Test that a flush does not wait for slices or Show events."""
+        calls = []
+        restyler = ProgressiveRestyler(calls.append)
+        widgets = window.findChildren(QWidget)
+
+        restyler.start(widgets)
+        assert restyler.flush() == len(widgets)
+        assert sorted(map(id, calls)) == sorted(map(id, widgets))
+        assert restyler.get_status()["state"] == "idle"
+
+    def test_new_run_drops_pending_work(self, window):
+        """Test that a switch during a restyle replaces its work."""
+        calls = []
+        restyler = ProgressiveRestyler(calls.append)
+        hidden = window.findChild(QWidget, "hidden")
+        restyler.start([hidden] + window.findChildren(QLabel))
+
+        restyler.start([window])
+        _run_slices(restyler)
+        hidden.parentWidget().setCurrentWidget(hidden)
+
+        assert calls == [window]
+        assert restyler.get_status()["deferred"] == 0
+
+
+class TestProgressivePalette:
+    """Tests for palette switches with a frame budget."""
+
+    def test_switch_restyles_visible_then_shown_widgets(self, window):
+        """Test the colors of visible and hidden labels after a switch."""
+        previous = QApplication.instance().palette()
+        engine = RestyleEngine()
+        stylesheet = "QLabel { color: palette(window-text); }"
+        engine.apply_palette(window, stylesheet, build_palette({}))
+        visible, hidden = (
+            window.findChild(QWidget, name).findChild(QLabel)
+            for name in ("visible", "hidden")
+        )
+        try:
+            palette = build_palette({"$_base_text_color": "#ff0000"})
+            assert engine.apply_palette(window, stylesheet, palette, budget_ms=8)
+            assert engine.get_stats()["progressive"] == 1
+
+            while engine.get_progressive_status()["state"] == "running":
+                QApplication.processEvents()
+            assert visible.palette().color(QPalette.WindowText) == QColor("#ff0000")
+            assert engine.get_progressive_status()["deferred"] > 0
+
+            hidden.parentWidget().parentWidget().setCurrentIndex(1)
+            assert hidden.palette().color(QPalette.WindowText) == QColor("#ff0000")
+        finally:
+            QApplication.instance().setPalette(previous)
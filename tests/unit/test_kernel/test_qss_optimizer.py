@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the build-time QSS optimizer.
+"""
+
+import os
+
+from ezqt_app.kernel.app_functions.file_maker import FileMaker
+from ezqt_app.kernel.app_functions.qss_optimizer import (
+    collect_object_names,
+    minify_qss,
+    parse_rules,
+    prune_qss,
+    resolve_theme_file,
+)
+from ezqt_app.kernel.app_functions.resource_resolver import ResourceResolver
+
+QSS = """
+/* ///// HEADER ///// */
+QWidget {
+    color: $_base_text_color;
+    font: 10pt "Segoe UI";
+}
+
+#headerContainer QLabel,
+#removedFrame QLabel {
+    color: #ffffff;
+}
+
+#menu_Home:hover { background: $_main_surface; }
+#deadFrame { border: none; }
+QLabel { }
+"""
+
+
+class TestQssOptimizer:
+    """Tests for QSS minification and pruning."""
+
+    def test_minify_keeps_rules_and_variables(self):
+        """Test that only comments, spaces and empty rules are dropped."""
+        minified = minify_qss(QSS)
+
+        assert minified.splitlines()[0] == (
+            'QWidget{color:$_base_text_color;font:10pt "Segoe UI"}'
+        )
+        assert "/*" not in minified
+        assert "#deadFrame{border:none}" in minified
+        assert len(parse_rules(minified)) == len(parse_rules(QSS)) - 1
+
+    def test_prune_drops_unknown_object_names(self):
+        """Test that selectors of absent object names are removed."""
+        pruned, removed = prune_qss(QSS, {"headerContainer"}, prefixes=["menu_"])
+
+        assert removed == ["#removedFrame QLabel", "#deadFrame"]
+        assert "#headerContainer QLabel{color:#ffffff}" in pruned
+        assert "#menu_Home:hover" in pruned
+        assert "QWidget{" in pruned
+
+    def test_collect_object_names(self, tmp_path):
+        """Test literal names, f-string prefixes and Designer files."""
+        (tmp_path / "window.py").write_text(
+            'self.frame.setObjectName("headerContainer")\n'
+            'menu.setObjectName(f"menu_{name}")\n'
+            "other.setObjectName(name)\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "form.ui").write_text(
+            '<ui><widget class="QFrame" name="designerFrame"/></ui>',
+            encoding="utf-8",
+        )
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "venv" / "lib.py").write_text(
+            'w.setObjectName("ignored")', encoding="utf-8"
+        )
+
+        names, prefixes = collect_object_names([tmp_path])
+
+        assert names == {"headerContainer", "designerFrame"}
+        assert prefixes == {"menu_"}
+
+    def test_file_maker_writes_optimized_theme(self, tmp_path):
+        """Test the FileMaker step and its report."""
+        themes = tmp_path / "bin" / "themes"
+        themes.mkdir(parents=True)
+        (themes / "main_theme.qss").write_text(QSS, encoding="utf-8")
+
+        reports = FileMaker(base_path=tmp_path).optimize_qss(
+            keep=["deadFrame"], measure=False
+        )
+
+        report = reports["main_theme.qss"]
+        assert report["rules_before"] == 5
+        assert report["rules_after"] == 4
+        assert report["removed_selectors"] == ["#removedFrame QLabel"]
+        optimized = (themes / "main_theme.min.qss").read_text(encoding="utf-8")
+        assert "#deadFrame{border:none}" in optimized
+        assert "#removedFrame" not in optimized
+
+    def test_resolve_prefers_up_to_date_optimized_theme(self, tmp_path):
+        """Test that an edited source is used until optimized again."""
+        themes = tmp_path / "bin" / "themes"
+        themes.mkdir(parents=True)
+        source = themes / "main_theme.qss"
+        optimized = themes / "main_theme.min.qss"
+        source.write_text(QSS, encoding="utf-8")
+        optimized.write_text(minify_qss(QSS), encoding="utf-8")
+        resolver = ResourceResolver()
+        resolver.set_project_root(tmp_path)
+
+        assert resolve_theme_file(resolver, "main_theme.qss") == optimized
+
+        mtime = optimized.stat().st_mtime
+        os.utime(source, (mtime + 10, mtime + 10))
+        assert resolve_theme_file(resolver, "main_theme.qss") == source
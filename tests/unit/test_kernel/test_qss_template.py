@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for compiled QSS templates.
+"""
+
+import pytest
+
+from ezqt_app.kernel.app_functions.qss_template import (
+    QssTemplate,
+    clear_template_cache,
+    get_qss_template,
+    get_template_stats,
+)
+from ezqt_app.kernel.app_functions.resource_resolver import PACKAGE_RESOURCES_DIR
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty template cache."""
+    clear_template_cache()
+    yield
+    clear_template_cache()
+
+
+class TestQssTemplate:
+    """Tests for QSS tokenizing and rendering."""
+
+    def test_variables_are_whole_tokens(self):
+        """Test that a variable is never replaced as a prefix of another."""
+        template = QssTemplate(
+            "QWidget { color: $_accent_color1; background: $_accent_color10; }"
+        )
+
+        style = template.render({"$_accent_color1": "red", "$_accent_color10": "blue"})
+
+        assert style == "QWidget { color: red; background: blue; }"
+        assert template.variables == {"$_accent_color1", "$_accent_color10"}
+
+    def test_unknown_variables_are_kept(self):
+        """Test that variables missing from the palette are left untouched."""
+        template = QssTemplate("QLabel { color: $_text; border: $_border; }")
+
+        assert template.render({"$_text": "white"}) == (
+            "QLabel { color: white; border: $_border; }"
+        )
+        assert template.missing({"$_text": "white"}) == ["$_border"]
+
+    def test_legacy_keys_are_substituted(self):
+        """Test that palette keys without the "$_" prefix still apply."""
+        template = QssTemplate("QLabel { color: @text; }")
+
+        assert template.render({"@text": "black"}) == "QLabel { color: black; }"
+
+    def test_hundreds_of_variables(self):
+        """Test rendering a large theme with many variables."""
+        names = [f"$_color{i}" for i in range(500)]
+        text = "\n".join(
+            f"QLabel#l{i} {{ color: {name}; }}" for i, name in enumerate(names)
+        )
+        values = {name: f"#{i:06x}" for i, name in enumerate(names)}
+
+        style = QssTemplate(text).render(values)
+
+        assert "$_" not in style
+        assert "QLabel#l11 { color: #00000b; }" in style
+        assert "QLabel#l111 { color: #00006f; }" in style
+
+    def test_templates_are_cached_by_content(self):
+        """Test that an unchanged stylesheet is compiled once."""
+        text = "QWidget { color: $_base_text_color; }"
+
+        first = get_qss_template(text)
+        second = get_qss_template(str(text))
+        changed = get_qss_template(text + "\n")
+
+        assert first is second
+        assert changed is not first
+        assert get_template_stats() == {"hits": 1, "compiles": 2, "entries": 2}
+
+    def test_package_theme_renders_like_plain_replacement(self):
+        """Test the package theme against a longest-key-first replacement."""
+        import yaml
+
+        text = (PACKAGE_RESOURCES_DIR / "themes" / "main_theme.qss").read_text(
+            encoding="utf-8"
+        )
+        with open(PACKAGE_RESOURCES_DIR / "config" / "palette.yaml") as f:
+            palette = yaml.safe_load(f)["theme_palette"]["dark"]
+
+        expected = text
+        for key in sorted(palette, key=len, reverse=True):
+            expected = expected.replace(key, palette[key])
+
+        template = get_qss_template(text)
+
+        assert template.missing(palette) == []
+        assert template.render(palette) == expected
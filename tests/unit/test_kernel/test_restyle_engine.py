@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the scoped restyle engine.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QLabel, QToolButton, QWidget
+
+from ezqt_app.kernel.ui_functions.menu_manager import MenuManager
+from ezqt_app.kernel.ui_functions.restyle_engine import RestyleEngine
+
+DARK = "QLabel { color: #ffffff; }"
+LIGHT = "QLabel { color: #000000; }"
+
+
+@pytest.fixture
+def host(qt_application):
+    """Create a stylesheet host holding a label."""
+    widget = QWidget()
+    QLabel("text", widget).setObjectName("label")
+    yield widget
+    widget.deleteLater()
+
+
+def _text_color(label):
+    label.ensurePolished()
+    return label.palette().color(QPalette.WindowText)
+
+
+class TestRestyleEngine:
+    """Tests for theme switches restyling only dependent widgets."""
+
+    def test_host_descendants_follow_the_stylesheet(self, host):
+        """Test that the host stylesheet reaches its descendants."""
+        engine = RestyleEngine()
+        label = host.findChild(QLabel, "label")
+
+        assert engine.apply_stylesheet(host, DARK)
+        assert _text_color(label) == QColor("#ffffff")
+        assert engine.apply_stylesheet(host, LIGHT)
+        assert _text_color(label) == QColor("#000000")
+        assert engine.get_stats()["repolished"] == 0
+
+    def test_unchanged_stylesheet_is_skipped(self, host):
+        """Test that applying the current stylesheet does nothing."""
+        engine = RestyleEngine()
+        engine.apply_stylesheet(host, DARK)
+
+        assert not engine.apply_stylesheet(host, DARK)
+        stats = engine.get_stats()
+        assert stats["switches"] == 1
+        assert stats["skipped"] == 1
+
+    def test_registered_widgets_do_not_change_stylesheet_switches(self, host):
+        """Test that registration only serves palette switches."""
+        engine = RestyleEngine()
+        window = QWidget()
+        QLabel("detached", window)
+        engine.register(window)
+
+        engine.apply_stylesheet(host, DARK)
+
+        assert engine.get_registered() == [window]
+        assert engine.get_stats()["repolished"] == 0
+        window.deleteLater()
+
+    def test_deleted_widgets_are_forgotten(self, host):
+        """Test that registering a widget does not keep it alive."""
+        engine = RestyleEngine()
+        engine.register(QWidget())
+
+        assert engine.get_registered() == []
+
+    def test_dynamic_property_change_repolishes_once(self, host):
+        """Test the scoped update of a selector property."""
+        engine = RestyleEngine()
+        label = host.findChild(QLabel, "label")
+        engine.apply_stylesheet(host, 'QLabel[class="active"] { color: #ff0000; }')
+
+        assert engine.set_dynamic_property(label, "class", "active")
+        assert _text_color(label) == QColor("#ff0000")
+        assert not engine.set_dynamic_property(label, "class", "active")
+
+    def test_menu_selection_repolishes_changed_buttons_only(self, host):
+        """Test that switching menus goes through set_dynamic_property."""
+        top_menu = QWidget(host)
+        for name in ("menu_home", "menu_files", "menu_about"):
+            button = QToolButton(top_menu)
+            button.setObjectName(name)
+            button.setProperty("class", "inactive")
+        window = SimpleNamespace(
+            ui=SimpleNamespace(menuContainer=SimpleNamespace(topMenu=top_menu))
+        )
+
+        with patch("ezqt_app.kernel.ui_functions.restyle_engine._repolish") as repolish:
+            MenuManager.selectMenu(window, "menu_files")
+            MenuManager.deselectMenu(window, "menu_files")
+
+        assert [w.objectName() for (w,), _ in repolish.call_args_list] == ["menu_files"]
+        assert top_menu.findChild(QToolButton, "menu_files").property("class") == (
+            "active"
+        )
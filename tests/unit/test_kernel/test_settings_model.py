@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the compiled settings model.
+"""
+
+import copy
+
+import pytest
+
+from ezqt_app.kernel.app_functions.resource_resolver import PACKAGE_RESOURCES_DIR
+from ezqt_app.kernel.app_functions.settings_manager import SettingsManager
+from ezqt_app.kernel.app_functions.settings_model import (
+    SettingsValidationError,
+    compile_app_settings,
+    get_app_settings_model,
+)
+from ezqt_app.kernel.app_functions.yaml_backend import safe_dump, safe_load
+from ezqt_app.kernel.app_settings import Settings
+
+
+@pytest.fixture
+def app_yaml():
+    """Return the package app.yaml document."""
+    with open(PACKAGE_RESOURCES_DIR / "config" / "app.yaml", encoding="utf-8") as f:
+        return safe_load(f)
+
+
+class TestCompileAppSettings:
+    """Tests for compile_app_settings."""
+
+    def test_package_config_compiles(self, app_yaml):
+        """Test that the shipped app.yaml is valid."""
+        model = compile_app_settings(app_yaml)
+
+        assert model.app.name == app_yaml["app"]["name"]
+        assert model.app.app_width == app_yaml["app"]["app_width"]
+        assert model.settings_panel.language.default == "English"
+        assert model.settings_panel.save_interval.max == 60
+        assert model.theme == "dark"
+        assert model.language == "English"
+        assert model.settings_panel.keys()[0] == "theme"
+
+    def test_model_is_slotted(self, app_yaml):
+        """Test that the model objects have no instance dictionary."""
+        model = compile_app_settings(app_yaml)
+
+        for obj in (model, model.app, model.settings_panel, model.settings_panel.theme):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            model.app.unknown = 1
+
+    def test_theme_prefers_settings_panel(self, app_yaml):
+        """Test the effective theme resolution."""
+        app_yaml["app"]["theme"] = "dark"
+        app_yaml["settings_panel"]["theme"]["default"] = "Light"
+
+        assert compile_app_settings(app_yaml).theme == "light"
+
+        del app_yaml["settings_panel"]["theme"]
+        assert compile_app_settings(app_yaml).theme == "dark"
+
+    def test_theme_mode_is_validated(self, app_yaml):
+        """Test the app.theme_mode setting."""
+        assert compile_app_settings(app_yaml).app.theme_mode == "stylesheet"
+
+        app_yaml["app"]["theme_mode"] = "Palette"
+        assert compile_app_settings(app_yaml).app.theme_mode == "palette"
+
+        app_yaml["app"]["theme_mode"] = "qml"
+        with pytest.raises(SettingsValidationError) as info:
+            compile_app_settings(app_yaml)
+        assert info.value.errors == [
+            "app.theme_mode must be one of ('stylesheet', 'palette')"
+        ]
+
+    def test_restyle_budget_is_validated(self, app_yaml):
+        """Test the optional app.restyle_budget_ms setting."""
+        app_yaml["app"].pop("restyle_budget_ms", None)
+        assert compile_app_settings(app_yaml).app.restyle_budget_ms == 0
+
+        app_yaml["app"]["restyle_budget_ms"] = -8
+        with pytest.raises(SettingsValidationError) as info:
+            compile_app_settings(app_yaml)
+        assert info.value.errors == ["app.restyle_budget_ms must be >= 0"]
+
+    def test_pixmap_cache_budget_is_validated(self, app_yaml):
+        """Test the optional app.pixmap_cache_kb setting."""
+        app_yaml["app"].pop("pixmap_cache_kb", None)
+        assert compile_app_settings(app_yaml).app.pixmap_cache_kb == 8192
+
+        app_yaml["app"]["pixmap_cache_kb"] = "8 MB"
+        with pytest.raises(SettingsValidationError) as info:
+            compile_app_settings(app_yaml)
+        assert info.value.errors == ["app.pixmap_cache_kb must be an integer"]
+
+    def test_every_error_is_reported(self, app_yaml):
+        """Test that validation collects all problems up front."""
+        data = copy.deepcopy(app_yaml)
+        data["app"]["app_width"] = "wide"
+        data["app"]["app_min_height"] = 5000
+        data["app"]["theme_mode"] = "qml"
+
+        with pytest.raises(SettingsValidationError) as info:
+            compile_app_settings(data)
+
+        messages = "\n".join(info.value.errors)
+        assert len(info.value.errors) == 3
+        assert "app.app_width must be an integer" in messages
+        assert "app.app_min_height must not exceed app.app_height" in messages
+        assert "app.theme_mode" in messages
+
+    def test_setting_problems_are_warnings(self, app_yaml):
+        """Test that invalid settings fall back instead of failing."""
+        panel = app_yaml["settings_panel"]
+        panel["language"]["default"] = "Klingon"
+        panel["save_interval"]["default"] = 120
+        panel["theme"]["default"] = "blue"
+        panel["auto-save"] = {"type": "checkbox", "default": 1}
+        panel["color"] = {"type": "color", "default": "red"}
+
+        model = compile_app_settings(app_yaml)
+
+        assert len(model.warnings) == 6
+        assert model.settings_panel.language.default == "English"
+        assert model.settings_panel.save_interval.default == 1
+        assert model.theme == "dark"
+        assert model.settings_panel.get("auto-save").default is True
+        assert "auto-save" in model.settings_panel.keys()
+        assert model.settings_panel.color.type == "text"
+        assert len(model.settings_panel) == len(panel)
+
+    def test_panel_classes_are_reused(self, app_yaml):
+        """Test that documents with the same keys share a generated class."""
+        first = compile_app_settings(app_yaml)
+        second = compile_app_settings(copy.deepcopy(app_yaml))
+
+        assert type(first.settings_panel) is type(second.settings_panel)
+
+
+@pytest.fixture
+def restore_settings():
+    """Restore Settings.App and Settings.Gui after the test."""
+    saved = {
+        section: {k: v for k, v in vars(section).items() if k.isupper()}
+        for section in (Settings.App, Settings.Gui)
+    }
+    yield
+    for section, values in saved.items():
+        for key, value in values.items():
+            setattr(section, key, value)
+
+
+class TestLoadAppSettings:
+    """Tests for SettingsManager.load_app_settings."""
+
+    def test_settings_are_applied(self, tmp_path, app_yaml, restore_settings):
+        """Test that the compiled model is stored and copied into Settings."""
+        app_yaml["app"]["app_width"] = 1600
+        yaml_file = tmp_path / "app.yaml"
+        yaml_file.write_text(safe_dump(app_yaml), encoding="utf-8")
+
+        SettingsManager.load_app_settings(yaml_file)
+
+        assert get_app_settings_model().app.app_width == 1600
+        assert Settings.App.APP_WIDTH == 1600
+        assert Settings.App.APP_MIN_SIZE.width() == app_yaml["app"]["app_min_width"]
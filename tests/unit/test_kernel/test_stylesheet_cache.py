@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the rendered stylesheet cache.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ezqt_app.kernel.app_functions.file_maker import FileMaker
+from ezqt_app.kernel.app_functions.stylesheet_cache import (
+    StylesheetCache,
+    get_source_version,
+    write_rendered_themes,
+)
+
+QSS = "QWidget { background: $_main_surface; color: $_base_text_color; }"
+DARK = {"$_main_surface": "black", "$_base_text_color": "white"}
+LIGHT = {"$_main_surface": "white", "$_base_text_color": "black"}
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Return the cache directory of a project with a bin/themes folder."""
+    (tmp_path / "bin" / "themes").mkdir(parents=True)
+    return tmp_path / "bin" / "themes" / ".cache"
+
+
+class Source:
+    """QSS source counting its reads."""
+
+    def __init__(self, text=QSS):
+        self.text = text
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return self.text
+
+
+class TestStylesheetCache:
+    """Tests for memory and disk caching of rendered themes."""
+
+    def test_toggle_back_reuses_rendered_stylesheet(self):
+        """Test that switching back to a theme reads and renders nothing."""
+        cache = StylesheetCache()
+        source = Source()
+
+        dark = cache.render("main_theme.qss", source, DARK, "dark")
+        light = cache.render("main_theme.qss", source, LIGHT, "light")
+        dark_again = cache.render("main_theme.qss", source, DARK, "dark")
+
+        assert dark == "QWidget { background: black; color: white; }"
+        assert light == "QWidget { background: white; color: black; }"
+        assert dark_again is dark
+        assert source.reads == 1
+        stats = cache.get_stats()
+        assert stats["renders"] == 2
+        assert stats["hits"] == 1
+
+    def test_rendered_stylesheets_persist_on_disk(self, cache_dir):
+        """Test that a new process finds the rendered stylesheet on disk."""
+        StylesheetCache(cache_dir).render("main_theme.qss", Source(), DARK, "dark")
+
+        cache = StylesheetCache(cache_dir)
+        style = cache.render("main_theme.qss", Source(), DARK, "dark")
+
+        assert style == "QWidget { background: black; color: white; }"
+        assert len(list(cache_dir.glob("main_theme.dark.*.qss"))) == 1
+        stats = cache.get_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["renders"] == 0
+
+    def test_new_version_reads_source_again(self, cache_dir):
+        """Test that an edited source replaces its stale rendering."""
+        cache = StylesheetCache(cache_dir)
+        source = Source()
+        cache.render("main_theme.qss", source, DARK, "dark", version=1)
+        source.text = QSS.replace(" color:", " border-color:")
+
+        unchanged = cache.render("main_theme.qss", source, DARK, "dark", version=1)
+        edited = cache.render("main_theme.qss", source, DARK, "dark", version=2)
+
+        assert "border-color" not in unchanged
+        assert "border-color: white" in edited
+        assert source.reads == 2
+        assert len(list(cache_dir.glob("main_theme.dark.*.qss"))) == 1
+
+    def test_source_version_follows_theme_file_edits(self, tmp_path):
+        """Test that only an edit of the theme file reads it again."""
+        cache = StylesheetCache()
+        theme_path = tmp_path / "main_theme.qss"
+        theme_path.write_text(QSS, encoding="utf-8")
+        source = Source()
+
+        for _ in range(2):
+            version = get_source_version(theme_path)
+            cache.render(str(theme_path), source, DARK, "dark", version=version)
+        theme_path.write_text(QSS + "\n", encoding="utf-8")
+        version = get_source_version(theme_path)
+        cache.render(str(theme_path), source, DARK, "dark", version=version)
+
+        assert source.reads == 2
+        assert get_source_version(None) is None
+
+    def test_palette_change_renders_again(self):
+        """Test that the palette is part of the cache key."""
+        cache = StylesheetCache()
+
+        cache.render("main_theme.qss", Source(), DARK, "dark")
+        style = cache.render(
+            "main_theme.qss", Source(), dict(DARK, **{"$_main_surface": "gray"}), "dark"
+        )
+
+        assert "background: gray" in style
+        assert cache.get_stats()["renders"] == 2
+
+    def test_cache_dir_is_not_created_outside_a_project(self, tmp_path):
+        """Test that nothing is written without a bin/themes directory."""
+        cache_dir = tmp_path / "bin" / "themes" / ".cache"
+        cache = StylesheetCache(cache_dir)
+
+        cache.render("main_theme.qss", Source(), DARK, "dark")
+
+        assert not (tmp_path / "bin").exists()
+        assert cache.get_stats()["writes"] == 0
+
+    def test_prerendered_theme_is_used_until_outdated(self, tmp_path):
+        """Test that a rendered file is only used with its inputs unchanged."""
+        source = tmp_path / "main_theme.qss"
+        source.write_text(QSS, encoding="utf-8")
+        write_rendered_themes(source, {"dark": DARK, "light": LIGHT})
+        cache = StylesheetCache()
+
+        dark = cache.load_rendered(source, DARK, "dark")
+        other_palette = dict(DARK, **{"$_main_surface": "gray"})
+
+        assert dark.endswith("QWidget { background: black; color: white; }")
+        assert "background: white" in cache.load_rendered(source, LIGHT, "light")
+        assert cache.load_rendered(source, other_palette, "dark") is None
+        mtime = (tmp_path / "main_theme.dark.qss").stat().st_mtime
+        os.utime(source, (mtime + 10, mtime + 10))
+        assert cache.load_rendered(source, DARK, "dark") is None
+        assert cache.get_stats()["prerendered"] == 2
+
+    def test_make_qss_renders_each_palette(self, tmp_path):
+        """Test that copying the package theme renders dark and light files."""
+        maker = FileMaker(base_path=tmp_path)
+        maker.make_assets_binaries()
+
+        assert maker.make_qss_from_package()
+        themes = tmp_path / "bin" / "themes"
+        dark = (themes / "main_theme.dark.qss").read_text(encoding="utf-8")
+        assert (themes / "main_theme.light.qss").exists()
+        assert "$_" not in dark
+        # Same source and palettes: nothing is written again
+        palettes = maker._get_palettes()
+        assert write_rendered_themes(themes / "main_theme.qss", palettes) == []
+
+    def test_dotted_theme_names_are_sources(self, tmp_path):
+        """Test that only derived files are skipped, whatever the names."""
+        themes = tmp_path / "bin" / "themes"
+        themes.mkdir(parents=True)
+        (themes / "dark.v2.qss").write_text(QSS, encoding="utf-8")
+        (themes / "dark.v2.min.qss").write_text(QSS, encoding="utf-8")
+        maker = FileMaker(base_path=tmp_path)
+
+        with patch.object(
+            maker, "_get_palettes", return_value={"dark": DARK, "min": LIGHT}
+        ):
+            assert maker.render_themes() == 1
+            assert maker._get_theme_sources() == [themes / "dark.v2.qss"]
+
+        assert (themes / "dark.v2.dark.qss").exists()
+        # The "min" palette never replaces the optimized theme
+        assert (themes / "dark.v2.min.qss").read_text(encoding="utf-8") == QSS
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the theme hot reload of ThemeManager.
+"""
+
+import gc
+import weakref
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtWidgets import QWidget
+
+from ezqt_app.kernel.app_functions.config_manager import get_config_manager
+from ezqt_app.kernel.app_settings import Settings
+from ezqt_app.kernel.ui_functions.theme_manager import ThemeManager
+
+
+class Window(QWidget):
+    """Window exposing the manual theme switch path."""
+
+    def __init__(self):
+        super().__init__()
+        self.updateUI = MagicMock()
+
+
+@pytest.fixture
+def watcher(qt_application):
+    """Return the config watcher, restoring the theme afterwards."""
+    watcher = get_config_manager().get_watcher()
+    if watcher is None:
+        pytest.skip("Config hot reload unavailable")
+    theme = Settings.Gui.THEME
+    yield watcher
+    Settings.Gui.THEME = theme
+    # Destroyed windows unsubscribe their callbacks
+    gc.collect()
+
+
+class TestWatchTheme:
+    """Tests for ThemeManager.watchTheme."""
+
+    def test_palette_reload_restyles_once(self, watcher, qt_application):
+        """Test that the keys of one reload are coalesced."""
+        window = Window()
+        Settings.Gui.THEME = "dark"
+
+        with patch.object(ThemeManager, "theme") as theme:
+            ThemeManager.watchTheme(window)
+            for name in ("main_surface", "main_border", "accent_color"):
+                watcher.keyChanged.emit(
+                    "palette", f"theme_palette.dark.{name}", "#123456"
+                )
+            watcher.keyChanged.emit("palette", "theme_palette.light.accent", "#fff")
+            qt_application.processEvents()
+
+        theme.assert_called_once_with(window, None)
+
+    def test_theme_change_uses_manual_switch(self, watcher):
+        """Test that a theme edited on disk updates icons and toggle too."""
+        window = Window()
+        Settings.Gui.THEME = "dark"
+        ThemeManager.watchTheme(window)
+
+        watcher.keyChanged.emit("app", "settings_panel.theme.default", "Light")
+
+        assert Settings.Gui.THEME == "light"
+        window.updateUI.assert_called_once_with()
+
+    def test_subscriptions_do_not_keep_the_window(self, watcher):
+        """Test that the watcher releases deleted windows."""
+        gc.collect()
+        counts = {
+            name: len(watcher._subscribers.get(name, [])) for name in ("app", "palette")
+        }
+
+        window = Window()
+        ThemeManager.watchTheme(window)
+        released = weakref.ref(window)
+        del window
+        gc.collect()
+
+        assert released() is None
+        assert {
+            name: len(watcher._subscribers.get(name, [])) for name in counts
+        } == counts
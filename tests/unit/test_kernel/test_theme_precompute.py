@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the idle-time theme preparation.
+"""
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from ezqt_app.kernel.app_settings import Settings
+from ezqt_app.kernel.ui_functions.theme_precompute import ThemePrecomputer
+from ezqt_app.widgets.extended.theme_icon import ThemeIcon
+
+
+def _run_idle(precomputer):
+    while precomputer.get_status()["state"] == "preparing":
+        QApplication.processEvents()
+
+
+def _task(calls, name):
+    def task():
+        calls.append(name)
+        return {name: name.upper()}
+
+    return task
+
+
+class TestThemePrecomputer:
+    """Tests for the preparation of a theme in idle slices."""
+
+    def test_tasks_run_in_idle_slices(self, qt_application):
+        """Test that tasks wait for the event loop and yield between slices."""
+        calls = []
+        precomputer = ThemePrecomputer(slice_ms=0)
+
+        assert precomputer.prepare("light", 1, [_task(calls, "a"), _task(calls, "b")])
+        status = precomputer.get_status()
+        assert (status["state"], status["theme"], status["pending"]) == (
+            "preparing",
+            "light",
+            2,
+        )
+        assert calls == []
+
+        _run_idle(precomputer)
+        status = precomputer.get_status()
+        assert calls == ["a", "b"]
+        assert status["slices"] == 2
+        assert (status["state"], status["ready"]) == ("ready", ["light"])
+
+    def test_switch_takes_prepared_objects(self, qt_application):
+        """Test that a switch gets the objects and the saved time."""
+        precomputer = ThemePrecomputer()
+        precomputer.prepare("light", 1, [_task([], "stylesheet")])
+        _run_idle(precomputer)
+
+        prepared = precomputer.take("light", 1)
+
+        assert prepared["stylesheet"] == "STYLESHEET"
+        status = precomputer.get_status()
+        assert status["hits"] == 1
+        assert status["saved_ms"] == prepared["cost_ms"] > 0
+        assert precomputer.take("light", 1) is None
+
+    def test_outdated_preparation_is_ignored(self, qt_application):
+        """Test that objects prepared for other inputs are not used."""
+        precomputer = ThemePrecomputer()
+        precomputer.prepare("light", "old palette", [_task([], "stylesheet")])
+        _run_idle(precomputer)
+
+        assert precomputer.take("light", "new palette") is None
+        assert precomputer.get_status()["misses"] == 1
+
+    def test_early_switch_runs_remaining_tasks(self, qt_application):
+        """Test a switch before the end of the preparation."""
+        calls = []
+        precomputer = ThemePrecomputer()
+        precomputer.prepare(
+            "light", 1, [_task(calls, "a"), lambda: 1 / 0, _task(calls, "b")]
+        )
+
+        prepared = precomputer.take("light", 1)
+
+        assert calls == ["a", "b"]
+        assert prepared["b"] == "B"
+        # Nothing ran while idle: nothing saved
+        status = precomputer.get_status()
+        assert (status["flushed"], status["saved_ms"]) == (1, 0.0)
+        assert status["state"] == "idle"
+
+    def test_theme_icon_uses_prepared_variant(self, qt_application):
+        """Test that a switch reuses the recolored pixmap."""
+        pixmap = QPixmap(8, 8)
+        pixmap.fill(Qt.red)
+        previous = Settings.Gui.THEME
+        Settings.Gui.THEME = "dark"
+        try:
+            icon = ThemeIcon(QIcon(pixmap))
+            assert icon in ThemeIcon.get_instances()
+
+            icon.prepare("light")
+            (prepared,) = icon.engine._prepared["light"].values()
+            assert prepared.toImage().pixelColor(0, 0) == QColor(Qt.black)
+
+            Settings.Gui.THEME = "light"
+            icon.updateIcon()
+            assert icon.engine._prepared == {}
+            assert icon.pixmap(QSize(8, 8)).cacheKey() == prepared.cacheKey()
+        finally:
+            Settings.Gui.THEME = previous
@@ -5,11 +5,15 @@
 Unit tests for the SettingsPanel class.
 """
 
+import gc
+import weakref
+
 import pytest
 from unittest.mock import patch, MagicMock
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QWidget, QScrollArea, QLabel, QFrame
 
+from ezqt_app.kernel.app_functions.config_manager import get_config_manager
 from ezqt_app.widgets.core.settings_panel import SettingsPanel
 
 
@@ -297,3 +301,20 @@ class TestSettingsPanel:
 
         # Check that size policy is configured
         assert panel.sizePolicy().horizontalPolicy() == Qt.PreferredSize
+
+    def test_config_subscription_is_released_with_panel(self, qt_application):
+        """Test that the config watcher does not keep deleted panels."""
+        watcher = get_config_manager().get_watcher()
+        if watcher is None:
+            pytest.skip("Config hot reload unavailable")
+        gc.collect()
+        count = len(watcher._subscribers.get("app", []))
+
+        panel = SettingsPanel()
+        assert len(watcher._subscribers["app"]) == count + 1
+        released = weakref.ref(panel)
+        del panel
+        gc.collect()
+
+        assert released() is None
+        assert len(watcher._subscribers["app"]) == count
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the theme icon and its icon engine.
+"""
+
+import gc
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QPixmap
+from PySide6.QtWidgets import QPushButton
+
+from ezqt_app.kernel.app_settings import Settings
+from ezqt_app.widgets.extended.theme_icon import ThemeIcon
+
+
+@pytest.fixture
+def theme():
+    """Restore the theme after the test."""
+    previous = Settings.Gui.THEME
+    yield
+    Settings.Gui.THEME = previous
+
+
+def _source(size=16):
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.red)
+    return QIcon(pixmap)
+
+
+def _color(icon, size=QSize(8, 8), *args):
+    return icon.pixmap(size, *args).toImage().pixelColor(1, 1)
+
+
+def _rss_kb():
+    # Resident memory on Linux, None elsewhere
+    statm = Path("/proc/self/statm")
+    if not statm.exists():
+        return None
+    return int(statm.read_text().split()[1]) * 4
+
+
+class TestThemeIcon:
+    """Tests for icons recolored for the current theme."""
+
+    def test_icon_is_rendered_at_requested_size_and_ratio(self, qt_application, theme):
+        """Test the recolored pixmap of each theme."""
+        Settings.Gui.THEME = "dark"
+        icon = ThemeIcon(_source())
+
+        assert _color(icon) == QColor(Qt.white)
+        pixmap = icon.pixmap(QSize(8, 8), 2.0)
+        assert (pixmap.size(), pixmap.devicePixelRatio()) == (QSize(16, 16), 2.0)
+        assert pixmap.toImage().pixelColor(15, 15) == QColor(Qt.white)
+
+        Settings.Gui.THEME = "light"
+        assert _color(icon) == QColor(Qt.black)
+
+    def test_widget_copies_follow_the_theme(self, qt_application, theme):
+        """Test that an icon set on a button needs no new setIcon."""
+        Settings.Gui.THEME = "dark"
+        button = QPushButton()
+        button.setIcon(ThemeIcon(_source()))
+        gc.collect()
+        assert _color(button.icon()) == QColor(Qt.white)
+
+        Settings.Gui.THEME = "light"
+        assert _color(button.icon()) == QColor(Qt.black)
+        assert _color(button.icon(), QSize(8, 8), QIcon.Disabled) != QColor(Qt.black)
+
+    def test_modified_copy_keeps_a_themed_engine(self, qt_application, theme):
+        """Test that Qt can clone the engine of a copy."""
+        Settings.Gui.THEME = "light"
+        copy = QIcon(ThemeIcon(_source()))
+        copy.addPixmap(QPixmap(4, 4))
+        gc.collect()
+
+        assert _color(copy) == QColor(Qt.black)
+
+    def test_only_the_current_theme_is_kept(self, qt_application, theme):
+        """Test that a switch drops the pixmaps of the previous theme."""
+        Settings.Gui.THEME = "dark"
+        icon = ThemeIcon(_source())
+        for size in (8, 16):
+            icon.pixmap(QSize(size, size))
+        assert icon.engine.get_pixmap_count() == 2
+
+        icon.prepare("light")
+        assert icon.engine.get_pixmap_count() == 4
+        Settings.Gui.THEME = "light"
+        icon.updateIcon()
+        assert icon.engine.get_pixmap_count() == 2
+
+    def test_theme_toggles_keep_memory_flat(self, qt_application, theme):
+        """Soak test: 1000 theme toggles on a large icon."""
+        icon = ThemeIcon(_source(256))
+        button = QPushButton()
+        button.setIcon(icon)
+
+        def toggle(count):
+            for i in range(count):
+                Settings.Gui.THEME = "light" if i % 2 else "dark"
+                icon.updateIcon()
+                button.icon().pixmap(QSize(256, 256))
+
+        toggle(50)
+        before = _rss_kb()
+        toggle(1000)
+
+        # One 256 KB pixmap kept, 250 MB if every toggle kept its own
+        assert icon.engine.get_pixmap_count() == 1
+        if before is not None:
+            assert _rss_kb() - before < 16 * 1024